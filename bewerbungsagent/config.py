@@ -9,17 +9,91 @@ Lädt Standardwerte und überschreibt sie mit .env-Variablen.
 
 
 import os
+from functools import cache
 
 from dotenv import load_dotenv
 
 
 
-# Lade Umgebungsvariablen aus .env Datei
-
-load_dotenv()
+@cache
+def _ensure_dotenv() -> bool:
+    # .env genau einmal pro Prozess parsen (weitere Aufrufe sind No-ops).
+    return load_dotenv()
 
 
+# Lade Umgebungsvariablen aus .env Datei
 
+_ensure_dotenv()
+
+
+# Profil-Defaults fuer die Suche: einmal als Tuple gebaut, Config kopiert sie als Liste
+# (ENV-Overrides liefern Listen; Aufrufer verketten die Werte mit +).
+_SEARCH_LOCATIONS = (
+    "Buelach",
+    "Kloten",
+    "Zuerich",
+)
+_SEARCH_KEYWORDS = (
+    "IT Support",
+    "1st Level Support",
+    "Service Desk",
+    "Workplace Support",
+    "Onsite Support",
+    "Field Service",
+    "Rollout Techniker",
+    "Junior System Administrator",
+    "IT Operator",
+    "ICT Supporter",
+    "Benutzersupport",
+    "Systemtechniker",
+    "Helpdesk",
+    "SAP Support",
+    "Logistik IT Support",
+)
+_TITLE_VARIANTS_DE = (
+    "ICT Supporter",
+    "1st Level Support",
+    "IT Supporter",
+    "Benutzersupport",
+    "Servicedesk",
+    "Workplace Engineer",
+    "Systemtechniker",
+    "Onsite Support",
+    "Rollout Techniker",
+    "Junior Systemadministrator",
+    "IT Operator",
+    "SAP Support",
+)
+_TITLE_VARIANTS_EN = (
+    "IT Support",
+    "Service Desk",
+    "Helpdesk",
+    "Workplace Support",
+    "Desktop Support",
+    "Field Service",
+    "Rollout Technician",
+    "Junior System Administrator",
+    "IT Operator",
+)
+_NEGATIVE_KEYWORDS = (
+    "Senior",
+    "Lead",
+    "Manager",
+    "Bachelor",
+    "Master",
+    "Engineer (Senior)",
+)
+# Logistik-Rollen (für zusätzliche Suche)
+_SEARCH_KEYWORDS_LOGISTICS = (
+    "Lagerlogistik",
+    "Kommissionierer",
+    "Lagermitarbeiter",
+    "Wareneingang",
+    "Warenausgang",
+    "Versand",
+    "Staplerfahrer",
+    "Logistiker EFZ",
+)
 
 
 class Config:
@@ -45,6 +119,7 @@ class Config:
         self.SMTP_SERVER = ""
 
         self.SMTP_PORT = 587
+        self.SMTP_POOL_SIZE = 2
 
 
 
@@ -97,22 +172,6 @@ class Config:
 
         self.MAX_JOBS_PER_SEARCH = 50
 
-        # Fokusregion aktualisiert: Buelach und Umgebung
-
-        self.SEARCH_LOCATIONS = ["Buelach", "Kloten", "Zuerich"]
-
-        self.SEARCH_KEYWORDS = [
-
-            "IT Support",
-
-            "System Administrator",
-
-            "Junior IT",
-
-            "IT Techniker",
-
-        ]
-
 
 
         # Datei-Pfade
@@ -123,133 +182,19 @@ class Config:
 
 
 
-        # Überschreibe/erweitere Suche mit präziseren Vorgaben für das Profil
-
-        # Region (korrigierte Umlaute) und Keywords inkl. Varianten/Filter
-
-        self.SEARCH_LOCATIONS = ["Buelach", "Kloten", "Zuerich"]
-
-        self.SEARCH_KEYWORDS = [
-
-            "IT Support",
-
-            "1st Level Support",
-
-            "Service Desk",
-
-            "Workplace Support",
-
-            "Onsite Support",
-
-            "Field Service",
-
-            "Rollout Techniker",
-
-            "Junior System Administrator",
-
-            "IT Operator",
-
-            "ICT Supporter",
-
-            "Benutzersupport",
-
-            "Systemtechniker",
-
-            "Helpdesk",
-
-            "SAP Support",
-
-            "Logistik IT Support",
-
-        ]
-
-        self.TITLE_VARIANTS_DE = [
-
-            "ICT Supporter",
-
-            "1st Level Support",
-
-            "IT Supporter",
-
-            "Benutzersupport",
-
-            "Servicedesk",
-
-            "Workplace Engineer",
+        # Profil-Vorgaben (Fokusregion Buelach und Umgebung) und Keywords inkl. Varianten/Filter
 
-            "Systemtechniker",
+        self.SEARCH_LOCATIONS = list(_SEARCH_LOCATIONS)
 
-            "Onsite Support",
+        self.SEARCH_KEYWORDS = list(_SEARCH_KEYWORDS)
 
-            "Rollout Techniker",
+        self.TITLE_VARIANTS_DE = list(_TITLE_VARIANTS_DE)
 
-            "Junior Systemadministrator",
+        self.TITLE_VARIANTS_EN = list(_TITLE_VARIANTS_EN)
 
-            "IT Operator",
+        self.NEGATIVE_KEYWORDS = list(_NEGATIVE_KEYWORDS)
 
-            "SAP Support",
-
-        ]
-
-        self.TITLE_VARIANTS_EN = [
-
-            "IT Support",
-
-            "Service Desk",
-
-            "Helpdesk",
-
-            "Workplace Support",
-
-            "Desktop Support",
-
-            "Field Service",
-
-            "Rollout Technician",
-
-            "Junior System Administrator",
-
-            "IT Operator",
-
-        ]
-
-        self.NEGATIVE_KEYWORDS = [
-
-            "Senior",
-
-            "Lead",
-
-            "Manager",
-
-            "Bachelor",
-
-            "Master",
-
-            "Engineer (Senior)",
-
-        ]
-
-        # Logistik-Rollen (für zusätzliche Suche)
-
-        self.SEARCH_KEYWORDS_LOGISTICS = [
-
-            "Lagerlogistik",
-
-            "Kommissionierer",
-
-            "Lagermitarbeiter",
-
-            "Wareneingang",
-
-            "Warenausgang",
-
-            "Versand",
-
-            "Staplerfahrer",
-
-            "Logistiker EFZ",
-
-        ]
+        self.SEARCH_KEYWORDS_LOGISTICS = list(_SEARCH_KEYWORDS_LOGISTICS)
 
         self.LOCATION_RADIUS_KM = 25
 
@@ -264,42 +209,45 @@ class Config:
 
         """Lädt Konfiguration aus Umgebungsvariablen und setzt sinnvolle Defaults."""
 
+        # Einmaliger ENV-Snapshot; alle Lookups unten lesen aus diesem Dict.
+        env = os.environ.copy()
+
         # Credentials / Keys
 
-        self.GROQ_API_KEY = os.getenv("GROQ_API_KEY", self.GROQ_API_KEY)
+        self.GROQ_API_KEY = env.get("GROQ_API_KEY", self.GROQ_API_KEY)
 
-        self.SENDER_EMAIL = os.getenv("SENDER_EMAIL", self.SENDER_EMAIL)
+        self.SENDER_EMAIL = env.get("SENDER_EMAIL", self.SENDER_EMAIL)
 
-        self.SENDER_PASSWORD = os.getenv("SENDER_PASSWORD", self.SENDER_PASSWORD)
+        self.SENDER_PASSWORD = env.get("SENDER_PASSWORD", self.SENDER_PASSWORD)
 
 
 
         # Profilfelder
 
-        self.PROFILE_NAME = os.getenv("PROFILE_NAME", self.PROFILE_NAME)
+        self.PROFILE_NAME = env.get("PROFILE_NAME", self.PROFILE_NAME)
 
-        self.PROFILE_EMAIL = os.getenv("PROFILE_EMAIL", self.PROFILE_EMAIL)
+        self.PROFILE_EMAIL = env.get("PROFILE_EMAIL", self.PROFILE_EMAIL)
 
-        self.PROFILE_LINKEDIN = os.getenv("PROFILE_LINKEDIN", self.PROFILE_LINKEDIN)
+        self.PROFILE_LINKEDIN = env.get("PROFILE_LINKEDIN", self.PROFILE_LINKEDIN)
 
         # optional, falls vorhanden
 
-        self.PROFILE_PHONE = os.getenv("PROFILE_PHONE", getattr(self, "PROFILE_PHONE", ""))
+        self.PROFILE_PHONE = env.get("PROFILE_PHONE", getattr(self, "PROFILE_PHONE", ""))
 
 
 
         # Logging aus ENV
 
-        self.LOG_LEVEL = os.getenv("LOG_LEVEL", self.LOG_LEVEL)
-        self.LOG_FILE = os.getenv("LOG_FILE", self.LOG_FILE)
+        self.LOG_LEVEL = env.get("LOG_LEVEL", self.LOG_LEVEL)
+        self.LOG_FILE = env.get("LOG_FILE", self.LOG_FILE)
 
 
 
         # SMTP
 
-        env_smtp_server = os.getenv("SMTP_SERVER")
+        env_smtp_server = env.get("SMTP_SERVER")
 
-        env_smtp_port = os.getenv("SMTP_PORT")
+        env_smtp_port = env.get("SMTP_PORT")
 
         if env_smtp_server:
 
@@ -319,7 +267,7 @@ class Config:
 
         # Empfänger
 
-        recipients_env = os.getenv("RECIPIENT_EMAILS")
+        recipients_env = env.get("RECIPIENT_EMAILS")
 
         if recipients_env:
 
@@ -357,31 +305,31 @@ class Config:
 
         # Optionale Suche-Overrides aus .env
 
-        locs = os.getenv("SEARCH_LOCATIONS")
+        locs = env.get("SEARCH_LOCATIONS")
 
         if locs:
 
             self.SEARCH_LOCATIONS = [s.strip() for s in locs.split(",") if s.strip()]
 
-        keys = os.getenv("SEARCH_KEYWORDS")
+        keys = env.get("SEARCH_KEYWORDS")
 
         if keys:
 
             self.SEARCH_KEYWORDS = [s.strip() for s in keys.split(",") if s.strip()]
 
-        keys_log = os.getenv("SEARCH_KEYWORDS_LOGISTICS")
+        keys_log = env.get("SEARCH_KEYWORDS_LOGISTICS")
 
         if keys_log:
 
             self.SEARCH_KEYWORDS_LOGISTICS = [s.strip() for s in keys_log.split(",") if s.strip()]
 
-        neg = os.getenv("NEGATIVE_KEYWORDS")
+        neg = env.get("NEGATIVE_KEYWORDS")
 
         if neg:
 
             self.NEGATIVE_KEYWORDS = [s.strip() for s in neg.split(",") if s.strip()]
 
-        radius = os.getenv("LOCATION_RADIUS_KM")
+        radius = env.get("LOCATION_RADIUS_KM")
 
         if radius:
 
@@ -400,7 +348,7 @@ class Config:
         # Hilfsfunktion: Bool-ENV robust lesen.
         def _env_bool(key, default):
 
-            val = os.getenv(key)
+            val = env.get(key)
 
             if val is None:
 
@@ -431,13 +379,21 @@ class Config:
         )
 
         # Maximalzahl Jobs fuer Mails begrenzen.
-        env_max_jobs = os.getenv("EMAIL_MAX_JOBS")
+        env_max_jobs = env.get("EMAIL_MAX_JOBS")
         if env_max_jobs:
             try:
                 self.EMAIL_MAX_JOBS = int(env_max_jobs)
             except ValueError:
                 pass
 
+        # Anzahl paralleler SMTP-Verbindungen.
+        env_pool_size = env.get("SMTP_POOL_SIZE")
+        if env_pool_size:
+            try:
+                self.SMTP_POOL_SIZE = max(1, int(env_pool_size))
+            except ValueError:
+                pass
+
 
     def validate_config(self):
         # Minimalanforderungen pruefen.
@@ -1,24 +1,43 @@
 ﻿# -*- coding: utf-8 -*-
+import atexit
+import dataclasses
+import queue
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+import time
+import weakref
+from email.message import EmailMessage
 import os
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from .config import config
 from .logger import job_logger
 from .job_text_utils import extract_from_multiline_title
 
 
+# Feldnamen je Dataclass-Typ, einmalig via dataclasses.fields ermittelt.
+_DATACLASS_FIELDS: Dict[type, tuple] = {}
+
+
 def _job_to_dict(job: Any) -> Dict[str, Any]:
     # Job-Objekt robust in Dict normalisieren.
     """Normalize JobRow/Job dataclass oder dict -> dict mit Standardkeys."""
     if isinstance(job, dict):
         return dict(job)
 
+    # Dataclasses (JobRow, ExtraJobRow, ...) direkt ueber ihre bekannten Felder lesen.
+    cls = type(job)
+    names = _DATACLASS_FIELDS.get(cls)
+    if names is None and dataclasses.is_dataclass(cls):
+        names = _DATACLASS_FIELDS[cls] = tuple(f.name for f in dataclasses.fields(cls))
+    if names is not None:
+        return {k: getattr(job, k) for k in names}
+
+    # Sonstige Slots-Objekte ohne __dict__.
+    slots = getattr(type(job), "__slots__", None)
+    if slots and not hasattr(job, "__dict__"):
+        return {k: getattr(job, k, None) for k in slots}
+
     out: Dict[str, Any] = {}
     for k in [
         "title",
@@ -56,25 +75,19 @@ def _job_to_dict(job: Any) -> Dict[str, Any]:
     return out
 
 
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
 def _escape(val: Any) -> str:
-    # HTML-escaping fuer Texte.
-    s = str(val or "")
-    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    # HTML-escaping fuer Texte (ein Durchlauf via translate).
+    return str(val or "").translate(_ESCAPE_TABLE)
 
 
 def _normalize_job(job: Any) -> Dict[str, Any]:
     # Felder fuer Mail-Ausgabe vereinheitlichen.
-    data = _job_to_dict(job)
-
-    raw_title = (
-        data.get("raw_title")
-        or data.get("title_raw")
-        or data.get("full_title")
-        or data.get("title")
-        or data.get("job_title")
-        or data.get("position")
-        or ""
-    ).strip()
+    # Dicts werden nur gelesen, daher keine Kopie noetig.
+    data = job if isinstance(job, dict) else _job_to_dict(job)
+
     job_title = (data.get("job_title") or data.get("position") or "").strip()
     company = (data.get("company") or data.get("employer") or "").strip()
     location = (data.get("location") or data.get("city") or "").strip()
@@ -86,27 +99,39 @@ def _normalize_job(job: Any) -> Dict[str, Any]:
     date = (data.get("date") or data.get("date_found") or "").strip()
     job_uid = (data.get("job_uid") or data.get("uid") or "").strip()
 
-    needs_parse = (
-        ("\n" in raw_title)
-        or ("arbeitsort" in raw_title.lower())
-        or (not company)
-        or (not location)
-    )
-    if needs_parse and raw_title:
-        t2, c2, l2 = extract_from_multiline_title(raw_title)
-        if not job_title and t2:
-            job_title = t2
-        if not company and c2:
-            company = c2
-        if not location and l2:
-            location = l2
-
-    if not job_title:
-        job_title = raw_title or "Titel unbekannt"
-    if not company:
-        company = "Firma unbekannt"
-    if not location:
-        location = "Ort unbekannt"
+    # Titel/Firma/Ort vollstaendig (z.B. Erinnerungen aus dem State): nichts zu parsen.
+    if not (job_title and company and location):
+        raw_title = (
+            data.get("raw_title")
+            or data.get("title_raw")
+            or data.get("full_title")
+            or data.get("title")
+            or data.get("job_title")
+            or data.get("position")
+            or ""
+        ).strip()
+
+        needs_parse = (
+            ("\n" in raw_title)
+            or ("arbeitsort" in raw_title.lower())
+            or (not company)
+            or (not location)
+        )
+        if needs_parse and raw_title:
+            t2, c2, l2 = extract_from_multiline_title(raw_title)
+            if not job_title and t2:
+                job_title = t2
+            if not company and c2:
+                company = c2
+            if not location and l2:
+                location = l2
+
+        if not job_title:
+            job_title = raw_title or "Titel unbekannt"
+        if not company:
+            company = "Firma unbekannt"
+        if not location:
+            location = "Ort unbekannt"
 
     return {
         "job_title": job_title,
@@ -121,6 +146,162 @@ def _normalize_job(job: Any) -> Dict[str, Any]:
     }
 
 
+# HTML-Vorlagen fuer Mail-Bodies (einmal beim Import aufgebaut, nur noch .format()).
+_ALERT_ITEM_HTML = """
+                    <li>
+                        <strong>{job_title}</strong> bei {company}<br>
+                        <em>{location}</em><br>
+                        {meta_html}
+                        <a href="{link_target}">{link_label}</a>
+                    </li>
+                """
+
+_ALERT_BODY_HTML = """
+        <html>
+        <body>
+            <h2>Job-Alert</h2>
+            <p>Neu: {new_count} | Offen: {reminder_count}</p>
+            <h3>NEW</h3>
+            <ul>
+                {new_html}
+            </ul>
+            <h3>OPEN REMINDERS</h3>
+            <ul>
+                {reminder_html}
+            </ul>
+            {truncated_note}
+            <p><em>Diese E-Mail wurde automatisch vom Job-Finder generiert.</em></p>
+        </body>
+        </html>
+        """
+
+_WEEKLY_SUMMARY_HTML = """
+        <html>
+        <body>
+            <h2>W\u00f6chentliche Job-Suche Zusammenfassung</h2>
+            <p>Hier ist Ihre w\u00f6chentliche \u00dcbersicht der Job-Suche Aktivit\u00e4ten:</p>
+            <ul>
+                <li><strong>Gesuchte Jobs:</strong> {total_searched}</li>
+                <li><strong>Neue Jobs gefunden:</strong> {new_jobs}</li>
+                <li><strong>Bewerbungen gesendet:</strong> {applications_sent}</li>
+                <li><strong>Fehler aufgetreten:</strong> {errors}</li>
+                <li><strong>Letzte Suche:</strong> {last_search}</li>
+            </ul>
+            <p><em>Diese E-Mail wurde automatisch vom Job-Finder generiert.</em></p>
+        </body>
+        </html>
+        """
+
+_ERROR_BODY_HTML = """
+        <html>
+        <body>
+            <h2 style=\"color: red;\">Kritischer Fehler im Job-Finder</h2>
+            <p><strong>Fehlertyp:</strong> {error_type}</p>
+            <p><strong>Nachricht:</strong> {error_message}</p>
+        {traceback_html}
+            <p>Bitte \u00fcberpr\u00fcfen Sie die Logs f\u00fcr weitere Details.</p>
+            <p><em>Diese E-Mail wurde automatisch vom Job-Finder generiert.</em></p>
+        </body>
+        </html>
+        """
+
+_ERROR_TRACEBACK_HTML = """
+            <p><strong>Traceback:</strong></p>
+            <pre style=\"background-color: #f5f5f5; padding: 10px; border: 1px solid #ccc;\">{traceback}</pre>
+            """
+
+
+# Transiente SMTP-Antworten (4xx), bei denen neu verbunden und wiederholt wird;
+# 5xx (z.B. 554 abgelehnt) ist endgueltig und wird nicht wiederholt.
+_SMTP_RETRY_CODES = {421, 450, 451, 452}
+_SMTP_MAX_ATTEMPTS = 3
+
+# Offene Pools fuer den einen atexit-Hook; schwach referenziert, damit Pool und
+# EmailAutomation-Instanz freigegeben werden, sobald sie nicht mehr genutzt werden.
+_OPEN_POOLS: "weakref.WeakSet[SMTPPool]" = weakref.WeakSet()
+
+
+def _close_quietly(server: smtplib.SMTP) -> None:
+    # Verbindung beenden, Fehler dabei ignorieren.
+    try:
+        server.quit()
+    except Exception:
+        try:
+            server.close()
+        except Exception:
+            pass
+
+
+class SMTPPool:
+    # Thread-sicherer Pool langlebiger SMTP-Verbindungen.
+    """Haelt bis zu `size` eingeloggte SMTP-Sessions und verteilt sie an Sender."""
+
+    def __init__(self, connect: Callable[[], smtplib.SMTP], size: int = 1):
+        self._connect = connect
+        self.size = max(1, int(size or 1))
+        # Leere Slots werden erst bei Bedarf verbunden; LIFO bevorzugt warme Sessions.
+        self._slots: "queue.LifoQueue[Optional[smtplib.SMTP]]" = queue.LifoQueue()
+        for _ in range(self.size):
+            self._slots.put(None)
+
+    def _checkout(self) -> Optional[smtplib.SMTP]:
+        # Slot holen; tote Verbindungen per NOOP erkennen und verwerfen.
+        conn = self._slots.get()
+        if conn is None:
+            return None
+        try:
+            if conn.noop()[0] == 250:
+                return conn
+        except (smtplib.SMTPException, OSError):
+            pass
+        _close_quietly(conn)
+        return None
+
+    def send_message(self, msg: EmailMessage, from_addr: str, to_addrs: List[str]) -> None:
+        # Mail ueber eine Pool-Verbindung senden (Retry mit Backoff).
+        conn = self._checkout()
+        try:
+            for attempt in range(_SMTP_MAX_ATTEMPTS):
+                try:
+                    if conn is None:
+                        conn = self._connect()
+                    conn.send_message(msg, from_addr, to_addrs)
+                    return
+                except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException) as exc:
+                    code = getattr(exc, "smtp_code", None)
+                    retryable = isinstance(exc, smtplib.SMTPServerDisconnected) or (
+                        code in _SMTP_RETRY_CODES
+                    )
+                    if conn is not None:
+                        _close_quietly(conn)
+                        conn = None
+                    if not retryable or attempt + 1 >= _SMTP_MAX_ATTEMPTS:
+                        raise
+                    time.sleep(2**attempt)
+        finally:
+            self._slots.put(conn)
+
+    def close(self) -> None:
+        # Alle offenen Verbindungen schliessen (z.B. bei Prozessende).
+        drained: List[Optional[smtplib.SMTP]] = []
+        while True:
+            try:
+                drained.append(self._slots.get_nowait())
+            except queue.Empty:
+                break
+        for conn in drained:
+            if conn is not None:
+                _close_quietly(conn)
+            self._slots.put(None)
+
+
+@atexit.register
+def _close_open_pools() -> None:
+    # Beim Prozessende alle noch lebenden Pools schliessen.
+    for pool in list(_OPEN_POOLS):
+        pool.close()
+
+
 class EmailAutomation:
     def __init__(self):
         # SMTP- und Empfaenger-Config laden.
@@ -129,6 +310,10 @@ class EmailAutomation:
         self.sender_email = config.SENDER_EMAIL
         self.sender_password = config.SENDER_PASSWORD
         self.recipient_emails = config.RECIPIENT_EMAILS
+        # Pool langlebiger SMTP-Verbindungen (lazy), geteilt ueber alle Mails.
+        pool_size = int(getattr(config, "SMTP_POOL_SIZE", 1) or 1)
+        self._pool = SMTPPool(self._connect_smtp, size=pool_size)
+        _OPEN_POOLS.add(self._pool)
 
     def send_job_alert(self, new_jobs, reminder_jobs=None):
         # Job-Alert-Mail (neu + Reminder) senden.
@@ -143,10 +328,13 @@ class EmailAutomation:
             "Job-Alert: "
             f"{len(new_jobs)} neu, {len(reminder_jobs)} offen"
         )
-        body = self._create_job_alert_body(new_jobs, reminder_jobs)
+        # Einmal normalisieren, dann fuer Mail und WhatsApp wiederverwenden.
+        new_norm = [_normalize_job(j) for j in new_jobs]
+        reminder_norm = [_normalize_job(j) for j in reminder_jobs]
+        body = self._render_job_alert_body(new_norm, reminder_norm)
 
         sent = self._send_email(subject, body)
-        self._send_whatsapp_summary(new_jobs, reminder_jobs)
+        self._send_whatsapp_summary(new_norm, reminder_norm)
         return sent
 
     def send_weekly_summary(self, stats):
@@ -177,12 +365,15 @@ class EmailAutomation:
         # HTML-Body fuer Job-Alert bauen.
         new_norm = [_normalize_job(j) for j in new_jobs]
         reminder_norm = [_normalize_job(j) for j in reminder_jobs]
+        return self._render_job_alert_body(new_norm, reminder_norm)
 
+    def _render_job_alert_body(self, new_norm, reminder_norm):
+        # HTML-Body aus bereits normalisierten Jobs rendern.
         max_jobs = int(getattr(config, "EMAIL_MAX_JOBS", 200) or 200)
 
         # Render-Helfer fuer HTML-Liste.
         def _render_items(items):
-            items_html = ""
+            parts: List[str] = []
             for job in items:
                 meta_parts: List[str] = []
                 if job["job_uid"]:
@@ -205,15 +396,17 @@ class EmailAutomation:
                 link_target = _escape(job["link"]) if job["link"] else "#"
                 link_label = "Bewerben" if job["link"] else "Kein Link vorhanden"
 
-                items_html += f"""
-                    <li>
-                        <strong>{_escape(job["job_title"])}</strong> bei {_escape(job["company"])}<br>
-                        <em>{_escape(job["location"])}</em><br>
-                        {meta_html}
-                        <a href="{link_target}">{link_label}</a>
-                    </li>
-                """
-            return items_html
+                parts.append(
+                    _ALERT_ITEM_HTML.format(
+                        job_title=_escape(job["job_title"]),
+                        company=_escape(job["company"]),
+                        location=_escape(job["location"]),
+                        meta_html=meta_html,
+                        link_target=link_target,
+                        link_label=link_label,
+                    )
+                )
+            return "".join(parts)
 
         total = len(new_norm) + len(reminder_norm)
         shown_new = new_norm
@@ -238,70 +431,36 @@ class EmailAutomation:
             else ""
         )
 
-        body = f"""
-        <html>
-        <body>
-            <h2>Job-Alert</h2>
-            <p>Neu: {len(new_norm)} | Offen: {len(reminder_norm)}</p>
-            <h3>NEW</h3>
-            <ul>
-                {new_html or "<li>Keine neuen Jobs.</li>"}
-            </ul>
-            <h3>OPEN REMINDERS</h3>
-            <ul>
-                {reminder_html or "<li>Keine offenen Erinnerungen.</li>"}
-            </ul>
-            {truncated_note}
-            <p><em>Diese E-Mail wurde automatisch vom Job-Finder generiert.</em></p>
-        </body>
-        </html>
-        """
+        body = _ALERT_BODY_HTML.format(
+            new_count=len(new_norm),
+            reminder_count=len(reminder_norm),
+            new_html=new_html or "<li>Keine neuen Jobs.</li>",
+            reminder_html=reminder_html or "<li>Keine offenen Erinnerungen.</li>",
+            truncated_note=truncated_note,
+        )
 
         return body
 
     def _create_weekly_summary_body(self, stats):
         # HTML-Body fuer Wochenzusammenfassung.
-        body = f"""
-        <html>
-        <body>
-            <h2>W\u00f6chentliche Job-Suche Zusammenfassung</h2>
-            <p>Hier ist Ihre w\u00f6chentliche \u00dcbersicht der Job-Suche Aktivit\u00e4ten:</p>
-            <ul>
-                <li><strong>Gesuchte Jobs:</strong> {stats.get('total_searched', 0)}</li>
-                <li><strong>Neue Jobs gefunden:</strong> {stats.get('new_jobs', 0)}</li>
-                <li><strong>Bewerbungen gesendet:</strong> {stats.get('applications_sent', 0)}</li>
-                <li><strong>Fehler aufgetreten:</strong> {stats.get('errors', 0)}</li>
-                <li><strong>Letzte Suche:</strong> {stats.get('last_search', 'N/A')}</li>
-            </ul>
-            <p><em>Diese E-Mail wurde automatisch vom Job-Finder generiert.</em></p>
-        </body>
-        </html>
-        """
-        return body
+        return _WEEKLY_SUMMARY_HTML.format(
+            total_searched=stats.get("total_searched", 0),
+            new_jobs=stats.get("new_jobs", 0),
+            applications_sent=stats.get("applications_sent", 0),
+            errors=stats.get("errors", 0),
+            last_search=stats.get("last_search", "N/A"),
+        )
 
     def _create_error_body(self, error_type, error_message, traceback):
         # HTML-Body fuer Fehlermeldung.
-        body = f"""
-        <html>
-        <body>
-            <h2 style=\"color: red;\">Kritischer Fehler im Job-Finder</h2>
-            <p><strong>Fehlertyp:</strong> {error_type}</p>
-            <p><strong>Nachricht:</strong> {error_message}</p>
-        """
-
-        if traceback:
-            body += f"""
-            <p><strong>Traceback:</strong></p>
-            <pre style=\"background-color: #f5f5f5; padding: 10px; border: 1px solid #ccc;\">{traceback}</pre>
-            """
-
-        body += """
-            <p>Bitte \u00fcberpr\u00fcfen Sie die Logs f\u00fcr weitere Details.</p>
-            <p><em>Diese E-Mail wurde automatisch vom Job-Finder generiert.</em></p>
-        </body>
-        </html>
-        """
-        return body
+        traceback_html = (
+            _ERROR_TRACEBACK_HTML.format(traceback=traceback) if traceback else ""
+        )
+        return _ERROR_BODY_HTML.format(
+            error_type=error_type,
+            error_message=error_message,
+            traceback_html=traceback_html,
+        )
 
     def _send_email(self, subject, body, priority="normal", attachment=None):
         # SMTP-Versand mit optionalem Attachment.
@@ -310,7 +469,7 @@ class EmailAutomation:
             job_logger.info("Email sending skipped: disabled via EMAIL_NOTIFICATIONS_ENABLED")
             return False
         try:
-            msg = MIMEMultipart()
+            msg = EmailMessage()
             msg["From"] = self.sender_email
             msg["To"] = ", ".join(self.recipient_emails)
             msg["Subject"] = subject
@@ -319,24 +478,18 @@ class EmailAutomation:
                 msg["X-Priority"] = "1"
                 msg["X-MSMail-Priority"] = "High"
 
-            msg.attach(MIMEText(body, "html", "utf-8"))
+            msg.set_content(body, subtype="html", charset="utf-8")
 
             if attachment and os.path.exists(attachment):
                 with open(attachment, "rb") as f:
-                    part = MIMEBase("application", "octet-stream")
-                    part.set_payload(f.read())
-                    encoders.encode_base64(part)
-                    part.add_header(
-                        "Content-Disposition",
-                        f"attachment; filename={os.path.basename(attachment)}",
+                    msg.add_attachment(
+                        f.read(),
+                        maintype="application",
+                        subtype="octet-stream",
+                        filename=os.path.basename(attachment),
                     )
-                    msg.attach(part)
 
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.sender_email, self.sender_password)
-            server.sendmail(self.sender_email, self.recipient_emails, msg.as_string())
-            server.quit()
+            self._pool.send_message(msg, self.sender_email, self.recipient_emails)
 
             job_logger.info(f"Email sent successfully: {subject}")
             return True
@@ -345,18 +498,30 @@ class EmailAutomation:
             job_logger.error(f"Failed to send email: {subject} - Error: {str(e)}")
             return False
 
-    def _send_whatsapp_summary(self, new_jobs, reminder_jobs) -> None:
-        # Kurze WhatsApp-Zusammenfassung senden (optional).
+    def _connect_smtp(self) -> smtplib.SMTP:
+        # Neue SMTP-Verbindung mit STARTTLS + Login aufbauen.
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.ehlo()
+            server.starttls()
+            server.ehlo()
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            _close_quietly(server)
+            raise
+        return server
+
+    def _send_whatsapp_summary(self, new_norm, reminder_norm) -> None:
+        # Kurze WhatsApp-Zusammenfassung senden (optional, erwartet normalisierte Jobs).
         try:
             from .notifier_whatsapp import send_whatsapp
         except Exception as e:
             job_logger.warning(f"WhatsApp init fehlgeschlagen: {e}")
             return
 
-        summary = f"Job-Alert: {len(new_jobs)} neu, {len(reminder_jobs)} offen"
+        summary = f"Job-Alert: {len(new_norm)} neu, {len(reminder_norm)} offen"
         lines = [summary]
-        for job in (new_jobs or [])[:3]:
-            data = _normalize_job(job)
+        for data in (new_norm or [])[:3]:
             lines.append(
                 f"- {data['job_title']} @ {data['company']} ({data['location']})"
             )
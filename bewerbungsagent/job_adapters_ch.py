@@ -1,18 +1,33 @@
-import json
 import os
 import re
 import urllib.parse
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, Optional, List
-from urllib.parse import urljoin, urlsplit, urlunsplit
+from urllib.parse import urljoin, urlsplit
 
+import requests
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Schneller JSON-Parser (orjson), stdlib json als Fallback.
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore
 
-# Datentransfer-Objekt fuer Jobtreffer.
-@dataclass
+# Optionaler C-Parser (lexbor) fuer JSON-LD; ohne selectolax greift der Regex-Pfad.
+try:
+    from selectolax.lexbor import LexborHTMLParser as _LexborHTMLParser
+except ImportError:
+    _LexborHTMLParser = None  # type: ignore
+
+
+# Datentransfer-Objekt fuer Jobtreffer (slots: kein __dict__ pro Zeile).
+@dataclass(slots=True)
 class JobRow:
     title: str
     company: str
@@ -27,7 +42,7 @@ class JobRow:
 
 # Robuster Cookie-Clicker (de/en/fr) fuer Consent-Banner.
 COOKIE_CLICK_JS = r"""
-(() => {
+return (() => {
   const needles = [
     'akzept', 'zustimm', 'einverstanden',
     'accept', 'agree', 'consent',
@@ -55,36 +70,49 @@ COOKIE_CLICK_JS = r"""
 # Maximalzahl Seiten pro Quelle (ENV steuerbar).
 COLLECT_MAX_PAGES = int(os.getenv("COLLECT_MAX_PAGES", "3") or 3)
 
+# Timeout fuer den direkten HTTP-Abruf der Ergebnisseiten (Sekunden).
+PAGE_FETCH_TIMEOUT = float(os.getenv("CH_PAGE_FETCH_TIMEOUT", "5") or 5)
+_PAGE_PREFETCH_WORKERS = 4
+
 
 def _normalize_link(link: str) -> str:
     # Tracking-Parameter entfernen, um Dedupe zu stabilisieren.
     """Dedupe: entferne Tracking-Query + Fragments."""
     if not link:
         return ""
-    try:
-        parts = urlsplit(link)
-        return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
-    except Exception:
-        return link.strip()
+    # Ohne URL-Parser: alles ab dem ersten "?" bzw. "#" abschneiden.
+    link = link.strip()
+    cut = len(link)
+    for sep in ("?", "#"):
+        i = link.find(sep, 0, cut)
+        if i >= 0:
+            cut = i
+    return link[:cut]
+
+
+# Vorkompilierte Regexe fuer Detail-Links und JSON-LD-Bloecke.
+_DETAIL_SUBSTRINGS = ("/detail/", "/job/", "/jobad/")
+_DETAIL_ID_RE = re.compile(
+    r"/(?:detail|job|jobad)/"
+    r"|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+    r"|/\d{6,}(?:/|$)",
+    re.I,
+)
+_SCRIPT_LD_RE = re.compile(
+    r'<script[^>]+type="application/ld\+json"[^>]*>(.*?)</script>', re.S | re.I
+)
 
 
+@lru_cache(maxsize=4096)
 def _is_detail_link(link: str) -> bool:
-    # Heuristik: Detailseiten erkennen.
+    # Heuristik: Detailseiten erkennen (typische Pfade, GUIDs, numerische IDs).
     if not link:
         return False
-    u = link.lower()
-
-    # typische Detailpfade
-    if "/detail/" in u or "/job/" in u or "/jobad/" in u:
-        return True
-
-    # GUIDs / numeric IDs
-    if re.search(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", u):
-        return True
-    if re.search(r"/\d{6,}(/|$)", u):
-        return True
-
-    return False
+    for sub in _DETAIL_SUBSTRINGS:
+        if sub in link:
+            return True
+    # Gross-/Kleinschreibung regelt die Regex, ohne Kopie via lower().
+    return _DETAIL_ID_RE.search(link) is not None
 
 
 # Regex fuer unerwuenschte Zeilen (Label/Datum).
@@ -95,21 +123,31 @@ _LINE_RELDATE_RE = re.compile(
 )
 
 
+def _jsonld_chunks(html: str) -> List[str]:
+    # Inhalte aller JSON-LD-Scriptbloecke liefern (lexbor, sonst Regex).
+    if _LexborHTMLParser is not None:
+        try:
+            tree = _LexborHTMLParser(html)
+            return [node.text() for node in tree.css('script[type="application/ld+json"]')]
+        except Exception:
+            pass
+    return [m.group(1) for m in _SCRIPT_LD_RE.finditer(html)]
+
+
 def _parse_jsonld(html: str) -> List[dict]:
     # JSON-LD JobPosting aus HTML extrahieren.
     out: List[dict] = []
-    pattern = r'<script[^>]+type="application/ld\+json"[^>]*>(.*?)</script>'
-    for m in re.finditer(pattern, html, re.S | re.I):
-        chunk = m.group(1)
-        if not chunk:
+    for chunk in _jsonld_chunks(html):
+        # Bloecke ohne JobPosting (Breadcrumbs, Organisation) gar nicht erst parsen.
+        if not chunk or "JobPosting" not in chunk:
             continue
         try:
-            data = json.loads(chunk.strip())
+            data = _json.loads(chunk)
         except Exception:
             continue
-        stack = data if isinstance(data, list) else [data]
+        stack = deque(data if isinstance(data, list) else [data])
         while stack:
-            obj = stack.pop(0)
+            obj = stack.popleft()
             if isinstance(obj, dict) and "@graph" in obj and isinstance(obj["@graph"], list):
                 stack.extend(obj["@graph"])
                 continue
@@ -168,6 +206,69 @@ def _to_jobrows(items: List[dict], source: str) -> List[JobRow]:
     return rows
 
 
+# Selektoren fuer typische Detail-Links.
+_DOM_LINK_SELECTORS = [
+    'a[href*="/detail/"]',
+    'a[href*="/jobs/detail/"]',
+    'a[href*="/de/jobs/detail/"]',
+    'a[href*="/emploi/detail/"]',
+    'a[href*="/jobad/"]',
+    'a[href*="/job/"]',
+]
+# Vereinigungs-Selektor: ein querySelectorAll, der Browser liefert jeden Knoten nur einmal.
+_DOM_LINK_SELECTOR = ", ".join(_DOM_LINK_SELECTORS)
+
+# Alle passenden Anchors inkl. Text/aria-label in einem WebDriver-Roundtrip lesen.
+DOM_LINKS_JS = r"""
+const out = [];
+let nodes = [];
+try { nodes = document.querySelectorAll(arguments[0] || 'a'); } catch (e) { return out; }
+for (const a of nodes) {
+  out.push({
+    href: a.href || a.getAttribute('href') || '',
+    text: a.innerText || '',
+    aria: a.getAttribute('aria-label') || ''
+  });
+}
+return out;
+"""
+
+
+def _anchor_to_row(
+    href: str, text: str, aria: str, source_name: str, base_url: str
+) -> Optional[JobRow]:
+    # Anchor-Daten (href/Text) in JobRow umwandeln, falls Detailseite.
+    href = (href or "").strip()
+    href = urljoin(base_url, href) if href else ""
+    if not _is_detail_link(href):
+        return None
+
+    txt = (text or "").strip() or (aria or "").strip()
+    if not txt:
+        return None
+
+    lines = [line.strip() for line in txt.splitlines() if line.strip()]
+    title = ""
+    for line in lines:
+        if _LINE_LABEL_RE.search(line) or _LINE_RELDATE_RE.search(line):
+            continue
+        title = line
+        break
+    if not title:
+        title = lines[0] if lines else txt
+    if not title:
+        return None
+
+    return JobRow(
+        title=title,
+        company="",
+        location="",
+        link=href,
+        raw_title=txt,
+        source=source_name,
+    )
+
+
 def _extract_dom_links(driver, source_name: str, base_url: str) -> List[JobRow]:
     # DOM-Fallback: Anchor-Tags nach Detailpfaden durchsuchen.
     """
@@ -176,63 +277,41 @@ def _extract_dom_links(driver, source_name: str, base_url: str) -> List[JobRow]:
     """
     rows: List[JobRow] = []
 
-    # Selektoren fuer typische Detail-Links.
-    selectors = [
-        'a[href*="/detail/"]',
-        'a[href*="/jobs/detail/"]',
-        'a[href*="/de/jobs/detail/"]',
-        'a[href*="/emploi/detail/"]',
-        'a[href*="/jobad/"]',
-        'a[href*="/job/"]',
-    ]
-
-    # Anchors fuer alle Selektoren einsammeln.
-    anchors = []
-    for sel in selectors:
-        try:
-            anchors += driver.find_elements(By.CSS_SELECTOR, sel)
-        except Exception:
-            continue
-
-    # Text/Link aus Anchors in JobRows umwandeln.
-    for a in anchors:
-        try:
-            href = (a.get_attribute("href") or "").strip()
-            if not href:
-                # fallback: relative href
-                href = (a.get_attribute("href") or "").strip()
-            href = urljoin(base_url, href) if href else ""
-            if not _is_detail_link(href):
-                continue
-
-            txt = (a.text or "").strip() or (a.get_attribute("aria-label") or "").strip()
-            if not txt:
-                continue
+    # Bevorzugt: alle Anchors per execute_script in einem Roundtrip.
+    try:
+        items = driver.execute_script(DOM_LINKS_JS, _DOM_LINK_SELECTOR)
+    except Exception:
+        items = None
 
-            lines = [line.strip() for line in txt.splitlines() if line.strip()]
-            title = ""
-            for line in lines:
-                if _LINE_LABEL_RE.search(line) or _LINE_RELDATE_RE.search(line):
-                    continue
-                title = line
-                break
-            if not title:
-                title = lines[0] if lines else txt
-            if not title:
+    if isinstance(items, list):
+        for item in items:
+            if not isinstance(item, dict):
                 continue
-
-            rows.append(
-                JobRow(
-                    title=title,
-                    company="",
-                    location="",
-                    link=href,
-                    raw_title=txt,
-                    source=source_name,
-                )
+            row = _anchor_to_row(
+                item.get("href") or "",
+                item.get("text") or "",
+                item.get("aria") or "",
+                source_name,
+                base_url,
             )
+            if row is not None:
+                rows.append(row)
+    else:
+        # Fallback: Anchors ueber WebDriver abfragen (ein Aufruf fuer alle Selektoren).
+        try:
+            anchors = driver.find_elements(By.CSS_SELECTOR, _DOM_LINK_SELECTOR)
         except Exception:
-            continue
+            anchors = []
+
+        for a in anchors:
+            try:
+                href = a.get_attribute("href") or ""
+                txt = (a.text or "").strip() or (a.get_attribute("aria-label") or "")
+                row = _anchor_to_row(href, txt, "", source_name, base_url)
+            except Exception:
+                continue
+            if row is not None:
+                rows.append(row)
 
     # Dedupe nach normalisiertem Link.
     seen, out = set(), []
@@ -245,7 +324,125 @@ def _extract_dom_links(driver, source_name: str, base_url: str) -> List[JobRow]:
     return out
 
 
-class JobsChAdapter:
+class _PagedAdapter:
+    # Gemeinsame Paginierung fuer jobs.ch und jobup.ch.
+    source = ""
+    BASE = ""
+
+    def __init__(self) -> None:
+        # Pro Browser-Session und Host merken, ob der Cookie-Banner schon bestaetigt wurde.
+        self._consented: set[tuple[str, str]] = set()
+        self._session: Optional[requests.Session] = None
+
+    def _session_for(self, driver) -> requests.Session:
+        # HTTP-Session mit User-Agent und aktuellen Cookies des Browsers.
+        cookies = driver.get_cookies() or []
+        session = self._session
+        if session is None:
+            session = requests.Session()
+            ua = driver.execute_script("return navigator.userAgent")
+            if ua:
+                session.headers["User-Agent"] = ua
+            self._session = session
+        for c in cookies:
+            session.cookies.set(c["name"], c["value"], domain=c.get("domain"), path=c.get("path", "/"))
+        return session
+
+    @staticmethod
+    def _get_html(session: requests.Session, url: str) -> str:
+        # Einzelne Ergebnisseite per HTTP holen; leerer String bei Fehlern.
+        try:
+            resp = session.get(url, timeout=PAGE_FETCH_TIMEOUT)
+        except Exception:
+            return ""
+        if resp.status_code != 200:
+            return ""
+        return resp.text or ""
+
+    def _fetch_html(self, driver, url: str) -> str:
+        # Seite per HTTP mit den Browser-Cookies laden; spart page_source ueber das WebDriver-Protokoll.
+        try:
+            session = self._session_for(driver)
+        except Exception:
+            return ""
+        return self._get_html(session, url)
+
+    def _page_rows(self, driver, paged: str, consent_key: tuple[str, str], html: Optional[str] = None) -> List[JobRow]:
+        # Seite im Browser oeffnen; JSON-LD aus HTTP bevorzugen, Browser-DOM als Fallback.
+        driver.get(paged)
+        if consent_key not in self._consented:
+            try:
+                if driver.execute_script(COOKIE_CLICK_JS) is True:
+                    self._consented.add(consent_key)
+            except Exception:
+                pass
+
+        page_rows: List[JobRow] = []
+        if html is None:
+            html = self._fetch_html(driver, paged)
+            page_rows = _to_jobrows(_parse_jsonld(html), self.source) if html else []
+        if not page_rows:
+            try:
+                WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "a")))
+            except Exception:
+                pass
+            # HTTP-HTML ohne Postings (Interstitial, JS-Rendering): gerendertes JSON-LD lesen.
+            page_rows = _to_jobrows(_parse_jsonld(driver.page_source or ""), self.source)
+            if not page_rows:
+                page_rows = _extract_dom_links(driver, self.source, self.BASE)
+        return page_rows
+
+    def _collect(self, driver, url: str, max_pages: int, limit: Optional[int]) -> List[JobRow]:
+        # Seiten laden, Duplikate sofort verwerfen und beim Limit abbrechen.
+        seen: set[str] = set()
+        out: List[JobRow] = []
+        consent_key = (str(getattr(driver, "session_id", "") or id(driver)), urlsplit(url).netloc)
+        pages = [url + f"&page={p}" for p in range(1, max_pages + 1)]
+
+        # Folgeseiten nach der ersten Browser-Navigation parallel per HTTP vorladen.
+        executor: Optional[ThreadPoolExecutor] = None
+        prefetched: dict[int, Future] = {}
+        try:
+            for idx, paged in enumerate(pages):
+                try:
+                    future = prefetched.pop(idx, None)
+                    if future is not None:
+                        html = future.result()
+                        page_rows = _to_jobrows(_parse_jsonld(html), self.source) if html else []
+                        if not page_rows:
+                            page_rows = self._page_rows(driver, paged, consent_key, html or None)
+                    else:
+                        page_rows = self._page_rows(driver, paged, consent_key)
+                    if not page_rows:
+                        break
+                except Exception:
+                    continue
+
+                if executor is None and idx + 1 < len(pages):
+                    try:
+                        session = self._session_for(driver)
+                    except Exception:
+                        session = None
+                    if session is not None:
+                        rest = range(idx + 1, len(pages))
+                        executor = ThreadPoolExecutor(max_workers=min(len(rest), _PAGE_PREFETCH_WORKERS))
+                        prefetched = {i: executor.submit(self._get_html, session, pages[i]) for i in rest}
+
+                for r in page_rows:
+                    key = _normalize_link(r.link)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    out.append(r)
+                    if limit is not None and len(out) >= limit:
+                        return out
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        return out
+
+
+class JobsChAdapter(_PagedAdapter):
     # Selenium-Adapter fuer jobs.ch.
     source = "jobs.ch"
     BASE = "https://www.jobs.ch/de/stellenangebote/"
@@ -256,51 +453,11 @@ class JobsChAdapter:
         if location:
             params["location"] = location  # konsistent zu Query-Builder
         url = f"{self.BASE}?{urllib.parse.urlencode(params, doseq=True)}"
-
-        rows: List[JobRow] = []
         max_pages = COLLECT_MAX_PAGES if COLLECT_MAX_PAGES > 0 else 1
+        return self._collect(driver, url, max_pages, limit)
 
-        # Paginierung iterieren.
-        for p in range(1, max_pages + 1):
-            paged = url + f"&page={p}"
-            try:
-                driver.get(paged)
-                try:
-                    driver.execute_script(COOKIE_CLICK_JS)
-                except Exception:
-                    pass
-
-                try:
-                    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "a")))
-                except Exception:
-                    pass
-
-                # Erst JSON-LD versuchen, dann DOM-Fallback.
-                html = driver.page_source or ""
-                page_rows = _to_jobrows(_parse_jsonld(html), self.source)
-                if not page_rows:
-                    page_rows = _extract_dom_links(driver, self.source, self.BASE)
-                if not page_rows:
-                    break
-                rows.extend(page_rows)
 
-            except Exception:
-                continue
-
-        # Ergebnisliste dedupen und limitieren.
-        seen, out = set(), []
-        for r in rows:
-            key = _normalize_link(r.link)
-            if key in seen:
-                continue
-            seen.add(key)
-            out.append(r)
-            if limit is not None and len(out) >= limit:
-                break
-        return out
-
-
-class JobupAdapter:
+class JobupAdapter(_PagedAdapter):
     # Selenium-Adapter fuer jobup.ch.
     source = "jobup.ch"
     BASE = "https://www.jobup.ch/de/jobs/"
@@ -311,45 +468,5 @@ class JobupAdapter:
         if location:
             params["location"] = location
         url = f"{self.BASE}?{urllib.parse.urlencode(params, doseq=True)}"
-
-        rows: List[JobRow] = []
         max_pages = COLLECT_MAX_PAGES if COLLECT_MAX_PAGES > 0 else 1
-
-        # Paginierung iterieren.
-        for p in range(1, max_pages + 1):
-            paged = url + f"&page={p}"
-            try:
-                driver.get(paged)
-                try:
-                    driver.execute_script(COOKIE_CLICK_JS)
-                except Exception:
-                    pass
-
-                try:
-                    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "a")))
-                except Exception:
-                    pass
-
-                # Erst JSON-LD versuchen, dann DOM-Fallback.
-                html = driver.page_source or ""
-                page_rows = _to_jobrows(_parse_jsonld(html), self.source)
-                if not page_rows:
-                    page_rows = _extract_dom_links(driver, self.source, self.BASE)
-                if not page_rows:
-                    break
-                rows.extend(page_rows)
-
-            except Exception:
-                continue
-
-        # Ergebnisliste dedupen und limitieren.
-        seen, out = set(), []
-        for r in rows:
-            key = _normalize_link(r.link)
-            if key in seen:
-                continue
-            seen.add(key)
-            out.append(r)
-            if limit is not None and len(out) >= limit:
-                break
-        return out
+        return self._collect(driver, url, max_pages, limit)
@@ -1,6 +1,8 @@
 ﻿from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache, lru_cache
+from operator import attrgetter
 from concurrent.futures import (
     ProcessPoolExecutor,
     ThreadPoolExecutor,
@@ -9,26 +11,31 @@ from concurrent.futures import (
 )
 from html import unescape
 from html.parser import HTMLParser
+from itertools import islice
 from pathlib import Path
 from typing import List, Tuple
 import csv
+import hashlib
+import heapq
 import os
 import re
 import json
 import time
 import threading
 import random
+import sqlite3
 import unicodedata
 import multiprocessing as mp
 from urllib.parse import urljoin, urlparse
 
 import requests
+import requests.adapters
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 # webdriver_manager kept as optional fallback; primary driver discovery uses
 # selenium's built-in selenium-manager to avoid Windows Smart App Control blocks
 # on freshly-downloaded binaries in ~/.wdm/
@@ -37,9 +44,33 @@ try:
 except ImportError:
     _ChromeDriverManager = None  # type: ignore
 
+# Optional: Aho-Corasick fuer Keyword-Suche in einem Durchlauf (sonst Substring-Schleife).
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # type: ignore
+
+# Optionaler C-Parser (lexbor) fuer Links; ohne selectolax greift _AnchorParser.
+try:
+    from selectolax.lexbor import LexborHTMLParser as _LexborHTMLParser
+except ImportError:
+    _LexborHTMLParser = None  # type: ignore
+
+# Optional: httpx (HTTP/2 mit h2) fuer die Aggregator-Link-Pruefung.
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore
+
+# Optional: orjson fuer schnelles (De-)Serialisieren der Cache-Dateien.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 from .config import config
 from .logger import job_logger
-from .job_adapters_ch import JobsChAdapter, JobupAdapter, JobRow as CHJobRow
+from .job_adapters_ch import JobsChAdapter, JobupAdapter
 from .job_adapters_extra import (
     CareerjetAdapter,
     IctJobsAdapter,
@@ -53,13 +84,17 @@ from .job_adapters_extra import (
     JobWinnerAdapter,
     MonsterAdapter,
     SwissDevJobsAdapter,
-    ExtraJobRow,
 )
 from .job_query_builder import build_search_urls
 from .job_text_utils import extract_from_multiline_title
 from .cv_filter import get_cv_blocklist_terms
 
 
+# Mehrzeilige Titel werden im Filter und erneut beim Export geparst; Ergebnis teilen.
+# (Kein Attribut am Job: job_state liest __dict__ und wuerde es mitschreiben.)
+_parse_multiline_title = lru_cache(maxsize=8192)(extract_from_multiline_title)
+
+
 # Kanonisches Job-Objekt fuer Sammeln/Export.
 @dataclass
 class Job:
@@ -78,6 +113,22 @@ class Job:
     commute_min: int | None = None
 
 
+# Einmal aufgeloester chromedriver-Pfad (selenium-manager laeuft sonst pro Driver).
+_CHROMEDRIVER_PATH: str | None = None
+_CHROMEDRIVER_LOCK = threading.Lock()
+
+
+def _remember_driver_path(path: str) -> None:
+    # Pfad merken und per ENV an spaeter gestartete Worker-Prozesse (spawn) weitergeben.
+    global _CHROMEDRIVER_PATH
+    if not path or not os.path.isfile(path):
+        return
+    with _CHROMEDRIVER_LOCK:
+        if _CHROMEDRIVER_PATH is None:
+            _CHROMEDRIVER_PATH = path
+            os.environ.setdefault("CHROMEDRIVER_PATH", path)
+
+
 def _mk_driver(headless: bool = True) -> webdriver.Chrome:
     # Selenium-Driver mit stabilen Optionen konfigurieren.
     opts = Options()
@@ -100,7 +151,7 @@ def _mk_driver(headless: bool = True) -> webdriver.Chrome:
     # 2. selenium-manager built into selenium package (avoids ~/.wdm/ downloads
     #    that Windows Smart App Control may block as unsigned internet-downloads)
     # 3. webdriver_manager fallback (legacy, downloads to ~/.wdm/)
-    driver_path = os.getenv("CHROMEDRIVER_PATH", "").strip()
+    driver_path = os.getenv("CHROMEDRIVER_PATH", "").strip() or _CHROMEDRIVER_PATH
     if driver_path:
         service = Service(driver_path)
     else:
@@ -109,6 +160,8 @@ def _mk_driver(headless: bool = True) -> webdriver.Chrome:
         service = Service()
 
     driver = webdriver.Chrome(service=service, options=opts)
+    if not driver_path:
+        _remember_driver_path(getattr(service, "path", "") or "")
 
     try:
         driver.set_page_load_timeout(25)
@@ -138,20 +191,90 @@ def _text(v: str | None) -> str:
     return (v or "").strip()
 
 
-def _score_title(title: str) -> Tuple[int, str]:
-    # Titel anhand positiver/negativer Keywords bewerten.
-    t = title.lower()
+@lru_cache(maxsize=32)
+def _term_automaton(terms: frozenset[str]):
+    # Aho-Corasick-Automat je Begriffsmenge einmal bauen (None ohne pyahocorasick).
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        if term:
+            automaton.add_word(term, term)
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
+
 
+def _any_term_in(text: str, terms: frozenset[str]) -> bool:
+    # Irgendein Begriff als Teilstring im Text? (ein Durchlauf statt K Suchen)
+    if not terms:
+        return False
+    if "" in terms:
+        return True
+    automaton = _term_automaton(terms)
+    if automaton is None:
+        return any(term in text for term in terms)
+    for _ in automaton.iter(text):
+        return True
+    return False
+
+
+@cache
+def _score_terms() -> tuple[frozenset[str], frozenset[str], frozenset[str]]:
+    # Positive/negative Titel-Keywords einmal aus der (beim Import geladenen) Config bauen.
     positives_raw = (
         getattr(config, "SEARCH_KEYWORDS", [])
         + getattr(config, "TITLE_VARIANTS_DE", [])
         + getattr(config, "TITLE_VARIANTS_EN", [])
     )
-    positives = {p.lower() for p in positives_raw if p}
-    negatives = {n.lower() for n in getattr(config, "NEGATIVE_KEYWORDS", []) if n}
+    positives = frozenset(p.lower() for p in positives_raw if p)
+    negatives = frozenset(n.lower() for n in getattr(config, "NEGATIVE_KEYWORDS", []) if n)
+    return positives, negatives, positives | negatives
+
+
+# Felder, die aus Adapter-Zeilen (dict oder Dataclass) uebernommen werden.
+_ROW_KEYS = ("title", "link", "raw_title", "company", "location", "date")
+_ROW_GETTER = attrgetter(*_ROW_KEYS)
+_JOB_SCORE = attrgetter("score")
+
+
+def _normalize_row(r) -> dict:
+    # Adapter-Zeile einmalig in ein einheitliches dict ueberfuehren.
+    if isinstance(r, dict):
+        values = tuple(r.get(k) for k in _ROW_KEYS)
+    else:
+        try:
+            values = _ROW_GETTER(r)
+        except AttributeError:
+            values = tuple(getattr(r, k, None) for k in _ROW_KEYS)
+    title, link, raw_title, company, location, date = values
+    title = title or ""
+    return {
+        "title": title,
+        "link": link or "",
+        "raw_title": raw_title or title,
+        "company": company or "",
+        "location": location or "",
+        "date": date or "",
+    }
+
 
-    p_hits = sum(1 for p in positives if p in t)
-    n_hits = sum(1 for n in negatives if n in t)
+@lru_cache(maxsize=4096)
+def _score_title(title: str) -> Tuple[int, str]:
+    # Titel anhand positiver/negativer Keywords bewerten.
+    t = title.lower()
+    positives, negatives, all_terms = _score_terms()
+
+    automaton = _term_automaton(all_terms)
+    if automaton is None:
+        p_hits = sum(1 for p in positives if p in t)
+        n_hits = sum(1 for n in negatives if n in t)
+    else:
+        # Ein Durchlauf; jeder Begriff zaehlt wie bisher hoechstens einmal.
+        found = {term for _, term in automaton.iter(t)}
+        p_hits = len(found & positives)
+        n_hits = len(found & negatives)
     score = p_hits * 10 - n_hits * 20
 
     if p_hits >= 2 and n_hits == 0:
@@ -174,20 +297,21 @@ def compute_fit(match: str, score: int, min_score_apply: int) -> str:
 
 
 
+_UMLAUT_TRANS = str.maketrans({"\u00e4": "ae", "\u00f6": "oe", "\u00fc": "ue", "\u00df": "ss"})
+_NONALNUM_RE = re.compile(r"[^a-z0-9\s]+")
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=8192)
 def _normalize_text(value: str) -> str:
     # Text normalisieren (Umlaute/Leerzeichen/Zeichen).
-    text = (value or "").lower()
-    text = (
-        text.replace("\u00e4", "ae")
-        .replace("\u00f6", "oe")
-        .replace("\u00fc", "ue")
-        .replace("\u00df", "ss")
-    )
-    text = unicodedata.normalize("NFKD", text)
-    text = "".join(ch for ch in text if not unicodedata.combining(ch))
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    text = (value or "").lower().translate(_UMLAUT_TRANS)
+    # Reiner ASCII-Text: NFKD/Combining-Filter aendern nichts und entfallen.
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = _NONALNUM_RE.sub(" ", text)
+    return _WS_RE.sub(" ", text).strip()
 
 
 _SOURCE_ALIASES = {
@@ -258,15 +382,71 @@ def _commute_minutes_for(
     # Passende Pendelzeit fuer Job anhand Standort-Keywords finden.
     if not commute_map:
         return None
-    texts = [
-        _normalize_text(job.location or ""),
-        _normalize_text(job.title or ""),
-        _normalize_text(job.raw_title or ""),
-    ]
-    for key, minutes in commute_map:
-        if key and any(key in t for t in texts):
-            return minutes
-    return None
+    entries = tuple(commute_map)
+    # Erster passender Map-Eintrag ueber alle drei Felder (gleiche Prioritaet wie zuvor).
+    idx = min(
+        _commute_index(_normalize_text(job.location or ""), entries),
+        _commute_index(_normalize_text(job.title or ""), entries),
+        _commute_index(_normalize_text(job.raw_title or ""), entries),
+    )
+    return entries[idx][1] if idx < len(entries) else None
+
+
+@lru_cache(maxsize=2048)
+def _commute_index(text: str, entries: tuple[tuple[str, int], ...]) -> int:
+    # Index des ersten Map-Keys im Text (len(entries) = kein Treffer); wiederholte Orte aus dem Cache.
+    for idx, (key, _minutes) in enumerate(entries):
+        if key and key in text:
+            return idx
+    return len(entries)
+
+
+def _mk_http_session() -> requests.Session:
+    # Gemeinsame Session mit Keep-Alive-Pool (spart TCP/TLS-Handshakes pro Request).
+    session = requests.Session()
+    # Nur Verbindungsfehler wiederholen (z.B. vom Server geschlossene Keep-Alive-Verbindungen),
+    # keine HTTP-Status: 429/5xx behandeln die Aufrufer selbst. Lesefehler (inkl. Timeout)
+    # hoechstens einmal, damit langsame Seiten nicht ein Vielfaches des Timeouts kosten.
+    retries = int(os.getenv("HTTP_CONNECT_RETRIES", "2") or 0)
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=min(retries, 1),
+        status=0,
+        backoff_factor=0.3,
+        raise_on_status=False,
+    )
+    adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept-Language"] = "de-CH,de;q=0.9,en;q=0.8"
+    return session
+
+
+_HTTP_SESSION = _mk_http_session()
+
+
+def _mk_httpx_client():
+    # httpx-Client fuer Link-Checks; HTTP/2 nur, wenn das h2-Paket installiert ist.
+    if httpx is None:
+        return None
+    try:
+        import h2  # noqa: F401
+
+        http2 = True
+    except ImportError:
+        http2 = False
+    return httpx.Client(
+        http2=http2,
+        follow_redirects=True,
+        headers={"Accept-Language": "de-CH,de;q=0.9,en;q=0.8"},
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+    )
+
+
+def _client_closed(session) -> bool:
+    # httpx-Client nach close() (requests.Session kennt kein is_closed).
+    return bool(getattr(session, "is_closed", False))
 
 
 # Marker fuer "Job nicht gefunden" bei Aggregatoren.
@@ -280,52 +460,144 @@ AGGREGATOR_NOT_FOUND_MARKERS = (
     "no longer available",
     "not available",
 )
+_NOT_FOUND_MARKERS_BYTES = tuple(m.encode("ascii") for m in AGGREGATOR_NOT_FOUND_MARKERS)
 
 
-def _aggregator_link_ok(url: str) -> bool:
-    # Link pruefen, ob Detailseite erreichbar ist (mit Cache).
-    if not url:
+def _body_has_not_found_marker(chunks) -> bool:
+    # Body bis AGGREGATOR_VALIDATE_MAX_BYTES lesen und auf "nicht gefunden"-Marker pruefen.
+    buf = bytearray()
+    for chunk in chunks:
+        if not chunk:
+            break
+        buf.extend(chunk)
+        if len(buf) >= AGGREGATOR_VALIDATE_MAX_BYTES:
+            break
+    # Marker sind ASCII: direkt auf den Bytes suchen, ohne UTF-8-Decode.
+    lowered = buf.lower()
+    return any(marker in lowered for marker in _NOT_FOUND_MARKERS_BYTES)
+
+
+_AGGREGATOR_CHECK_HEADERS = {"User-Agent": "Bewerbungsagent/1.0 (+aggregator-check)"}
+
+
+def _head_verdict(status_code: int, content_type: str) -> bool | None:
+    # HEAD-Antwort auswerten: True/False wenn eindeutig, None = GET mit Marker-Suche noetig.
+    if status_code in (404, 410):
         return False
-    if url in AGGREGATOR_LINK_CACHE:
-        return AGGREGATOR_LINK_CACHE[url]
+    if 200 <= status_code < 300 and content_type and "html" not in content_type.lower():
+        return True
+    # 405/501 (HEAD nicht unterstuetzt), andere Fehler und HTML-Seiten per GET pruefen.
+    return None
+
+
+def _validate_single_httpx(client, url: str) -> bool:
+    # Link-Check ueber httpx (Stream, damit nur der Anfang des Bodys gelesen wird).
+    if AGGREGATOR_VALIDATE_HEAD:
+        try:
+            head = client.head(url, headers=_AGGREGATOR_CHECK_HEADERS, timeout=AGGREGATOR_VALIDATE_TIMEOUT)
+            verdict = _head_verdict(head.status_code, head.headers.get("content-type", ""))
+        except Exception:
+            verdict = None
+        if verdict is not None:
+            return verdict
     try:
-        resp = requests.get(
+        with client.stream(
+            "GET",
             url,
-            headers={"User-Agent": "Bewerbungsagent/1.0 (+aggregator-check)"},
+            headers=_AGGREGATOR_CHECK_HEADERS,
+            timeout=AGGREGATOR_VALIDATE_TIMEOUT,
+        ) as resp:
+            if resp.status_code >= 400:
+                return False
+            return not _body_has_not_found_marker(resp.iter_bytes(4096))
+    except Exception:
+        return False
+
+
+def _validate_single(url: str) -> bool:
+    # Link pruefen, ob Detailseite erreichbar ist (ohne Cache).
+    if _HTTPX_CLIENT is not None:
+        return _validate_single_httpx(_HTTPX_CLIENT, url)
+    if AGGREGATOR_VALIDATE_HEAD:
+        try:
+            head = _HTTP_SESSION.head(
+                url,
+                headers=_AGGREGATOR_CHECK_HEADERS,
+                timeout=AGGREGATOR_VALIDATE_TIMEOUT,
+                allow_redirects=True,
+            )
+            verdict = _head_verdict(head.status_code, head.headers.get("Content-Type", ""))
+        except Exception:
+            verdict = None
+        if verdict is not None:
+            return verdict
+    try:
+        resp = _HTTP_SESSION.get(
+            url,
+            headers=_AGGREGATOR_CHECK_HEADERS,
             timeout=AGGREGATOR_VALIDATE_TIMEOUT,
             allow_redirects=True,
             stream=True,
         )
     except Exception:
-        AGGREGATOR_LINK_CACHE[url] = False
         return False
 
     ok = True
     if resp.status_code >= 400:
         ok = False
     else:
-        data = b""
         try:
-            for chunk in resp.iter_content(chunk_size=4096):
-                if not chunk:
-                    break
-                data += chunk
-                if len(data) >= AGGREGATOR_VALIDATE_MAX_BYTES:
-                    break
+            ok = not _body_has_not_found_marker(resp.iter_content(chunk_size=4096))
         except Exception:
             ok = False
-        if ok:
-            text = data.decode("utf-8", errors="ignore").lower()
-            if any(marker in text for marker in AGGREGATOR_NOT_FOUND_MARKERS):
-                ok = False
+    # Stream schliessen, damit die Verbindung in den Session-Pool zurueckgeht.
+    resp.close()
+    return ok
+
 
-    AGGREGATOR_LINK_CACHE[url] = ok
+def _aggregator_link_ok(url: str) -> bool:
+    # Link pruefen, ob Detailseite erreichbar ist (mit Cache).
+    if not url:
+        return False
+    if url in AGGREGATOR_LINK_CACHE:
+        return AGGREGATOR_LINK_CACHE[url]
+    ok = _validate_single(url)
+    with _AGGREGATOR_LINK_LOCK:
+        AGGREGATOR_LINK_CACHE[url] = ok
     return ok
 
 
-def _normalize_terms(items: set[str]) -> set[str]:
-    # Begriffe vereinheitlichen (normalisieren).
-    return {_normalize_text(x) for x in items if x}
+def _validate_links_bulk(urls: List[str]) -> dict[str, bool]:
+    # Cache-Misses parallel pruefen (IO-bound: Summe der RTTs -> ca. max. RTT).
+    results: dict[str, bool] = {}
+    misses: List[str] = []
+    for url in dict.fromkeys(urls):
+        if not url:
+            continue
+        if url in AGGREGATOR_LINK_CACHE:
+            results[url] = AGGREGATOR_LINK_CACHE[url]
+        else:
+            misses.append(url)
+    if not misses:
+        return results
+
+    with ThreadPoolExecutor(max_workers=max(1, min(REQUESTS_ADAPTER_WORKERS, len(misses)))) as ex:
+        futs = {ex.submit(_validate_single, url): url for url in misses}
+        for fut in as_completed(futs):
+            url = futs[fut]
+            try:
+                ok = fut.result()
+            except Exception:
+                ok = False
+            with _AGGREGATOR_LINK_LOCK:
+                AGGREGATOR_LINK_CACHE[url] = ok
+            results[url] = ok
+    return results
+
+
+def _normalize_terms(items: set[str]) -> frozenset[str]:
+    # Begriffe vereinheitlichen (normalisieren); frozenset, damit der Matcher-Cache greift.
+    return frozenset(_normalize_text(x) for x in items if x)
 
 
 def _dedupe_terms(items: List[str]) -> List[str]:
@@ -435,16 +707,39 @@ def _selenium_worker(
     return {"results": results, "errors": errors}
 
 
-def _empty_cache_key(source: str, query: str, location: str, radius_km: int) -> str:
+EmptyCacheKey = Tuple[str, str, str, int]
+
+
+def _empty_cache_key(
+    source: str, query: str, location: str, radius_km: int
+) -> EmptyCacheKey:
+    # Tupel statt f-String: kein neuer String je (Quelle, Query, Ort).
     src = (source or "").strip().lower()
     q = _normalize_text(query or "")
     loc = _normalize_text(location or "")
-    return f"{src}|{q}|{loc}|{radius_km}"
+    return (src, q, loc, radius_km)
+
+
+def _empty_key_to_db(key: EmptyCacheKey) -> str:
+    # Persistierte Form bleibt "quelle|query|ort|radius" (kompatibel zu alten Caches).
+    return "|".join(map(str, key))
+
+
+def _empty_key_from_db(text: str) -> EmptyCacheKey | None:
+    parts = str(text).split("|")
+    if len(parts) != 4:
+        return None
+    try:
+        return (parts[0], parts[1], parts[2], int(parts[3]))
+    except ValueError:
+        return None
 
 
-def _load_empty_search_cache(path: Path) -> dict[str, float]:
+def _load_legacy_empty_search_cache(path: Path) -> dict[str, float]:
+    # Alten JSON-Cache lesen (nur fuer die einmalige Uebernahme in die SQLite-DB).
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return {}
     if not isinstance(data, dict):
@@ -458,25 +753,265 @@ def _load_empty_search_cache(path: Path) -> dict[str, float]:
     return out
 
 
+def _trim_detail_caches(max_items: int) -> None:
+    # Aelteste Eintraege (Einfuegereihenfolge) verwerfen, bis jeder Detail-Cache <= max_items hat.
+    if max_items <= 0:
+        return
+    for store in (
+        DETAILS_BLOCKLIST_CACHE,
+        DETAILS_INCLUDE_CACHE,
+        DETAILS_TEXT_CACHE,
+        DETAILS_LOCATION_CACHE,
+        DETAILS_CONTACT_CACHE,
+    ):
+        overflow = len(store) - max_items
+        if overflow > 0:
+            for url in list(islice(store, overflow)):
+                del store[url]
+    DETAILS_CONTACT_FAILED.intersection_update(DETAILS_CONTACT_CACHE)
+
+
 def _prune_empty_search_cache(
-    cache: dict[str, float],
+    cache: dict[EmptyCacheKey, float],
     ttl_seconds: float,
     now_ts: float,
-) -> dict[str, float]:
+) -> dict[EmptyCacheKey, float]:
     if ttl_seconds <= 0:
         return {}
     return {k: v for k, v in cache.items() if (now_ts - v) <= ttl_seconds}
 
 
-def _save_empty_search_cache(path: Path, cache: dict[str, float]) -> None:
+def _open_cache_db(path: Path) -> sqlite3.Connection | None:
+    # SQLite-Cache im WAL-Modus oeffnen; Autocommit, Batch-Saves laufen ueber _executemany_atomic.
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(cache, f, indent=2, sort_keys=True)
+        conn = sqlite3.connect(str(path), isolation_level=None, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS empty_search (key TEXT PRIMARY KEY, ts REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS aggregator_links "
+            "(url TEXT PRIMARY KEY, ok INTEGER NOT NULL, ts REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS transit "
+            "(origin TEXT NOT NULL, destination TEXT NOT NULL, date TEXT NOT NULL, "
+            "time TEXT NOT NULL, minutes INTEGER NOT NULL, ts REAL NOT NULL, "
+            "PRIMARY KEY (origin, destination, date, time))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS details_blocklist "
+            "(url TEXT NOT NULL, terms TEXT NOT NULL, blocked INTEGER NOT NULL, "
+            "ts REAL NOT NULL, PRIMARY KEY (url, terms))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS details_contact "
+            "(url TEXT PRIMARY KEY, email TEXT NOT NULL, name TEXT NOT NULL, ts REAL NOT NULL)"
+        )
+    except Exception as e:
+        job_logger.warning(f"Cache-DB nicht nutzbar ({path}): {e}")
+        return None
+    return conn
+
+
+def _load_empty_search_cache(
+    conn: sqlite3.Connection, ttl_seconds: float, now_ts: float
+) -> dict[EmptyCacheKey, float]:
+    # Abgelaufene Eintraege loeschen, Rest laden.
+    try:
+        conn.execute("DELETE FROM empty_search WHERE ts < ?", (now_ts - ttl_seconds,))
+        rows = conn.execute("SELECT key, ts FROM empty_search").fetchall()
+    except Exception:
+        return {}
+    out: dict[EmptyCacheKey, float] = {}
+    for text, ts in rows:
+        key = _empty_key_from_db(text)
+        if key is not None:
+            out[key] = float(ts)
+    return out
+
+
+def _executemany_atomic(conn: sqlite3.Connection, sql: str, rows) -> None:
+    # Batch in einer expliziten Transaktion schreiben (Autocommit-Verbindung: `with conn` oeffnet keine).
+    conn.execute("BEGIN")
+    try:
+        conn.executemany(sql, rows)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _save_empty_search_cache(
+    conn: sqlite3.Connection, updates: dict[EmptyCacheKey, float]
+) -> None:
+    # Nur neue/geaenderte Keys schreiben (kein Neuschreiben des ganzen Caches).
+    if not updates:
+        return
+    try:
+        _executemany_atomic(
+            conn,
+            "INSERT OR REPLACE INTO empty_search (key, ts) VALUES (?, ?)",
+            [(_empty_key_to_db(k), ts) for k, ts in updates.items()],
+        )
+    except Exception:
+        return
+
+
+def _import_legacy_empty_search_cache(conn: sqlite3.Connection, path: Path) -> None:
+    # Bestehenden JSON-Cache einmalig uebernehmen, solange die DB-Tabelle leer ist.
+    if not path.is_file():
+        return
+    try:
+        if conn.execute("SELECT 1 FROM empty_search LIMIT 1").fetchone():
+            return
+    except Exception:
+        return
+    legacy = _load_legacy_empty_search_cache(path)
+    updates = {}
+    for text, ts in legacy.items():
+        key = _empty_key_from_db(text)
+        if key is not None:
+            updates[key] = ts
+    _save_empty_search_cache(conn, updates)
+
+
+def _load_aggregator_link_cache(
+    conn: sqlite3.Connection, ttl_seconds: float, now_ts: float
+) -> dict[str, bool]:
+    # Link-Ergebnisse frueherer Laeufe laden (abgelaufene vorher loeschen).
+    try:
+        conn.execute("DELETE FROM aggregator_links WHERE ts < ?", (now_ts - ttl_seconds,))
+        return {str(url): bool(ok) for url, ok in conn.execute("SELECT url, ok FROM aggregator_links")}
+    except Exception:
+        return {}
+
+
+def _save_aggregator_link_cache(
+    conn: sqlite3.Connection, results: dict[str, bool], now_ts: float
+) -> None:
+    # Neue Link-Ergebnisse anhaengen; bestehende behalten ihren Zeitstempel.
+    if not results:
+        return
+    try:
+        _executemany_atomic(
+            conn,
+            "INSERT OR IGNORE INTO aggregator_links (url, ok, ts) VALUES (?, ?, ?)",
+            [(url, int(ok), now_ts) for url, ok in results.items()],
+        )
+    except Exception:
+        return
+
+
+def _load_transit_cache(
+    conn: sqlite3.Connection, ttl_seconds: float, now_ts: float
+) -> dict[tuple[str, str, str, str], int]:
+    # Fahrzeiten frueherer Laeufe laden (abgelaufene vorher loeschen).
+    try:
+        conn.execute("DELETE FROM transit WHERE ts < ?", (now_ts - ttl_seconds,))
+        rows = conn.execute("SELECT origin, destination, date, time, minutes FROM transit")
+        return {(o, d, dt, tm): int(m) for o, d, dt, tm, m in rows}
+    except Exception:
+        return {}
+
+
+def _save_transit_cache(
+    conn: sqlite3.Connection,
+    results: dict[tuple[str, str, str, str], int | None],
+    now_ts: float,
+) -> None:
+    # Nur echte Fahrzeiten speichern; None (Fehler/keine Verbindung) wird im naechsten Lauf neu gefragt.
+    rows = [(*key, minutes, now_ts) for key, minutes in results.items() if minutes is not None]
+    if not rows:
+        return
+    try:
+        _executemany_atomic(
+            conn,
+            "INSERT OR REPLACE INTO transit (origin, destination, date, time, minutes, ts) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+    except Exception:
+        return
+
+
+def _terms_digest(terms) -> str:
+    # Stabiler Kurz-Hash einer Begriffsmenge (Blocklist-Ergebnisse gelten nur fuer dieselben Begriffe).
+    return hashlib.sha256("\n".join(sorted(terms)).encode("utf-8")).hexdigest()[:16]
+
+
+def _load_details_blocklist_cache(
+    conn: sqlite3.Connection, terms: str, ttl_seconds: float, now_ts: float
+) -> dict[str, bool]:
+    # Blocklist-Ergebnisse frueherer Laeufe laden (nur fuer den aktuellen Begriffs-Hash).
+    try:
+        conn.execute("DELETE FROM details_blocklist WHERE ts < ?", (now_ts - ttl_seconds,))
+        rows = conn.execute(
+            "SELECT url, blocked FROM details_blocklist WHERE terms = ?", (terms,)
+        )
+        return {str(url): bool(blocked) for url, blocked in rows}
+    except Exception:
+        return {}
+
+
+def _save_details_blocklist_cache(
+    conn: sqlite3.Connection, terms: str, results: dict[str, bool], now_ts: float
+) -> None:
+    if not results:
+        return
+    try:
+        _executemany_atomic(
+            conn,
+            "INSERT OR REPLACE INTO details_blocklist (url, terms, blocked, ts) "
+            "VALUES (?, ?, ?, ?)",
+            [(url, terms, int(blocked), now_ts) for url, blocked in results.items()],
+        )
+    except Exception:
+        return
+
+
+def _load_details_contact_cache(
+    conn: sqlite3.Connection, ttl_seconds: float, now_ts: float
+) -> dict[str, tuple[str, str]]:
+    # Kontakt-Ergebnisse frueherer Laeufe laden (abgelaufene vorher loeschen).
+    try:
+        conn.execute("DELETE FROM details_contact WHERE ts < ?", (now_ts - ttl_seconds,))
+        rows = conn.execute("SELECT url, email, name FROM details_contact")
+        return {str(url): (email, name) for url, email, name in rows}
+    except Exception:
+        return {}
+
+
+def _save_details_contact_cache(
+    conn: sqlite3.Connection, results: dict[str, tuple[str, str]], now_ts: float
+) -> None:
+    if not results:
+        return
+    try:
+        _executemany_atomic(
+            conn,
+            "INSERT OR REPLACE INTO details_contact (url, email, name, ts) "
+            "VALUES (?, ?, ?, ?)",
+            [(url, email, name, now_ts) for url, (email, name) in results.items()],
+        )
     except Exception:
         return
 
 
+def _env_csv(name: str, default: str = "", lower: bool = False) -> list[str]:
+    # Kommaliste aus ENV lesen; leere Eintraege fallen weg.
+    items = [x.strip() for x in (os.getenv(name, default) or "").split(",") if x.strip()]
+    return [x.lower() for x in items] if lower else items
+
+
+def _env_source_set(name: str, default: str = "") -> set[str]:
+    # Quellnamen aus ENV normalisieren; leerer Wert faellt auf den Default zurueck.
+    raw = os.getenv(name, default) or default
+    return {n for n in map(_normalize_source_name, raw.split(",")) if n}
+
+
 # ENV/Feature-Flags und Grenzen fuer das Sammeln.
 TRUTHY = {"1", "true", "t", "y", "yes", "ja", "j"}
 EXPORT_CSV = str(os.getenv("EXPORT_CSV", "true")).lower() in TRUTHY
@@ -497,6 +1032,10 @@ EMPTY_SEARCH_TTL_HOURS = float(os.getenv("EMPTY_SEARCH_TTL_HOURS", "0") or 0)
 EMPTY_SEARCH_CACHE_PATH = Path(
     os.getenv("EMPTY_SEARCH_CACHE_PATH", "generated/empty_search_cache.json")
 )
+CACHE_DB_PATH = Path(os.getenv("CACHE_DB_PATH", "generated/collector_cache.sqlite"))
+AGGREGATOR_LINK_CACHE_TTL_HOURS = float(
+    os.getenv("AGGREGATOR_LINK_CACHE_TTL_HOURS", "0") or 0
+)
 TIMING_ENABLED = str(os.getenv("TIMING_ENABLED", "false")).lower() in TRUTHY
 FILTER_STATS = str(os.getenv("FILTER_STATS", "false")).lower() in TRUTHY
 SELENIUM_WORKERS = int(os.getenv("SELENIUM_WORKERS", "1") or 1)
@@ -506,16 +1045,8 @@ SELENIUM_FUTURE_TIMEOUT_SEC = float(os.getenv("SELENIUM_FUTURE_TIMEOUT_SEC", "24
 COLLECT_RUN_DEADLINE_SEC = float(os.getenv("COLLECT_RUN_DEADLINE_SEC", "240") or 240)
 COLLECT_RAW_CAP_MULTIPLIER = int(os.getenv("COLLECT_RAW_CAP_MULTIPLIER", "2") or 2)
 ALLOWED_LOCATION_BOOST = int(os.getenv("ALLOWED_LOCATION_BOOST", "2") or 2)
-ALLOWED_LOCATIONS = {
-    x.strip().lower()
-    for x in (os.getenv("ALLOWED_LOCATIONS", "") or "").split(",")
-    if x.strip()
-}
-HARD_ALLOWED_LOCATIONS = {
-    x.strip().lower()
-    for x in (os.getenv("HARD_ALLOWED_LOCATIONS", "") or "").split(",")
-    if x.strip()
-}
+ALLOWED_LOCATIONS = set(_env_csv("ALLOWED_LOCATIONS", lower=True))
+HARD_ALLOWED_LOCATIONS = set(_env_csv("HARD_ALLOWED_LOCATIONS", lower=True))
 COMMUTE_MINUTES = _parse_commute_map(os.getenv("COMMUTE_MINUTES", "") or "")
 try:
     COMMUTE_PENALTY_MIN = int(os.getenv("COMMUTE_PENALTY_MIN", "75") or 75)
@@ -528,33 +1059,11 @@ except Exception:
 AUTO_FIT_ENABLED = str(os.getenv("AUTO_FIT_ENABLED", "false")).lower() in TRUTHY
 MIN_SCORE_APPLY = float(os.getenv("MIN_SCORE_APPLY", "1") or 1)
 
-BLACKLIST = {
-    x.strip().lower()
-    for x in (os.getenv("BLACKLIST_COMPANIES", "") or "").split(",")
-    if x.strip()
-}
-KEYWORD_BLACKLIST = {
-    x.strip().lower()
-    for x in (os.getenv("BLACKLIST_KEYWORDS", "") or "").split(",")
-    if x.strip()
-}
-LANGUAGE_BLOCKLIST = {
-    x.strip().lower()
-    for x in (os.getenv("LANGUAGE_BLOCKLIST", "") or "").split(",")
-    if x.strip()
-}
-REQUIREMENTS_BLOCKLIST = {
-    x.strip().lower()
-    for x in (os.getenv("REQUIREMENTS_BLOCKLIST", "") or "").split(",")
-    if x.strip()
-}
-INCLUDE_KEYWORDS = _normalize_terms(
-    {
-        x.strip()
-        for x in (os.getenv("INCLUDE_KEYWORDS", "") or "").split(",")
-        if x.strip()
-    }
-)
+BLACKLIST = frozenset(_env_csv("BLACKLIST_COMPANIES", lower=True))
+KEYWORD_BLACKLIST = set(_env_csv("BLACKLIST_KEYWORDS", lower=True))
+LANGUAGE_BLOCKLIST = set(_env_csv("LANGUAGE_BLOCKLIST", lower=True))
+REQUIREMENTS_BLOCKLIST = set(_env_csv("REQUIREMENTS_BLOCKLIST", lower=True))
+INCLUDE_KEYWORDS = _normalize_terms(set(_env_csv("INCLUDE_KEYWORDS")))
 BLOCKLIST_TERMS = _normalize_terms(
     KEYWORD_BLACKLIST | LANGUAGE_BLOCKLIST | REQUIREMENTS_BLOCKLIST | get_cv_blocklist_terms()
 )
@@ -569,25 +1078,23 @@ AGGREGATOR_VALIDATE_TIMEOUT = float(
 AGGREGATOR_VALIDATE_MAX_BYTES = int(
     os.getenv("AGGREGATOR_VALIDATE_MAX_BYTES", "20000") or 20000
 )
-DISABLED_SOURCES = {
-    _normalize_source_name(x)
-    for x in (os.getenv("DISABLED_SOURCES", "") or "").split(",")
-    if _normalize_source_name(x)
-}
+AGGREGATOR_VALIDATE_HEAD = (
+    str(os.getenv("AGGREGATOR_VALIDATE_HEAD", "true")).lower() in TRUTHY
+)
+AGGREGATOR_VALIDATE_HTTPX = (
+    str(os.getenv("AGGREGATOR_VALIDATE_HTTPX", "false")).lower() in TRUTHY
+)
+_HTTPX_CLIENT = _mk_httpx_client() if AGGREGATOR_VALIDATE_HTTPX else None
+REQUESTS_ADAPTER_HTTPX = (
+    str(os.getenv("REQUESTS_ADAPTER_HTTPX", "false")).lower() in TRUTHY
+)
+DISABLED_SOURCES = _env_source_set("DISABLED_SOURCES")
 BLOCKED_SOURCES = DISABLED_SOURCES | (
     set() if ALLOW_AGGREGATORS else AGGREGATOR_SOURCES
 )
-ENABLED_SOURCES = {
-    _normalize_source_name(x)
-    for x in (
-        os.getenv(
-            "ENABLED_SOURCES",
-            "jobs.ch,jobup.ch,jobscout24,indeed,monster",
-        )
-        or "jobs.ch,jobup.ch,jobscout24,indeed,monster"
-    ).split(",")
-    if _normalize_source_name(x)
-}
+ENABLED_SOURCES = _env_source_set(
+    "ENABLED_SOURCES", "jobs.ch,jobup.ch,jobscout24,indeed,monster"
+)
 if BLOCKED_SOURCES:
     ENABLED_SOURCES = {s for s in ENABLED_SOURCES if s not in BLOCKED_SOURCES}
 EXPAND_QUERY_VARIANTS = str(
@@ -597,16 +1104,8 @@ QUERY_VARIANTS_LIMIT = int(os.getenv("QUERY_VARIANTS_LIMIT", "6") or 6)
 MAX_QUERY_TERMS = int(os.getenv("MAX_QUERY_TERMS", "8") or 8)
 QUERY_BATCH_SIZE = int(os.getenv("QUERY_BATCH_SIZE", "1") or 1)
 QUERY_BATCH_JOINER = os.getenv("QUERY_BATCH_JOINER", " OR ")
-QUERY_BATCH_SOURCES = {
-    _normalize_source_name(x)
-    for x in (os.getenv("QUERY_BATCH_SOURCES", "") or "").split(",")
-    if _normalize_source_name(x)
-}
-EXTRA_QUERY_TERMS = [
-    x.strip()
-    for x in (os.getenv("EXTRA_QUERY_TERMS", "") or "").split(",")
-    if x.strip()
-]
+QUERY_BATCH_SOURCES = _env_source_set("QUERY_BATCH_SOURCES")
+EXTRA_QUERY_TERMS = _env_csv("EXTRA_QUERY_TERMS")
 COLLECT_LIMIT_PER_SITE = int(os.getenv("COLLECT_LIMIT_PER_SITE", "25") or 25)
 COLLECT_MAX_TOTAL = int(os.getenv("COLLECT_MAX_TOTAL", "100") or 100)
 DETAILS_BLOCKLIST_SCAN = str(
@@ -636,11 +1135,7 @@ DETAILS_INCLUDE_TIMEOUT = float(
     os.getenv("DETAILS_INCLUDE_TIMEOUT", DETAILS_BLOCKLIST_TIMEOUT)
     or DETAILS_BLOCKLIST_TIMEOUT
 )
-DETAILS_BLOCKLIST_SKIP_DOMAINS = {
-    x.strip().lower()
-    for x in (os.getenv("DETAILS_BLOCKLIST_SKIP_DOMAINS", "") or "").split(",")
-    if x.strip()
-}
+DETAILS_BLOCKLIST_SKIP_DOMAINS = set(_env_csv("DETAILS_BLOCKLIST_SKIP_DOMAINS", lower=True))
 DETAILS_CONTACT_SCAN = str(
     os.getenv("DETAILS_CONTACT_SCAN", "false")
 ).lower() in TRUTHY
@@ -653,15 +1148,11 @@ DETAILS_CONTACT_MAX_JOBS = int(
 DETAILS_CONTACT_TIMEOUT = float(
     os.getenv("DETAILS_CONTACT_TIMEOUT", "12") or 12
 )
+DETAILS_HOST_INTERVAL_SEC = float(os.getenv("DETAILS_HOST_INTERVAL_SEC", "0") or 0)
 ALLOW_REMOTE = str(os.getenv("ALLOW_REMOTE", "true")).lower() in TRUTHY
-REMOTE_KEYWORDS = [
-    x.strip().lower()
-    for x in (
-        os.getenv("REMOTE_KEYWORDS", "remote,homeoffice,home office,hybrid,hybride")
-        or ""
-    ).split(",")
-    if x.strip()
-]
+REMOTE_KEYWORDS = _env_csv(
+    "REMOTE_KEYWORDS", "remote,homeoffice,home office,hybrid,hybride", lower=True
+)
 TRANSIT_ENABLED = str(os.getenv("TRANSIT_ENABLED", "false")).lower() in TRUTHY
 TRANSIT_ORIGIN = os.getenv("TRANSIT_ORIGIN", "").strip()
 TRANSIT_MAX_MINUTES = int(os.getenv("TRANSIT_MAX_MINUTES", "60") or 60)
@@ -669,39 +1160,38 @@ TRANSIT_TIME = os.getenv("TRANSIT_TIME", "").strip()
 TRANSIT_DATE = os.getenv("TRANSIT_DATE", "").strip()
 TRANSIT_TIMEOUT = float(os.getenv("TRANSIT_TIMEOUT", "12") or 12)
 TRANSIT_REQUEST_DELAY = float(os.getenv("TRANSIT_REQUEST_DELAY", "0.5") or 0.5)
+TRANSIT_CACHE_TTL_HOURS = float(os.getenv("TRANSIT_CACHE_TTL_HOURS", "0") or 0)
+DETAILS_CACHE_TTL_HOURS = float(os.getenv("DETAILS_CACHE_TTL_HOURS", "0") or 0)
+# Blocklist-Urteile haengen nur an Seite + Begriffs-Hash: eigene (meist laengere) TTL moeglich.
+DETAILS_BLOCKLIST_CACHE_TTL_HOURS = float(
+    os.getenv("DETAILS_BLOCKLIST_CACHE_TTL_HOURS", "") or DETAILS_CACHE_TTL_HOURS
+)
+
+# Obergrenze je In-Memory-Detail-Cache ueber mehrere Laeufe (Scheduler-Betrieb); 0 = unbegrenzt.
+DETAILS_MEMORY_CACHE_MAX = int(os.getenv("DETAILS_MEMORY_CACHE_MAX", "5000") or 0)
 
-# In-Memory-Caches fuer Detail-Scans und Checks.
+# In-Memory-Caches fuer Detail-Scans und Checks. Nur der Hauptprozess liest/schreibt sie:
+# _selenium_worker liefert bloss Trefferzeilen, Detail-Scans laufen danach im Filter.
 DETAILS_BLOCKLIST_CACHE: dict[str, bool] = {}
 DETAILS_INCLUDE_CACHE: dict[str, bool] = {}
 DETAILS_TEXT_CACHE: dict[str, str] = {}
 DETAILS_LOCATION_CACHE: dict[str, str] = {}
 DETAILS_CONTACT_CACHE: dict[str, tuple[str, str]] = {}
+# Fehlgeschlagene Kontakt-Scans: bleiben im Lauf gecacht, werden aber nicht persistiert.
+DETAILS_CONTACT_FAILED: set[str] = set()
 TRANSIT_CACHE: dict[tuple[str, str, str, str], int | None] = {}
 AGGREGATOR_LINK_CACHE: dict[str, bool] = {}
+_AGGREGATOR_LINK_LOCK = threading.Lock()
 COMPANY_CAREERS_ENABLED = str(
     os.getenv("COMPANY_CAREERS_ENABLED", "false")
 ).lower() in TRUTHY
-COMPANY_CAREER_URLS = [
-    x.strip()
-    for x in (os.getenv("COMPANY_CAREER_URLS", "") or "").split(",")
-    if x.strip()
-]
-COMPANY_CAREER_NAMES = [
-    x.strip()
-    for x in (os.getenv("COMPANY_CAREER_NAMES", "") or "").split(",")
-    if x.strip()
-]
-CAREER_LINK_KEYWORDS = [
-    x.strip().lower()
-    for x in (
-        os.getenv(
-            "CAREER_LINK_KEYWORDS",
-            "career,karriere,stellen,job,jobs,position,positions,vacancy,vacancies",
-        )
-        or ""
-    ).split(",")
-    if x.strip()
-]
+COMPANY_CAREER_URLS = _env_csv("COMPANY_CAREER_URLS")
+COMPANY_CAREER_NAMES = _env_csv("COMPANY_CAREER_NAMES")
+CAREER_LINK_KEYWORDS = _env_csv(
+    "CAREER_LINK_KEYWORDS",
+    "career,karriere,stellen,job,jobs,position,positions,vacancy,vacancies",
+    lower=True,
+)
 CAREER_MAX_LINKS = int(os.getenv("CAREER_MAX_LINKS", "40") or 40)
 CAREER_MIN_SCORE = int(os.getenv("CAREER_MIN_SCORE", "0") or 0)
 
@@ -780,6 +1270,13 @@ class _AnchorParser(HTMLParser):
 
 def _extract_links(html: str) -> List[Tuple[str, str]]:
     # Alle Anchor-Hrefs + Text extrahieren.
+    if _LexborHTMLParser is not None:
+        links: List[Tuple[str, str]] = []
+        for a in _LexborHTMLParser(html or "").css("a[href]"):
+            href = a.attributes.get("href") or ""
+            if href:
+                links.append((href, " ".join((a.text() or "").split())))
+        return links
     parser = _AnchorParser()
     parser.feed(html or "")
     return parser.links
@@ -807,7 +1304,7 @@ def _collect_company_careers(urls: List[str], names: List[str]) -> List[Job]:
     for idx, url in enumerate(urls):
         company = names[idx] if idx < len(names) and names[idx] else _company_name_from_url(url)
         try:
-            resp = requests.get(
+            resp = _HTTP_SESSION.get(
                 url,
                 headers={"User-Agent": "Bewerbungsagent/1.0 (+company-scan)"},
                 timeout=15,
@@ -862,26 +1359,33 @@ def _collect_company_careers(urls: List[str], names: List[str]) -> List[Job]:
     return jobs
 
 
-def _location_boost(job_location: str, search_locations: List[str]) -> int:
-    # Bonus, wenn Standort zu Suchorten passt.
-    jl = _normalize_text(job_location or "")
-    return (
-        1
-        if any(_normalize_text(loc) in jl for loc in (search_locations or []) if loc)
-        else 0
-    )
+def _location_boost(job_location: str, search_terms: frozenset[str]) -> int:
+    # Bonus, wenn Standort zu Suchorten passt (Suchorte einmal pro Lauf via _normalize_terms).
+    return 1 if _any_term_in(_normalize_text(job_location or ""), search_terms) else 0
+
+
+def _job_norm_blob(job: Job, fields: tuple[str, ...]) -> str:
+    # Normalisierter Text aus Job-Feldern; gleich wie _normalize_text(" ".join(...)),
+    # aber jedes Feld trifft den _normalize_text-Cache (Titel etc. nur einmal pro Job).
+    parts = (_normalize_text(getattr(job, f) or "") for f in fields)
+    return " ".join(p for p in parts if p)
+
+
+@cache
+def _remote_terms() -> frozenset[str]:
+    # Remote-Keywords einmal normalisieren (REMOTE_KEYWORDS ist nach dem Import fix).
+    return _normalize_terms(REMOTE_KEYWORDS)
 
 
 def _is_remote(job: Job) -> bool:
     # Remote-Job anhand Keywords erkennen.
     if not REMOTE_KEYWORDS:
         return False
-    blob = " ".join([job.location or "", job.title or "", job.raw_title or ""])
-    normalized = _normalize_text(blob)
-    return any(_normalize_text(k) in normalized for k in REMOTE_KEYWORDS)
+    normalized = _job_norm_blob(job, ("location", "title", "raw_title"))
+    return _any_term_in(normalized, _remote_terms())
 
 
-def _tokens_in_order(tokens: list[str], terms: list[str]) -> bool:
+def _tokens_in_order(tokens: list[str], terms: tuple[str, ...] | list[str]) -> bool:
     # Pruefen, ob Term-Tokens in Reihenfolge vorkommen.
     if not tokens or not terms:
         return False
@@ -894,17 +1398,25 @@ def _tokens_in_order(tokens: list[str], terms: list[str]) -> bool:
     return False
 
 
+@lru_cache(maxsize=32)
+def _multiword_terms(blocked: frozenset[str]) -> tuple[tuple[str, ...], ...]:
+    # Mehrwort-Begriffe einmal pro Blocklist in Tokens zerlegen.
+    return tuple(tuple(term.split()) for term in blocked if " " in term and term.split())
+
+
 def _contains_blocked_terms(normalized: str, blocked: set[str]) -> bool:
     # Blockierte Begriffe im Text finden.
     if not normalized or not blocked:
         return False
-    if any(term in normalized for term in blocked):
+    # frozenset() auf ein frozenset liefert dasselbe Objekt: kein Neuaufbau, Hash bleibt gecacht.
+    frozen = frozenset(blocked)
+    if _any_term_in(normalized, frozen):
         return True
+    multiword = _multiword_terms(frozen)
+    if not multiword:
+        return False
     tokens = normalized.split()
-    for term in blocked:
-        if " " not in term:
-            continue
-        term_tokens = [t for t in term.split() if t]
+    for term_tokens in multiword:
         if _tokens_in_order(tokens, term_tokens):
             return True
     return False
@@ -914,38 +1426,29 @@ def _has_blocked_keywords(job: Job, blocked: set[str]) -> bool:
     # Jobtext gegen Blocklist pruefen.
     if not blocked:
         return False
-    blob = " ".join([job.title or "", job.raw_title or "", job.location or ""])
-    normalized = _normalize_text(blob)
+    normalized = _job_norm_blob(job, ("title", "raw_title", "location"))
     return _contains_blocked_terms(normalized, blocked)
 
 
+@lru_cache(maxsize=32)
+def _split_required_terms(required: frozenset[str]) -> tuple[frozenset[str], frozenset[str]]:
+    # Kurze Begriffe (<= 2 Zeichen) nur als ganzes Token, laengere als Teilstring.
+    short_terms = frozenset(t for t in required if t and len(t) <= 2)
+    long_terms = frozenset(t for t in required if len(t) > 2)
+    return short_terms, long_terms
+
+
 def _has_required_keywords(job: Job, required: set[str]) -> bool:
     # Jobtext gegen Required-Keywords pruefen.
     if not required:
         return True
-    blob = " ".join(
-        [
-            job.title or "",
-            job.raw_title or "",
-            job.company or "",
-            job.location or "",
-            job.link or "",
-        ]
-    )
-    normalized = _normalize_text(blob)
+    normalized = _job_norm_blob(job, ("title", "raw_title", "company", "location", "link"))
     if not normalized:
         return False
-    tokens = set(normalized.split())
-    for term in required:
-        if not term:
-            continue
-        if len(term) <= 2:
-            if term in tokens:
-                return True
-        else:
-            if term in normalized:
-                return True
-    return False
+    short_terms, long_terms = _split_required_terms(frozenset(required))
+    if short_terms and not short_terms.isdisjoint(normalized.split()):
+        return True
+    return _any_term_in(normalized, long_terms)
 
 
 _DURATION_RE = re.compile(r"(?:(\d+)d)?(\d{1,2}):(\d{2}):(\d{2})")
@@ -986,7 +1489,7 @@ def _get_transit_minutes(
         time.sleep(TRANSIT_REQUEST_DELAY - elapsed)
     try:
         _transit_last_request = time.time()
-        resp = requests.get(
+        resp = _HTTP_SESSION.get(
             "https://transport.opendata.ch/v1/connections",
             params=params,
             timeout=TRANSIT_TIMEOUT,
@@ -998,7 +1501,7 @@ def _get_transit_minutes(
             )
             time.sleep(retry_after)
             _transit_last_request = time.time()
-            resp = requests.get(
+            resp = _HTTP_SESSION.get(
                 "https://transport.opendata.ch/v1/connections",
                 params=params,
                 timeout=TRANSIT_TIMEOUT,
@@ -1021,6 +1524,8 @@ def _get_transit_minutes(
         return None
 
 
+# HTML-Regexe bleiben bei stdlib-re: das regex-Modul ist hier ~2x langsamer (kein JIT),
+# Primaerpfad ist ohnehin lexbor; Blocklist-Suchen laufen ueber _term_automaton.
 _SCRIPT_STYLE_RE = re.compile(r"(?is)<(script|style)[^>]*>.*?</\1>")
 _TAG_RE = re.compile(r"(?is)<[^>]+>")
 _NOISE_SECTION_RE = re.compile(
@@ -1031,33 +1536,38 @@ _JSONLD_SCRIPT_RE = re.compile(
     r'(?is)<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
 )
 _EMAIL_RE = re.compile(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.I)
+_MAILTO_OR_EMAIL_RE = re.compile(
+    r"""href\s*=\s*["']?\s*mailto:([^"'>\s]*)|([A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,})""",
+    re.I,
+)
 _EMAIL_HINTS = ("bewerbung", "recruit", "hr", "jobs", "career")
 _EMAIL_DOMAIN_BLOCKLIST = {"jobs.ch", "jobup.ch", "indeed.com"}
-_CONTACT_LABEL_RE = re.compile(
-    r"(ansprech(?:partner|person)(?:/in)?|kontakt(?:person)?|contact|bewerbung|recruiter)",
-    re.IGNORECASE,
+_CONTACT_LABEL_PATTERN = (
+    r"(ansprech(?:partner|person)(?:/in)?|kontakt(?:person)?|contact|bewerbung|recruiter)"
 )
+_CONTACT_LABEL_RE = re.compile(_CONTACT_LABEL_PATTERN, re.IGNORECASE)
+# Fuer bereits kleingeschriebenen Text: ohne IGNORECASE deutlich schneller.
+_CONTACT_LABEL_LOWER_RE = re.compile(_CONTACT_LABEL_PATTERN)
 
 
 def _extract_emails_from_html(html: str) -> List[str]:
     # E-Mails aus HTML/Links extrahieren und filtern.
     if not html:
         return []
-    candidates: List[str] = []
-    for href, _text in _extract_links(html):
-        if not href:
-            continue
-        href_l = href.strip().lower()
-        if not href_l.startswith("mailto:"):
+    # Ein Regex-Durchlauf: mailto-Hrefs und freie Adressen; mailto-Treffer bleiben vorne.
+    mailto: List[str] = []
+    plain: List[str] = []
+    for m in _MAILTO_OR_EMAIL_RE.finditer(html):
+        value = m.group(1)
+        if value is None:
+            plain.append(m.group(2).strip(" \t\r\n,.;:"))
             continue
-        addr = href.split(":", 1)[1].split("?", 1)[0].strip()
+        addr = unescape(value).split("?", 1)[0].strip()
         addr = addr.strip(" \t\r\n,.;:")
         if addr:
-            candidates.append(addr)
-
-    for email in _EMAIL_RE.findall(html):
-        if email:
-            candidates.append(email.strip(" \t\r\n,.;:"))
+            mailto.append(addr)
+        plain.extend(e.strip(" \t\r\n,.;:") for e in _EMAIL_RE.findall(value))
+    candidates = mailto + plain
 
     seen = set()
     out: List[str] = []
@@ -1084,18 +1594,27 @@ def _pick_email(candidates: List[str]) -> str:
     return candidates[0]
 
 
+_HTML_LINES_RE = re.compile(
+    r"(?is)<(script|style)[^>]*>.*?</\1>"
+    r"|(<br\s*/?>|</(?:p|div|li|tr|section|article)>)"
+    r"|<[^>]+>"
+)
+
+
+def _html_lines_repl(m: re.Match) -> str:
+    return "\n" if m.group(2) else " "
+
+
 def _html_to_lines(html: str) -> List[str]:
     # HTML in bereinigte Textzeilen umwandeln.
     if not html:
         return []
-    text = re.sub(r"(?i)<br\s*/?>", "\n", html)
-    text = re.sub(r"(?i)</(p|div|li|tr|section|article)>", "\n", text)
-    text = _SCRIPT_STYLE_RE.sub(" ", text)
-    text = _TAG_RE.sub(" ", text)
+    # Ein Durchlauf: Zeilenumbruch fuer <br>/Block-Enden, Leerzeichen fuer Script/Style/Tags.
+    text = _HTML_LINES_RE.sub(_html_lines_repl, html)
     text = unescape(text)
     lines: List[str] = []
     for line in text.splitlines():
-        clean = re.sub(r"\s+", " ", line).strip()
+        clean = _WS_RE.sub(" ", line).strip()
         if clean:
             lines.append(clean)
     return lines
@@ -1130,9 +1649,19 @@ def _clean_contact_line(line: str) -> str:
 
 def _extract_contact_name(lines: List[str]) -> str:
     # Kontaktname anhand von Label + Folgelinien suchen.
-    for idx, line in enumerate(lines):
-        if not _CONTACT_LABEL_RE.search(line):
+    # Labels in einem Regex-Durchlauf ueber alle Zeilen finden statt search() pro Zeile;
+    # lower() aendert keine Zeilenumbrueche, die Zeilennummer bleibt also gueltig.
+    joined = "\n".join(lines).lower()
+    idx = 0
+    pos = 0
+    last_idx = -1
+    for match in _CONTACT_LABEL_LOWER_RE.finditer(joined):
+        idx += joined.count("\n", pos, match.start())
+        pos = match.start()
+        if idx == last_idx:
             continue
+        last_idx = idx
+        line = lines[idx]
         candidate = _clean_contact_line(line)
         if _looks_like_name(candidate):
             return candidate
@@ -1145,6 +1674,47 @@ def _extract_contact_name(lines: List[str]) -> str:
     return ""
 
 
+_DETAIL_HOST_NEXT: dict[str, float] = {}
+_DETAIL_HOST_LOCK = threading.Lock()
+
+
+def _wait_for_host_slot(url: str) -> None:
+    # Mindestabstand je Host fuer Detailseiten (DETAILS_HOST_INTERVAL_SEC, 0 = aus).
+    if DETAILS_HOST_INTERVAL_SEC <= 0:
+        return
+    host = urlparse(url).netloc.lower()
+    with _DETAIL_HOST_LOCK:
+        now = time.monotonic()
+        slot = max(now, _DETAIL_HOST_NEXT.get(host, 0.0))
+        _DETAIL_HOST_NEXT[host] = slot + DETAILS_HOST_INTERVAL_SEC
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def _fetch_capped_text(url: str, user_agent: str, timeout: float, max_bytes: int) -> str:
+    # Seite streamen und nach max_bytes abbrechen (0 = alles); erst danach dekodieren.
+    _wait_for_host_slot(url)
+    resp = _HTTP_SESSION.get(
+        url,
+        headers={"User-Agent": user_agent},
+        timeout=timeout,
+        stream=True,
+    )
+    try:
+        resp.raise_for_status()
+        buf = bytearray()
+        for chunk in resp.iter_content(chunk_size=8192):
+            if not chunk:
+                continue
+            buf.extend(chunk)
+            if max_bytes and len(buf) >= max_bytes:
+                del buf[max_bytes:]
+                break
+        return buf.decode(resp.encoding or "utf-8", errors="replace")
+    finally:
+        resp.close()
+
+
 def _detail_page_contact(url: str) -> Tuple[str, str]:
     # Detailseite scannen und Kontaktinfos cachen.
     if not url:
@@ -1152,17 +1722,15 @@ def _detail_page_contact(url: str) -> Tuple[str, str]:
     if url in DETAILS_CONTACT_CACHE:
         return DETAILS_CONTACT_CACHE[url]
     try:
-        resp = requests.get(
+        text = _fetch_capped_text(
             url,
-            headers={"User-Agent": "Bewerbungsagent/1.0 (+contact-scan)"},
-            timeout=DETAILS_CONTACT_TIMEOUT,
+            "Bewerbungsagent/1.0 (+contact-scan)",
+            DETAILS_CONTACT_TIMEOUT,
+            DETAILS_CONTACT_MAX_BYTES,
         )
-        resp.raise_for_status()
-        text = resp.text or ""
-        if DETAILS_CONTACT_MAX_BYTES and len(text) > DETAILS_CONTACT_MAX_BYTES:
-            text = text[:DETAILS_CONTACT_MAX_BYTES]
     except Exception as e:
         job_logger.warning(f"Contact-Scan Fehler ({url}): {e}")
+        DETAILS_CONTACT_FAILED.add(url)
         DETAILS_CONTACT_CACHE[url] = ("", "")
         return "", ""
 
@@ -1197,6 +1765,33 @@ def _detail_page_has_blocked_terms(url: str, blocked: set[str]) -> bool:
     return blocked_found
 
 
+def _interleave_by_host(urls: List[str]) -> List[str]:
+    # Reihum je Host einsortieren, damit parallele Worker nicht alle denselben Server treffen.
+    slices: dict[str, List[str]] = {}
+    for url in urls:
+        slices.setdefault(urlparse(url).netloc.lower(), []).append(url)
+    if len(slices) <= 1:
+        return list(urls)
+    out: List[str] = []
+    queues = list(slices.values())
+    for i in range(max(map(len, queues))):
+        out.extend(q[i] for q in queues if i < len(q))
+    return out
+
+
+def _prefetch_details(urls: List[str], fetch) -> None:
+    # Detailseiten parallel in die Caches laden (IO-bound); der Filter liest danach nur den Cache.
+    if not urls:
+        return
+    ordered = _interleave_by_host(urls)
+    with ThreadPoolExecutor(max_workers=max(1, min(REQUESTS_ADAPTER_WORKERS, len(urls)))) as ex:
+        for fut in as_completed([ex.submit(fetch, url) for url in ordered]):
+            try:
+                fut.result()
+            except Exception:
+                continue
+
+
 def _extract_jobposting_payload(html: str) -> tuple[str, str]:
     chunks: list[str] = []
     locations: list[str] = []
@@ -1271,7 +1866,32 @@ def _extract_jobposting_location(html: str) -> str:
     return _extract_jobposting_payload(html)[1]
 
 
+_DETAIL_NOISE_TAGS = ["script", "style", "header", "nav", "footer", "aside", "form", "noscript", "svg"]
+
+
+def _extract_primary_html_text_lexbor(html: str) -> str:
+    # Wie _extract_primary_html_text, aber mit dem lexbor-C-Parser statt Regex-Ketten.
+    tree = _LexborHTMLParser(html)
+    tree.strip_tags(_DETAIL_NOISE_TAGS)
+    fragments = []
+    for node in tree.css("main, article"):
+        parent = node.parent
+        while parent is not None and parent.tag not in ("main", "article"):
+            parent = parent.parent
+        if parent is None:
+            fragments.append(node.text(separator=" "))
+    if fragments:
+        return " ".join(fragments)
+    root = tree.root
+    return root.text(separator=" ") if root is not None else ""
+
+
 def _extract_primary_html_text(html: str) -> str:
+    if _LexborHTMLParser is not None and html:
+        try:
+            return _extract_primary_html_text_lexbor(html)
+        except Exception:
+            pass
     cleaned = _SCRIPT_STYLE_RE.sub(" ", html or "")
     cleaned = _NOISE_SECTION_RE.sub(" ", cleaned)
     fragments = [m.group(2) for m in _MAIN_ARTICLE_RE.finditer(cleaned)]
@@ -1280,18 +1900,17 @@ def _extract_primary_html_text(html: str) -> str:
     return unescape(source)
 
 
-def _extract_relevant_detail_text(html: str) -> str:
-    jsonld_text = _extract_jobposting_text(html)
+def _extract_relevant_detail_text(html: str, jsonld_text: str | None = None) -> str:
+    if jsonld_text is None:
+        jsonld_text = _extract_jobposting_text(html)
     if jsonld_text.strip():
         return jsonld_text
     return _extract_primary_html_text(html)
 
 
-def _infer_location_from_normalized_text(normalized: str) -> str:
-    # Standort heuristisch aus Detailtext ableiten.
-    if not normalized:
-        return ""
-
+@cache
+def _location_candidates() -> tuple[tuple[str, str], ...]:
+    # Snapshot der Orts-Kandidaten aus Config/ENV (einmal gebaut, laengste zuerst).
     candidates: list[tuple[str, str]] = []
     seen: set[str] = set()
 
@@ -1314,8 +1933,15 @@ def _infer_location_from_normalized_text(normalized: str) -> str:
         candidates.append((needle_norm, display))
 
     candidates.sort(key=lambda item: len(item[0]), reverse=True)
-    for needle, display in candidates:
-        if needle and needle in normalized:
+    return tuple(candidates)
+
+
+def _infer_location_from_normalized_text(normalized: str) -> str:
+    # Standort heuristisch aus Detailtext ableiten.
+    if not normalized:
+        return ""
+    for needle, display in _location_candidates():
+        if needle in normalized:
             return display
     return ""
 
@@ -1331,17 +1957,13 @@ def _detail_page_payload(url: str, timeout: float, max_bytes: int) -> tuple[str,
         DETAILS_LOCATION_CACHE[url] = ""
         return "", ""
     try:
-        resp = requests.get(
-            url,
-            headers={"User-Agent": "Bewerbungsagent/1.0 (+detail-scan)"},
-            timeout=timeout,
-        )
-        resp.raise_for_status()
-        text = resp.text or ""
-        if max_bytes and len(text) > max_bytes:
-            text = text[:max_bytes]
-        normalized = _normalize_text(_extract_relevant_detail_text(text))
-        location = _extract_jobposting_location(text).strip()
+        text = _fetch_capped_text(url, "Bewerbungsagent/1.0 (+detail-scan)", timeout, max_bytes)
+        # JSON-LD nur einmal suchen/parsen; liefert Text und Ort zugleich.
+        jsonld_text, location = _extract_jobposting_payload(text)
+        relevant = _extract_relevant_detail_text(text, jsonld_text)
+        # Seitentexte sind einmalig und gross: am LRU-Cache vorbei normalisieren.
+        normalized = _normalize_text.__wrapped__(relevant)
+        location = location.strip()
         if not location:
             location = _infer_location_from_normalized_text(normalized)
         DETAILS_TEXT_CACHE[url] = normalized
@@ -1409,44 +2031,58 @@ def _is_skipped_detail_domain(url: str) -> bool:
     return False
 
 
-def _is_local(job: Job, search_locations: List[str]) -> bool:
+@lru_cache(maxsize=32)
+def _location_terms(locations: frozenset[str]) -> frozenset[str]:
+    # Orte einmal normalisieren (leere Begriffe fallen weg).
+    return frozenset(t for t in map(_normalize_text, locations) if t)
+
+
+def _location_text(job: Job) -> str:
+    # Ort/Titel/Rohtitel normalisiert; "\x1f" trennt die Felder, damit kein Treffer
+    # ueber Feldgrenzen entsteht (normalisierter Text enthaelt nie "\x1f").
+    return "\x1f".join(
+        (
+            _normalize_text(job.location or ""),
+            _normalize_text(job.title or ""),
+            _normalize_text(job.raw_title or ""),
+        )
+    )
+
+
+def _matches_location_terms(job: Job, locations, location_text: str | None = None) -> bool:
+    # Alle Orte in einem Durchlauf ueber den Feldtext pruefen.
+    terms = _location_terms(frozenset(locations))
+    if not terms:
+        return False
+    if location_text is None:
+        location_text = _location_text(job)
+    return _any_term_in(location_text, terms)
+
+
+def _is_local(job: Job, search_locations: List[str], location_text: str | None = None) -> bool:
     # Job mit Suchorten abgleichen.
     if not search_locations:
         return True
-    texts = [
-        _normalize_text(job.location or ""),
-        _normalize_text(job.title or ""),
-        _normalize_text(job.raw_title or ""),
-    ]
-    for loc in search_locations:
-        lo = _normalize_text(loc)
-        if lo and any(lo in t for t in texts):
-            return True
-    return False
+    return _matches_location_terms(job, search_locations, location_text)
 
 
-def _is_allowed_location(job: Job, allowed: set[str]) -> bool:
+def _is_allowed_location(job: Job, allowed: set[str], location_text: str | None = None) -> bool:
     # Job gegen erlaubte Orte pruefen.
     if not allowed:
         return True
-    texts = [
-        _normalize_text(job.location or ""),
-        _normalize_text(job.title or ""),
-        _normalize_text(job.raw_title or ""),
-    ]
-    for a in allowed:
-        aa = _normalize_text(a)
-        if aa and any(aa in t for t in texts):
-            return True
-    return False
+    return _matches_location_terms(job, allowed, location_text)
 
 
-def _norm_key(title: str, company: str, link: str) -> str:
-    # Dedupe-Schluessel aus Titel/Firma/Link.
-    t = re.sub(r"\W+", "", (title or "").lower())
-    c = re.sub(r"\W+", "", (company or "").lower())
-    lnk = re.sub(r"[?#].*$", "", (link or "").lower())
-    return f"{t}|{c}|{lnk}"
+_NON_WORD_RE = re.compile(r"\W+")
+_QUERY_FRAGMENT_RE = re.compile(r"[?#].*$")
+
+
+def _norm_key(title: str, company: str, link: str) -> tuple[str, str, str]:
+    # Dedupe-Schluessel aus Titel/Firma/Link (Tupel statt zusammengesetztem String).
+    t = _NON_WORD_RE.sub("", (title or "").lower())
+    c = _NON_WORD_RE.sub("", (company or "").lower())
+    lnk = _QUERY_FRAGMENT_RE.sub("", (link or "").lower())
+    return t, c, lnk
 
 
 def export_json(rows: List[Job], path: str | None = None) -> None:
@@ -1461,7 +2097,7 @@ def export_json(rows: List[Job], path: str | None = None) -> None:
         raw_title = j.raw_title
 
         if (not company or not location) and (raw_title or title):
-            t2, c2, l2 = extract_from_multiline_title(raw_title or title)
+            t2, c2, l2 = _parse_multiline_title(raw_title or title)
             if t2:
                 title = t2
             if not company and c2:
@@ -1485,7 +2121,82 @@ def export_json(rows: List[Job], path: str | None = None) -> None:
                 "contact_name": getattr(j, "contact_name", ""),
             }
         )
-    out_path.write_text(json.dumps(serializable, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        payload = orjson.dumps(serializable, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(serializable, ensure_ascii=False, indent=2).encode("utf-8")
+    out_path.write_bytes(payload)
+
+
+# Alle Indeed-Karten in einem WebDriver-Roundtrip auslesen (statt 3 find_element pro Karte).
+# title = null, wenn span.jobTitle fehlt (dann wie bisher der ganze Kartentext).
+INDEED_CARDS_JS = """
+const limit = arguments[0];
+let cards = Array.from(document.querySelectorAll('a.tapItem'));
+if (limit !== null && limit !== undefined) cards = cards.slice(0, limit);
+const text = (el) => (el ? el.innerText || '' : null);
+return cards.map((a) => ({
+  title: text(a.querySelector('span.jobTitle')),
+  text: a.innerText || '',
+  company: text(a.querySelector('span.companyName')) || '',
+  location: text(a.querySelector('div.companyLocation')) || '',
+  link: a.href || '',
+}));
+"""
+
+
+# Indeed: Karten/Container signalisieren Ergebnisse, Captcha-Frames eine Sperrseite.
+INDEED_WAIT_SECONDS = float(os.getenv("INDEED_WAIT_SECONDS", "4") or 4)
+INDEED_READY_SELECTOR = "a.tapItem, #mosaic-provider-jobcards"
+INDEED_BLOCK_SELECTOR = (
+    'iframe[src*="hcaptcha"], iframe[src*="captcha"], #challenge-form'
+)
+
+
+def _indeed_wait_state(driver) -> str | bool:
+    # Warten beenden, sobald Ergebnisse oder eine Sperrseite sichtbar sind.
+    # Karten zuerst: auf normalen Seiten fehlt die Sperr-Markierung immer.
+    if driver.find_elements(By.CSS_SELECTOR, INDEED_READY_SELECTOR):
+        return "ready"
+    if driver.find_elements(By.CSS_SELECTOR, INDEED_BLOCK_SELECTOR):
+        return "blocked"
+    return False
+
+
+def _wait_indeed_state(driver) -> str | bool | None:
+    # Poll ohne Implicit Wait (sonst blockiert jedes leere find_elements 5 s); danach zuruecksetzen.
+    try:
+        implicit = driver.timeouts.implicit_wait
+    except Exception:
+        implicit = None
+    try:
+        if implicit:
+            driver.implicitly_wait(0)
+        return WebDriverWait(driver, INDEED_WAIT_SECONDS, poll_frequency=0.25).until(
+            _indeed_wait_state
+        )
+    except Exception:
+        return None
+    finally:
+        if implicit:
+            try:
+                driver.implicitly_wait(implicit)
+            except Exception:
+                pass
+
+
+def _indeed_job(title: str, company: str, location: str, link: str) -> Job:
+    score, label = _score_title(title)
+    return Job(
+        raw_title=title,
+        title=title,
+        company=company,
+        location=location,
+        link=link,
+        source="indeed",
+        score=score,
+        match=label,
+    )
 
 
 def _collect_indeed(
@@ -1497,13 +2208,32 @@ def _collect_indeed(
     jobs: List[Job] = []
     _get_html(driver, url)
 
+    state = _wait_indeed_state(driver)
+    if state == "blocked":
+        job_logger.warning(f"Indeed: Captcha/Sperrseite erkannt, uebersprungen ({url})")
+        return jobs
+
     try:
-        WebDriverWait(driver, 12).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a.tapItem"))
-        )
+        items = driver.execute_script(INDEED_CARDS_JS, limit)
     except Exception:
-        pass
+        items = None
+    if isinstance(items, list):
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            raw = item.get("title")
+            title = _text(raw if raw is not None else item.get("text"))
+            jobs.append(
+                _indeed_job(
+                    title,
+                    _text(item.get("company")),
+                    _text(item.get("location")),
+                    item.get("link") or "",
+                )
+            )
+        return jobs
 
+    # Fallback: Karten einzeln ueber den WebDriver abfragen.
     cards = driver.find_elements(By.CSS_SELECTOR, "a.tapItem")
     card_items = cards if limit is None else cards[:limit]
     for a in card_items:
@@ -1525,20 +2255,7 @@ def _collect_indeed(
             location = ""
 
         link = a.get_attribute("href") or ""
-        score, label = _score_title(title)
-
-        jobs.append(
-            Job(
-                raw_title=title,
-                title=title,
-                company=company,
-                location=location,
-                link=link,
-                source="indeed",
-                score=score,
-                match=label,
-            )
-        )
+        jobs.append(_indeed_job(title, company, location, link))
 
     return jobs
 
@@ -1639,10 +2356,8 @@ def collect_jobs(
             getattr(config, "TITLE_VARIANTS_DE", [])
             + getattr(config, "TITLE_VARIANTS_EN", [])
         )
-        for term in variants[:QUERY_VARIANTS_LIMIT]:
-            if _normalize_text(term) in {_normalize_text(t) for t in query_terms}:
-                continue
-            query_terms.append(term)
+        # Ein Durchlauf mit gemeinsamem seen-Set statt Set-Neubau je Variante.
+        query_terms = _dedupe_terms(query_terms + variants[:QUERY_VARIANTS_LIMIT])
     if MAX_QUERY_TERMS > 0:
         query_terms = query_terms[:MAX_QUERY_TERMS]
 
@@ -1657,20 +2372,61 @@ def collect_jobs(
             _normalize_source_name(s) for s in sources if _normalize_source_name(s)
         }
     empty_cache_ttl_sec = max(0.0, EMPTY_SEARCH_TTL_HOURS * 3600.0)
-    empty_cache: dict[str, float] = {}
-    empty_cache_updates: dict[str, float] = {}
+    empty_cache: dict[EmptyCacheKey, float] = {}
+    empty_cache_updates: dict[EmptyCacheKey, float] = {}
     empty_cache_skips = 0
     cache_now = time.time()
-    if empty_cache_ttl_sec > 0:
-        empty_cache = _prune_empty_search_cache(
-            _load_empty_search_cache(EMPTY_SEARCH_CACHE_PATH),
-            empty_cache_ttl_sec,
-            cache_now,
+    link_cache_ttl_sec = max(0.0, AGGREGATOR_LINK_CACHE_TTL_HOURS * 3600.0)
+    transit_cache_ttl_sec = max(0.0, TRANSIT_CACHE_TTL_HOURS * 3600.0)
+    details_cache_ttl_sec = max(0.0, DETAILS_CACHE_TTL_HOURS * 3600.0)
+    blocklist_cache_ttl_sec = max(0.0, DETAILS_BLOCKLIST_CACHE_TTL_HOURS * 3600.0)
+    cache_db = (
+        _open_cache_db(CACHE_DB_PATH)
+        if empty_cache_ttl_sec > 0
+        or link_cache_ttl_sec > 0
+        or transit_cache_ttl_sec > 0
+        or details_cache_ttl_sec > 0
+        or blocklist_cache_ttl_sec > 0
+        else None
+    )
+    if cache_db is not None and empty_cache_ttl_sec > 0:
+        _import_legacy_empty_search_cache(cache_db, EMPTY_SEARCH_CACHE_PATH)
+        empty_cache = _load_empty_search_cache(cache_db, empty_cache_ttl_sec, cache_now)
+    persisted_links: set[str] = set()
+    if cache_db is not None and link_cache_ttl_sec > 0:
+        loaded_links = _load_aggregator_link_cache(cache_db, link_cache_ttl_sec, cache_now)
+        with _AGGREGATOR_LINK_LOCK:
+            for url, ok in loaded_links.items():
+                AGGREGATOR_LINK_CACHE.setdefault(url, ok)
+        persisted_links = set(loaded_links)
+    persisted_transit: set[tuple[str, str, str, str]] = set()
+    if cache_db is not None and transit_cache_ttl_sec > 0:
+        loaded_transit = _load_transit_cache(cache_db, transit_cache_ttl_sec, cache_now)
+        for key, minutes in loaded_transit.items():
+            TRANSIT_CACHE.setdefault(key, minutes)
+        persisted_transit = set(loaded_transit)
+    _trim_detail_caches(DETAILS_MEMORY_CACHE_MAX)
+    persisted_blocklist: set[str] = set()
+    persisted_contacts: set[str] = set()
+    blocklist_digest = _terms_digest(BLOCKLIST_TERMS)
+    if cache_db is not None and blocklist_cache_ttl_sec > 0:
+        loaded_blocklist = _load_details_blocklist_cache(
+            cache_db, blocklist_digest, blocklist_cache_ttl_sec, cache_now
         )
+        for url, blocked in loaded_blocklist.items():
+            DETAILS_BLOCKLIST_CACHE.setdefault(url, blocked)
+        persisted_blocklist = set(loaded_blocklist)
+    if cache_db is not None and details_cache_ttl_sec > 0:
+        loaded_contacts = _load_details_contact_cache(cache_db, details_cache_ttl_sec, cache_now)
+        for url, contact in loaded_contacts.items():
+            DETAILS_CONTACT_CACHE.setdefault(url, contact)
+        persisted_contacts = set(loaded_contacts)
 
     # Trefferliste und optionaler Selenium-Driver.
     all_jobs: List[Job] = []
     driver = None
+    # Gemeinsamer httpx-Client der Request-Adapter, wird im finally geschlossen.
+    shared_client = None
     headless = getattr(config, "HEADLESS_MODE", True)
     selenium_init_error: str | None = None
 
@@ -1812,8 +2568,12 @@ def collect_jobs(
         request_futures: dict = {}
         request_executor: ThreadPoolExecutor | None = None
         request_local = threading.local()
+        # Optional ein gemeinsamer httpx-Client fuer alle Worker (HTTP/2 je Host).
+        shared_client = _mk_httpx_client() if REQUESTS_ADAPTER_HTTPX else None
 
-        def _get_request_session() -> requests.Session:
+        def _get_request_session():
+            if shared_client is not None:
+                return shared_client
             session = getattr(request_local, "session", None)
             if session is None:
                 session = requests.Session()
@@ -1824,6 +2584,9 @@ def collect_jobs(
             if _deadline_exceeded():
                 return adapter.source, query, loc, [], 0.0
             session = _get_request_session()
+            # Nach Timeout/Raw-Cap geschlossen: Worker wird nicht mehr gebraucht.
+            if _client_closed(session):
+                return adapter.source, query, loc, [], 0.0
             started = time.perf_counter()
             attempts = max(1, REQUESTS_ADAPTER_RETRIES + 1)
             last_exc: Exception | None = None
@@ -1843,14 +2606,17 @@ def collect_jobs(
                     break
                 except Exception as exc:
                     last_exc = exc
+                    if _client_closed(session):
+                        return adapter.source, query, loc, [], 0.0
                     if attempt >= attempts or _deadline_exceeded():
                         break
-                    try:
-                        session.close()
-                    except Exception:
-                        pass
-                    request_local.session = None
-                    session = _get_request_session()
+                    if session is not shared_client:
+                        try:
+                            session.close()
+                        except Exception:
+                            pass
+                        request_local.session = None
+                        session = _get_request_session()
                     _retry_backoff_sleep(attempt)
             if last_exc is not None:
                 raise last_exc
@@ -1865,41 +2631,12 @@ def collect_jobs(
         ) -> int:
             converted = 0
             for r in rows:
-                if isinstance(r, dict):
-                    title = r.get("title") or ""
-                    link = r.get("link") or ""
-                    if not title or not link:
-                        continue
-                    raw_title = r.get("raw_title") or title
-                    company = r.get("company") or ""
-                    location = r.get("location") or ""
-                    date = r.get("date") or ""
-                else:
-                    if not isinstance(r, (CHJobRow, ExtraJobRow)):
-                        if not getattr(r, "title", None) or not getattr(
-                            r, "link", None
-                        ):
-                            continue
-                    title = r.title
-                    link = r.link
-                    raw_title = getattr(r, "raw_title", "") or title
-                    company = getattr(r, "company", "")
-                    location = getattr(r, "location", "")
-                    date = getattr(r, "date", "") or ""
-
-                score, label = _score_title(title)
+                d = _normalize_row(r)
+                if not d["title"] or not d["link"]:
+                    continue
+                score, label = _score_title(d["title"])
                 all_jobs.append(
-                    Job(
-                        raw_title=raw_title,
-                        title=title,
-                        company=company,
-                        location=location,
-                        link=link,
-                        source=adapter_source,
-                        score=score,
-                        match=label,
-                        date=date,
-                    )
+                    Job(**d, source=adapter_source, score=score, match=label)
                 )
                 converted += 1
                 if _raw_cap_reached():
@@ -2045,36 +2782,62 @@ def collect_jobs(
                             empty_cache_updates[key] = time.time()
                         adapter_totals[source] = adapter_totals.get(source, 0.0) + duration
 
+                # Batches, deren Ergebnis noch nicht uebernommen wurde (Fallback-Kandidaten).
+                pending_batches: dict[int, list] = dict(enumerate(batches))
+
+                def _run_selenium_batch_sequential(idx: int, label: str) -> None:
+                    batch = pending_batches.pop(idx, None)
+                    if batch is None:
+                        return
+                    try:
+                        _consume_selenium_result(
+                            _selenium_worker(batch, radius_km, limit_per_site, headless)
+                        )
+                    except Exception as exc:
+                        job_logger.warning("%s Fehler: %s", label, exc)
+
                 def _run_selenium_parallel(use_process_pool: bool) -> None:
                     ex = None
-                    futures = []
+                    futures: dict = {}
                     try:
                         if use_process_pool:
+                            # Jeder Prozess besitzt genau einen Chrome und arbeitet seinen Batch ab.
                             ctx = mp.get_context("spawn")
                             ex = ProcessPoolExecutor(max_workers=worker_count, mp_context=ctx)
                         else:
                             ex = ThreadPoolExecutor(max_workers=worker_count)
-                        futures = [
+                        futures = {
                             ex.submit(
                                 _selenium_worker,
                                 batch,
                                 radius_km,
                                 limit_per_site,
                                 headless,
-                            )
-                            for batch in batches
-                        ]
+                            ): idx
+                            for idx, batch in pending_batches.items()
+                        }
                         timeout = SELENIUM_FUTURE_TIMEOUT_SEC if SELENIUM_FUTURE_TIMEOUT_SEC > 0 else None
                         for future in as_completed(futures, timeout=timeout):
                             if _deadline_exceeded() or _raw_cap_reached():
                                 break
-                            result = future.result()
+                            idx = futures[future]
+                            try:
+                                result = future.result()
+                            except Exception as exc:
+                                # Nur diesen Batch als fehlgeschlagen markieren, Rest weiter einsammeln.
+                                job_logger.warning("Selenium Worker Batch %s Fehler: %s", idx, exc)
+                                continue
+                            pending_batches.pop(idx, None)
                             _consume_selenium_result(result)
+                            # Budget voll: nicht auf den naechsten Batch warten, Rest abbrechen.
+                            if _raw_cap_reached():
+                                break
                     except FuturesTimeoutError:
                         job_logger.warning(
                             "Selenium-Parallellauf Timeout nach %ss.",
                             SELENIUM_FUTURE_TIMEOUT_SEC,
                         )
+                        pending_batches.clear()
                     finally:
                         for future in futures:
                             if not future.done():
@@ -2086,19 +2849,10 @@ def collect_jobs(
                                 ex.shutdown(wait=False)
 
                 if selenium_mode == "sequential":
-                    for batch in batches:
+                    for idx in list(pending_batches):
                         if _deadline_exceeded() or _raw_cap_reached():
                             break
-                        try:
-                            _consume_selenium_result(
-                                _selenium_worker(
-                                    batch, radius_km, limit_per_site, headless
-                                )
-                            )
-                        except Exception as exc:
-                            job_logger.warning(
-                                "Selenium Sequential Fehler: %s", exc
-                            )
+                        _run_selenium_batch_sequential(idx, "Selenium Sequential")
                 elif selenium_mode == "process":
                     try:
                         _run_selenium_parallel(use_process_pool=True)
@@ -2107,19 +2861,11 @@ def collect_jobs(
                             "Selenium ProcessPool Fehler (%s), fallback auf sequential.",
                             exc,
                         )
-                        for batch in batches:
-                            if _deadline_exceeded() or _raw_cap_reached():
-                                break
-                            try:
-                                _consume_selenium_result(
-                                    _selenium_worker(
-                                        batch, radius_km, limit_per_site, headless
-                                    )
-                                )
-                            except Exception as seq_exc:
-                                job_logger.warning(
-                                    "Selenium Sequential Fallback Fehler: %s", seq_exc
-                                )
+                    # Nur nicht uebernommene Batches sequentiell nachholen (keine Doppel-Treffer).
+                    for idx in list(pending_batches):
+                        if _deadline_exceeded() or _raw_cap_reached():
+                            break
+                        _run_selenium_batch_sequential(idx, "Selenium Sequential Fallback")
                 else:
                     try:
                         _run_selenium_parallel(use_process_pool=False)
@@ -2202,6 +2948,9 @@ def collect_jobs(
                         )
                         continue
                     _handle_request_result(source, query, loc, rows, duration)
+                    # Budget voll: sofort abbrechen statt auf das naechste Ergebnis zu warten.
+                    if _raw_cap_reached():
+                        break
             except FuturesTimeoutError:
                 job_logger.warning(
                     "Request-Adapter Timeout nach %ss; verbleibende Aufgaben werden abgebrochen.",
@@ -2271,11 +3020,17 @@ def collect_jobs(
                 driver.quit()
         except Exception:
             pass
+        if shared_client is not None:
+            try:
+                shared_client.close()
+            except Exception:
+                pass
 
     # Dedupe / Blacklist / Category filter / Location boost
-    seen = set()
+    seen: set[tuple[str, str, str]] = set()
     unique: List[Job] = []
     search_locs = locations
+    search_loc_terms = _normalize_terms(search_locs or [])
     detail_scans = 0
     contact_scans = 0
     detail_scan_time = 0.0
@@ -2293,11 +3048,18 @@ def collect_jobs(
         if FILTER_STATS:
             filter_stats[key] = filter_stats.get(key, 0) + 1
 
-    # Alle Treffer filtern, anreichern und bewerten.
+    # Aggregator-Links vorab gebuendelt pruefen; der Filter liest dann nur den Cache.
+    if ALLOW_AGGREGATORS and AGGREGATOR_VALIDATE_LINKS:
+        _validate_links_bulk(
+            [j.link for j in all_jobs if j.source in AGGREGATOR_SOURCES and j.link]
+        )
+
+    # Alle Treffer filtern, anreichern und bewerten (erst lokale Checks, dann Detail-Scans).
+    candidates: List[tuple[Job, tuple[str, str, str], bool]] = []
     for j in all_jobs:
         # Normalize jobs.ch/jobup multi-line titles into fields
         if (not j.company or not j.location) and (j.title or j.raw_title):
-            t2, c2, l2 = extract_from_multiline_title(j.raw_title or j.title)
+            t2, c2, l2 = _parse_multiline_title(j.raw_title or j.title)
             if t2:
                 j.title = t2
             if not j.company and c2:
@@ -2311,6 +3073,34 @@ def collect_jobs(
             _bump("remote_blocked")
             continue
 
+        # Billige, ortsunabhaengige Checks vor Detailseiten- und Transit-Abrufen.
+        if (j.company or "").lower() in BLACKLIST:
+            _bump("company_blacklist")
+            continue
+
+        if j.source in ("jobs.ch", "jobup.ch"):
+            link_has_digit = bool(re.search(r"\d", j.link))
+            tail = "/".join(j.link.rstrip("/").split("/")[-2:])
+            is_category = "stellenangebote" in tail and "detail" not in tail
+            if (not link_has_digit) or is_category:
+                _bump("category_link")
+                continue
+
+        if (
+            ALLOW_AGGREGATORS
+            and AGGREGATOR_VALIDATE_LINKS
+            and j.source in AGGREGATOR_SOURCES
+            and not _aggregator_link_ok(j.link)
+        ):
+            _bump("aggregator_link")
+            continue
+
+        # Ein nachgeladener Ort kann nur Treffer hinzufuegen: was jetzt blockiert ist,
+        # bliebe auch danach blockiert.
+        if _has_blocked_keywords(j, BLOCKLIST_TERMS):
+            _bump("blocked_keywords")
+            continue
+
         if transit_enabled and not is_remote and not j.location and j.link:
             detail_location = _detail_page_location(
                 j.link,
@@ -2319,13 +3109,18 @@ def collect_jobs(
             )
             if detail_location:
                 j.location = detail_location
+                if _has_blocked_keywords(j, BLOCKLIST_TERMS):
+                    _bump("blocked_keywords")
+                    continue
 
-        local_match = _is_local(j, search_locs) if search_locs else True
+        # Feldtext einmal pro Job normalisieren, alle drei Ortspruefungen lesen ihn.
+        loc_text = _location_text(j)
+        local_match = _is_local(j, search_locs, loc_text) if search_locs else True
         allowed_match = (
-            _is_allowed_location(j, ALLOWED_LOCATIONS) if ALLOWED_LOCATIONS else True
+            _is_allowed_location(j, ALLOWED_LOCATIONS, loc_text) if ALLOWED_LOCATIONS else True
         )
         hard_allowed_match = (
-            _is_allowed_location(j, HARD_ALLOWED_LOCATIONS)
+            _is_allowed_location(j, HARD_ALLOWED_LOCATIONS, loc_text)
             if HARD_ALLOWED_LOCATIONS
             else True
         )
@@ -2378,35 +3173,45 @@ def collect_jobs(
                 _bump("include_keywords")
                 continue
 
-        if (j.company or "").lower() in BLACKLIST:
-            _bump("company_blacklist")
-            continue
-        if _has_blocked_keywords(j, BLOCKLIST_TERMS):
-            _bump("blocked_keywords")
-            continue
-
-        if (
-            ALLOW_AGGREGATORS
-            and AGGREGATOR_VALIDATE_LINKS
-            and j.source in AGGREGATOR_SOURCES
-            and not _aggregator_link_ok(j.link)
-        ):
-            _bump("aggregator_link")
-            continue
-
-        if j.source in ("jobs.ch", "jobup.ch"):
-            link_has_digit = bool(re.search(r"\d", j.link))
-            tail = "/".join(j.link.rstrip("/").split("/")[-2:])
-            is_category = "stellenangebote" in tail and "detail" not in tail
-            if (not link_has_digit) or is_category:
-                _bump("category_link")
-                continue
-
         key = _norm_key(j.title, j.company, j.link)
+        candidates.append((j, key, allowed_match))
+
+    # Detail-/Kontakt-Scans fuer die voraussichtlich behaltenen Treffer parallel vorladen.
+    first_links: List[str] = []
+    first_keys: set[tuple[str, str, str]] = set()
+    for j, key, _allowed in candidates:
+        if key not in first_keys and j.link:
+            first_keys.add(key)
+            first_links.append(j.link)
+    first_links = list(dict.fromkeys(first_links))
+    prefetched_detail: set[str] = set()
+    prefetched_contact: set[str] = set()
+    if DETAILS_BLOCKLIST_SCAN and BLOCKLIST_TERMS:
+        todo = [
+            link
+            for link in first_links
+            if link not in DETAILS_BLOCKLIST_CACHE and not _is_skipped_detail_domain(link)
+        ][:DETAILS_BLOCKLIST_MAX_JOBS]
+        scan_start = time.perf_counter()
+        _prefetch_details(todo, lambda link: _detail_page_has_blocked_terms(link, BLOCKLIST_TERMS))
+        detail_scan_time += time.perf_counter() - scan_start
+        prefetched_detail.update(todo)
+    if DETAILS_CONTACT_SCAN:
+        todo = [
+            link
+            for link in first_links
+            if link not in DETAILS_CONTACT_CACHE and not DETAILS_BLOCKLIST_CACHE.get(link)
+        ][:DETAILS_CONTACT_MAX_JOBS]
+        scan_start = time.perf_counter()
+        _prefetch_details(todo, extract_application_contact)
+        contact_scan_time += time.perf_counter() - scan_start
+        prefetched_contact.update(todo)
+
+    for j, key, allowed_match in candidates:
         if key in seen:
             _bump("duplicate")
             continue
-        # Detailseiten auf Blocklist und Kontakte scannen.
+        # Detailseiten auf Blocklist und Kontakte scannen (Zaehler wie ohne Vorladen).
         if (
             DETAILS_BLOCKLIST_SCAN
             and j.link
@@ -2415,7 +3220,8 @@ def collect_jobs(
             if _is_skipped_detail_domain(j.link):
                 DETAILS_BLOCKLIST_CACHE[j.link] = False
             else:
-                if j.link not in DETAILS_BLOCKLIST_CACHE:
+                if j.link not in DETAILS_BLOCKLIST_CACHE or j.link in prefetched_detail:
+                    prefetched_detail.discard(j.link)
                     detail_scans += 1
                 scan_start = time.perf_counter() if TIMING_ENABLED else 0.0
                 if _detail_page_has_blocked_terms(j.link, BLOCKLIST_TERMS):
@@ -2432,7 +3238,8 @@ def collect_jobs(
             and j.link
             and contact_scans < DETAILS_CONTACT_MAX_JOBS
         ):
-            if j.link not in DETAILS_CONTACT_CACHE:
+            if j.link not in DETAILS_CONTACT_CACHE or j.link in prefetched_contact:
+                prefetched_contact.discard(j.link)
                 contact_scans += 1
             scan_start = time.perf_counter() if TIMING_ENABLED else 0.0
             email, name = extract_application_contact(j.link)
@@ -2444,7 +3251,7 @@ def collect_jobs(
                 j.contact_name = name
 
         # Score-Booster (Ort/Commute) und Match-Klasse setzen.
-        j.score += _location_boost(j.location, search_locs)
+        j.score += _location_boost(j.location, search_loc_terms)
         if ALLOWED_LOCATIONS and allowed_match:
             j.score += ALLOWED_LOCATION_BOOST
         commute_min = _commute_minutes_for(j, COMMUTE_MINUTES)
@@ -2481,12 +3288,45 @@ def collect_jobs(
             empty_cache_ttl_sec,
             time.time(),
         )
-        _save_empty_search_cache(EMPTY_SEARCH_CACHE_PATH, empty_cache)
+        if cache_db is not None:
+            _save_empty_search_cache(cache_db, empty_cache_updates)
         job_logger.info(
             "empty-cache "
             f"skip={empty_cache_skips} add={len(empty_cache_updates)} "
             f"keep={len(empty_cache)}"
         )
+    if cache_db is not None:
+        if link_cache_ttl_sec > 0:
+            with _AGGREGATOR_LINK_LOCK:
+                new_links = {
+                    url: ok
+                    for url, ok in AGGREGATOR_LINK_CACHE.items()
+                    if url not in persisted_links
+                }
+            _save_aggregator_link_cache(cache_db, new_links, time.time())
+        if transit_cache_ttl_sec > 0:
+            new_transit = {
+                key: minutes
+                for key, minutes in TRANSIT_CACHE.items()
+                if key not in persisted_transit
+            }
+            _save_transit_cache(cache_db, new_transit, time.time())
+        if blocklist_cache_ttl_sec > 0:
+            # Leerer Seitentext = Abruf fehlgeschlagen/uebersprungen: nicht persistieren.
+            new_blocklist = {
+                url: blocked
+                for url, blocked in DETAILS_BLOCKLIST_CACHE.items()
+                if url not in persisted_blocklist and (blocked or DETAILS_TEXT_CACHE.get(url))
+            }
+            _save_details_blocklist_cache(cache_db, blocklist_digest, new_blocklist, time.time())
+        if details_cache_ttl_sec > 0:
+            new_contacts = {
+                url: contact
+                for url, contact in DETAILS_CONTACT_CACHE.items()
+                if url not in persisted_contacts and url not in DETAILS_CONTACT_FAILED
+            }
+            _save_details_contact_cache(cache_db, new_contacts, time.time())
+        cache_db.close()
     if FILTER_STATS:
         kept = filter_stats.get("kept", 0)
         total = filter_stats.get("total", len(all_jobs))
@@ -2509,11 +3349,13 @@ def collect_jobs(
         else:
             job_logger.info("filter-stats total=%s kept=%s", total, kept)
 
-    unique.sort(key=lambda x: x.score, reverse=True)
+    # Top-k per Heap statt Vollsortierung; nlargest ist stabil wie sorted(...)[:k].
     if max_total:
+        top = heapq.nlargest(max_total, unique, key=_JOB_SCORE)
         if TIMING_ENABLED:
             _timing_log("collect_jobs_total", time.perf_counter() - total_start)
-        return unique[:max_total]
+        return top
+    unique.sort(key=_JOB_SCORE, reverse=True)
     if TIMING_ENABLED:
         _timing_log("collect_jobs_total", time.perf_counter() - total_start)
     return unique
@@ -2524,7 +3366,7 @@ def format_jobs_plain(jobs: List[Job], top: int = 20) -> str:
     out: List[str] = []
     for i, j in enumerate(jobs[:top], 1):
         if (not j.company or not j.location) and ("\n" in (j.raw_title or "") or "Arbeitsort" in (j.raw_title or "")):
-            t2, c2, l2 = extract_from_multiline_title(j.raw_title)
+            t2, c2, l2 = _parse_multiline_title(j.raw_title)
             if t2:
                 j.title = t2
             if not j.company and c2:
@@ -4,11 +4,18 @@ import json
 import re
 import unicodedata
 from datetime import datetime, timezone
+from functools import lru_cache
 from hashlib import sha256
 from pathlib import Path
 from typing import Any, Dict, Tuple
 from urllib.parse import urlparse, urlunparse
 
+# Optional: orjson fuer schnelles Laden/Speichern des State-Files.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 STATE_PATH = Path("generated/job_state.json")
 SEEN_PATH = Path("generated/seen_jobs.json")
 
@@ -32,8 +39,9 @@ def now_iso() -> str:
     )
 
 
+@lru_cache(maxsize=4096)
 def parse_ts(value: str | None) -> datetime | None:
-    # ISO-Timestamp sicher parsen.
+    # ISO-Timestamp sicher parsen; gecacht, da Batch-Laeufe viele gleiche Stempel schreiben.
     if not value:
         return None
     try:
@@ -42,17 +50,35 @@ def parse_ts(value: str | None) -> datetime | None:
         return None
 
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+class _CombiningDropTable(dict):
+    # str.translate-Tabelle: Combining-Zeichen loeschen, Rest behalten; fuellt sich je Codepoint.
+    def __missing__(self, codepoint: int) -> int | None:
+        value = None if unicodedata.combining(chr(codepoint)) else codepoint
+        self[codepoint] = value
+        return value
+
+
+_COMBINING_DROP = _CombiningDropTable()
+
+
+@lru_cache(maxsize=50_000)
 def _normalize_text(value: str) -> str:
     # Text normalisieren (lowercase, diakritische entfernen, nur a-z0-9).
     text = (value or "").lower()
-    text = unicodedata.normalize("NFKD", text)
-    text = "".join(ch for ch in text if not unicodedata.combining(ch))
-    text = re.sub(r"[^a-z0-9]+", " ", text)
-    return re.sub(r"\s+", " ", text).strip()
+    # Reiner ASCII-Text: NFKD/Combining-Filter aendern nichts und entfallen.
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text).translate(_COMBINING_DROP)
+    # Ein Sub reicht: jede Folge von Nicht-a-z0-9 (inkl. Whitespace) wird genau ein Leerzeichen.
+    return _NON_ALNUM_RE.sub(" ", text).strip()
 
 
+@lru_cache(maxsize=50_000)
 def canonicalize_url(url: str) -> str:
     # URL auf kanonische Form kuerzen (Schema/Host lower, Pfad ohne Slash).
+    # Gecacht: dieselben Links laufen pro Lauf durch UID-Bildung, Tracker und Mail-Liste.
     if not url:
         return ""
     raw = url.strip()
@@ -76,6 +102,9 @@ def _job_to_dict(job: Any) -> Dict[str, Any]:
         return dict(job)
     if hasattr(job, "__dict__"):
         return dict(job.__dict__)
+    slots = getattr(type(job), "__slots__", None)
+    if slots:
+        return {k: getattr(job, k, None) for k in slots}
     return {}
 
 
@@ -130,6 +159,7 @@ def build_job_uid(job: Any) -> Tuple[str, str]:
             link_norm = _normalize_text(link)
             base = f"fallback|{source}|{title}|{company}|{location}|{link_norm}"
 
+    # Ein f-String + ein encode ist schneller als inkrementelles sha256.update() je Teil.
     job_uid = sha256(base.encode("utf-8")).hexdigest()[:16]
     return job_uid, canonical_url
 
@@ -155,11 +185,19 @@ def _empty_state_record(now: str) -> Dict[str, Any]:
     }
 
 
+def _read_json(path: Path) -> Any:
+    # JSON-Datei lesen (orjson, falls vorhanden).
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
 def _migrate_seen_jobs(seen_path: Path, now: str) -> Dict[str, Dict[str, Any]]:
     # Altes seen_jobs.json in neues State-Format migrieren.
     state: Dict[str, Dict[str, Any]] = {}
     try:
-        raw = json.loads(seen_path.read_text(encoding="utf-8"))
+        raw = _read_json(seen_path)
     except Exception:
         return state
 
@@ -218,7 +256,7 @@ def load_state(
     # State laden; falls nicht vorhanden, optional aus seen_jobs migrieren.
     if path.exists():
         try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
+            raw = _read_json(path)
         except Exception:
             return {}
         if isinstance(raw, dict):
@@ -246,8 +284,15 @@ def load_state(
 def save_state(state: Dict[str, Dict[str, Any]], path: Path = STATE_PATH) -> None:
     # State als JSON im Zielpfad speichern.
     path.parent.mkdir(parents=True, exist_ok=True)
-    payload = json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True)
-    path.write_text(payload, encoding="utf-8")
+    payload = None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        except TypeError:
+            payload = None
+    if payload is None:
+        payload = json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8")
+    path.write_bytes(payload)
 
 
 def should_send_reminder(
@@ -16,6 +16,13 @@ _RELDATE_INLINE_RE = re.compile(
     r"\b(heute|gestern|vorgestern|letzte woche|letzten monat|vor \d+ (stunden?|tagen|wochen|monaten?))\b",
     re.IGNORECASE,
 )
+# Alle Noise-Muster in einem Regex-Durchlauf je Zeile (statt drei Suchen).
+_NOISE_RE = re.compile(
+    r"(?:" + _LABEL_RE.pattern + r")"
+    r"|^ref[:\s]"
+    r"|(?:" + _RELDATE_INLINE_RE.pattern + r")",
+    re.IGNORECASE,
+)
 _CITY_HINT_RE = re.compile(
     r"\b("
     r"z\u00fcrich|zurich|zuerich|"
@@ -26,26 +33,20 @@ _CITY_HINT_RE = re.compile(
     r")\b",
     re.IGNORECASE,
 )
+# "01. [exact]"-Prefixe je Zeile, in einem Durchlauf ueber den ganzen Text.
+_LINE_PREFIX_RE = re.compile(r"(?m)^[ \t]*\d+\.[ \t]*\[[^\]\n]+\][ \t]*")
 
 
 def _normalize_line(line: str) -> str:
     # Zeilen bereinigen und Prefixe entfernen.
     # Remove leading "01. [exact]" style prefixes.
-    line = re.sub(r"^\s*\d+\.\s*\[[^\]]+\]\s*", "", line)
+    line = _LINE_PREFIX_RE.sub("", line)
     return line.strip().strip('"').strip()
 
 
 def _is_noise_line(line: str) -> bool:
     # Zeilen rausfiltern, die Labels/Meta enthalten.
-    if not line:
-        return True
-    if _LABEL_RE.search(line):
-        return True
-    if re.match(r"^ref[:\s]", line, re.IGNORECASE):
-        return True
-    if _RELDATE_INLINE_RE.search(line):
-        return True
-    return False
+    return not line or _NOISE_RE.search(line) is not None
 
 
 def extract_from_multiline_title(raw_title: str) -> Tuple[str, str, str]:
@@ -53,7 +54,8 @@ def extract_from_multiline_title(raw_title: str) -> Tuple[str, str, str]:
     Parse multi-line titles into (job_title, company, location).
     """
     # Rohzeilen normalisieren und leere entfernen.
-    raw_lines = [_normalize_line(x) for x in (raw_title or "").splitlines()]
+    cleaned = _LINE_PREFIX_RE.sub("", raw_title or "")
+    raw_lines = [x.strip().strip('"').strip() for x in cleaned.splitlines()]
     raw_lines = [x for x in raw_lines if x]
 
     # Arbeitsort ggf. explizit aus "Arbeitsort" Ableiten.
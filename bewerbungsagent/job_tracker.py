@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import csv
 import os
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict
 
@@ -9,6 +10,16 @@ from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.datavalidation import DataValidation
 
+# Optional: schnellere XLSX-Backends (Rust-Reader, Streaming-Writer); sonst openpyxl.
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None  # type: ignore
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None  # type: ignore
+
 from .job_state import (
     STATUS_APPLIED,
     STATUS_CLOSED,
@@ -37,6 +48,9 @@ TRACKER_HEADERS = [
     "notes",
 ]
 
+# Zeile (dict) -> Werte in Spaltenreihenfolge, einmal gebaut.
+_TRACKER_ROW_VALUES = itemgetter(*TRACKER_HEADERS)
+
 MANUAL_COLUMNS = {"erledigt", "aktion", "notes"}
 
 CHECKBOX_EMPTY = chr(0x2610)
@@ -106,35 +120,47 @@ def _load_tracker_csv(path: Path) -> Dict[str, Dict[str, Any]]:
         return rows
 
 
-def _load_tracker_xlsx(path: Path) -> Dict[str, Dict[str, Any]]:
-    # XLSX-Tracker lesen.
-    wb = load_workbook(path, read_only=True, data_only=True)
-    ws = wb.active
-    iterator = ws.iter_rows(values_only=True)
-    headers = next(iterator, None)
+def _tracker_rows_from_values(values_iter) -> Dict[str, Dict[str, Any]]:
+    # Zeilenwerte (Header zuerst) in Tracker-Dict nach job_uid ueberfuehren.
+    headers = next(values_iter, None)
     if not headers:
-        wb.close()
         return {}
     header_list = [str(h).strip() if h is not None else "" for h in headers]
     if "job_uid" not in header_list:
-        wb.close()
         return {}
     rows: Dict[str, Dict[str, Any]] = {}
-    for values in iterator:
+    for values in values_iter:
         row: Dict[str, Any] = {}
         for idx, header in enumerate(header_list):
             if not header:
                 continue
             val = values[idx] if idx < len(values) else ""
+            # calamine liefert Zahlen als float: 12.0 wie bei openpyxl als "12".
+            if isinstance(val, float) and val.is_integer():
+                val = int(val)
             row[header] = "" if val is None else str(val).strip()
         uid = _clean(row.get("job_uid"))
         if not uid:
             continue
         rows[uid] = row
-    wb.close()
     return rows
 
 
+def _load_tracker_xlsx(path: Path) -> Dict[str, Dict[str, Any]]:
+    # XLSX-Tracker lesen.
+    if CalamineWorkbook is not None:
+        try:
+            sheet = CalamineWorkbook.from_path(str(path)).get_sheet_by_index(0)
+            return _tracker_rows_from_values(iter(sheet.to_python()))
+        except Exception:
+            pass
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        return _tracker_rows_from_values(wb.active.iter_rows(values_only=True))
+    finally:
+        wb.close()
+
+
 def apply_tracker_marks(
     state: Dict[str, Dict[str, Any]],
     tracker_rows: Dict[str, Dict[str, Any]],
@@ -165,9 +191,9 @@ def apply_tracker_marks(
     return updates
 
 
-def _sort_key(row: Dict[str, Any]) -> float:
-    # Sortierschluessel nach last_seen_at.
-    last_seen = parse_ts(_clean(row.get("last_seen_at")))
+def _ts_sort_value(value: Any) -> float:
+    # Sortierschluessel nach last_seen_at (0.0 = unbekannt).
+    last_seen = parse_ts(_clean(value))
     return last_seen.timestamp() if last_seen else 0.0
 
 
@@ -178,30 +204,31 @@ def build_tracker_rows(
 ) -> list[Dict[str, Any]]:
     # Tracker-Zeilen aus State generieren.
     existing_rows = existing_rows or {}
-    rows: list[Dict[str, Any]] = []
+    # (Zeitstempel, Zeile): Schluessel beim Aufbau einmal berechnen statt per Sort-Callback.
+    keyed: list[tuple[float, Dict[str, Any]]] = []
     for uid, record in state.items():
         status = record.get("status") or ""
         if status == STATUS_CLOSED and not include_closed:
             continue
-        row = {k: "" for k in TRACKER_HEADERS}
-        row.update(
-            {
-                "job_uid": uid,
-                "status": status,
-                "applied_at": record.get("applied_at") or "",
-                "erledigt": CHECKBOX_EMPTY,
-                "title": record.get("title") or "",
-                "company": record.get("company") or "",
-                "location": record.get("location") or "",
-                "source": record.get("source") or "",
-                "link": record.get("link") or record.get("canonical_url") or "",
-                "first_seen_at": record.get("first_seen_at") or "",
-                "last_seen_at": record.get("last_seen_at") or "",
-                "last_sent_at": record.get("last_sent_at") or "",
-                "score": record.get("score") or "",
-                "match": record.get("match") or "",
-            }
-        )
+        # Ein Literal in TRACKER_HEADERS-Reihenfolge (kein Leer-Dict + update).
+        row = {
+            "job_uid": uid,
+            "status": status,
+            "applied_at": record.get("applied_at") or "",
+            "erledigt": CHECKBOX_EMPTY,
+            "aktion": "",
+            "title": record.get("title") or "",
+            "company": record.get("company") or "",
+            "location": record.get("location") or "",
+            "source": record.get("source") or "",
+            "link": record.get("link") or record.get("canonical_url") or "",
+            "first_seen_at": record.get("first_seen_at") or "",
+            "last_seen_at": record.get("last_seen_at") or "",
+            "last_sent_at": record.get("last_sent_at") or "",
+            "score": record.get("score") or "",
+            "match": record.get("match") or "",
+            "notes": "",
+        }
         existing = existing_rows.get(uid, {})
         for col in MANUAL_COLUMNS:
             if not _clean(existing.get(col)):
@@ -216,10 +243,10 @@ def build_tracker_rows(
                 row["aktion"] = "applied"
             if status == STATUS_IGNORED and not row["aktion"]:
                 row["aktion"] = "ignored"
-        rows.append(row)
+        keyed.append((_ts_sort_value(row["last_seen_at"]), row))
 
-    rows.sort(key=_sort_key, reverse=True)
-    return rows
+    keyed.sort(key=itemgetter(0), reverse=True)
+    return [row for _, row in keyed]
 
 
 def write_tracker(
@@ -238,15 +265,51 @@ def write_tracker(
 
 
 def _write_tracker_csv(path: Path, rows: list[Dict[str, Any]]) -> None:
-    # CSV-Ausgabe.
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=TRACKER_HEADERS)
-        writer.writeheader()
-        writer.writerows(rows)
+    # CSV-Ausgabe (build_tracker_rows liefert immer alle Spalten).
+    with path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(TRACKER_HEADERS)
+        writer.writerows(map(_TRACKER_ROW_VALUES, rows))
+
+
+def _write_tracker_xlsxwriter(path: Path, rows: list[Dict[str, Any]]) -> None:
+    # XLSX in einem Durchlauf streamen (constant_memory); Zellen bleiben reiner Text
+    # (keine Auto-Links/Formeln aus Titeln wie "=...").
+    options = {
+        "constant_memory": True,
+        "strings_to_urls": False,
+        "strings_to_formulas": False,
+    }
+    wb = xlsxwriter.Workbook(str(path), options)
+    ws = wb.add_worksheet("job_tracker")
+    ws.write_row(0, 0, TRACKER_HEADERS)
+    for idx, row in enumerate(rows, 1):
+        ws.write_row(idx, 0, _TRACKER_ROW_VALUES(row))
+    ws.freeze_panes(1, 0)
+    ws.autofilter(0, 0, max(len(rows), 0), len(TRACKER_HEADERS) - 1)
+    if rows:
+        col = TRACKER_HEADERS.index("erledigt")
+        ws.data_validation(
+            1,
+            col,
+            len(rows),
+            col,
+            {
+                "validate": "list",
+                "source": [CHECKBOX_EMPTY, CHECKBOX_DONE],
+                "ignore_blank": False,
+                "error_title": "Ungueltiger Wert",
+                "error_message": f"Bitte nur {CHECKBOX_EMPTY} oder {CHECKBOX_DONE} waehlen.",
+            },
+        )
+    wb.close()
 
 
 def _write_tracker_xlsx(path: Path, rows: list[Dict[str, Any]]) -> None:
     # XLSX-Ausgabe mit Validierung fuer Checkboxen.
+    if xlsxwriter is not None:
+        _write_tracker_xlsxwriter(path, rows)
+        return
     wb = Workbook()
     ws = wb.active
     ws.title = "job_tracker"
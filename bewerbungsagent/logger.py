@@ -1,48 +1,64 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 
 from .config import config
 
 
+_LOGGER_NAME = "JobFinder"
+_listener: logging.handlers.QueueListener | None = None
+
+
+def _setup_once() -> logging.Logger:
+    # Handler nur einmal je Prozess anhaengen (auch bei doppeltem Import).
+    global _listener
+    logger = logging.getLogger(_LOGGER_NAME)
+    logger.setLevel(getattr(logging, config.LOG_LEVEL.upper(), logging.INFO))
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers):
+        return logger
+
+    # Einheitliches Format fuer alle Handler.
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - "
+        "%(funcName)s:%(lineno)d - %(message)s"
+    )
+
+    # Log-Verzeichnis sicherstellen.
+    os.makedirs("logs", exist_ok=True)
+
+    # File-Handler mit Rotation.
+    file_handler = logging.handlers.RotatingFileHandler(
+        f"logs/{config.LOG_FILE}",
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=5,
+    )
+    file_handler.setFormatter(formatter)
+    handlers: list[logging.Handler] = [file_handler]
+
+    # Console-Handler.
+    if config.LOG_TO_CONSOLE:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    # Schreiben erfolgt im Listener-Thread, Aufrufer blockieren nicht auf I/O.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    return logger
+
+
 class JobFinderLogger:
     # Zentraler Logger mit Datei- und Konsolenhandlern.
     def __init__(self) -> None:
-        # Basis-Logger konfigurieren.
-        self.logger = logging.getLogger("JobFinder")
-        self.logger.setLevel(
-            getattr(logging, config.LOG_LEVEL.upper(), logging.INFO)
-        )
-
-        # Log-Verzeichnis sicherstellen.
-        os.makedirs("logs", exist_ok=True)
-
-        # File-Handler mit Rotation.
-        log_filename = f"logs/{config.LOG_FILE}"
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_filename,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5,
-        )
-
-        # Console-Handler.
-        console_handler = logging.StreamHandler() if config.LOG_TO_CONSOLE else None
-
-        # Einheitliches Format fuer alle Handler.
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - "
-            "%(funcName)s:%(lineno)d - %(message)s"
-        )
-
-        file_handler.setFormatter(formatter)
-        if console_handler:
-            console_handler.setFormatter(formatter)
-
-        # Doppelte Handler bei Re-Import vermeiden.
-        if not self.logger.handlers:
-            self.logger.addHandler(file_handler)
-            if console_handler:
-                self.logger.addHandler(console_handler)
+        # Basis-Logger einmalig konfigurieren.
+        self.logger = _setup_once()
 
     def get_logger(self) -> logging.Logger:
         # Zugriff auf den konfigurierten Logger.
@@ -104,4 +120,4 @@ class JobFinderLogger:
 
 
 # Globaler Logger fuer das Projekt.
-job_logger = JobFinderLogger().get_logger()
+job_logger = _setup_once()
@@ -1,6 +1,15 @@
+import asyncio
 import os
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional: httpx fuer den asynchronen Versand (sonst Thread-Fallback).
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore
 
 # Feature-Flag und Zugangsdaten aus ENV.
 ENABLED = str(os.getenv("WHATSAPP_ENABLED", "false")).lower() in {
@@ -16,28 +25,92 @@ TOKEN = os.getenv("WHATSAPP_TOKEN", "")
 PHONE_ID = os.getenv("WHATSAPP_PHONE_ID", "")
 TO = os.getenv("WHATSAPP_TO", "")
 
+# Endpoint und Header haengen nur an den ENV-Werten: einmal beim Import bauen.
+_URL = f"https://graph.facebook.com/v21.0/{PHONE_ID}/messages"
+_HEADERS = {"Authorization": f"Bearer {TOKEN}"}
 
-def send_whatsapp(text: str) -> bool:
-    # Nachricht via WhatsApp Cloud API senden.
+# Eine Session fuer alle Nachrichten: Keep-Alive spart den TLS-Handshake pro Send.
+# Nur Verbindungsfehler wiederholen; ein wiederholter POST nach Antwort koennte doppelt zustellen.
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3),
+    ),
+)
+
+
+# Async-Client wird je Event-Loop beim ersten Versand erzeugt (Pool-Verbindungen sind loop-gebunden).
+_ASYNC_CLIENT = None
+_ASYNC_CLIENT_LOOP = None
+
+
+def _ready() -> bool:
+    # Versand aktiv und ENV vollstaendig? (deaktiviert -> False, unvollstaendig -> Fehler)
     if not ENABLED:
         return False
     if not (TOKEN and PHONE_ID and TO):
         raise RuntimeError(
             "WhatsApp ENV unvollständig: WHATSAPP_TOKEN/PHONE_ID/TO"
         )
+    return True
+
 
-    url = f"https://graph.facebook.com/v21.0/{PHONE_ID}/messages"
-    payload = {
+def _payload(text: str) -> dict:
+    # Text-Nachricht fuer die Cloud API (Body auf 4000 Zeichen gekuerzt).
+    return {
         "messaging_product": "whatsapp",
         "to": TO,
         "type": "text",
         "text": {"body": text[:4000]},
     }
-    r = requests.post(
-        url,
-        json=payload,
-        headers={"Authorization": f"Bearer {TOKEN}"},
-        timeout=15,
-    )
+
+
+def send_whatsapp(text: str) -> bool:
+    # Nachricht via WhatsApp Cloud API senden.
+    if not _ready():
+        return False
+    r = _SESSION.post(_URL, json=_payload(text), timeout=15)
+    r.raise_for_status()
+    return True
+
+
+def _get_async_client():
+    # Gemeinsamer httpx.AsyncClient pro Loop; HTTP/2 nur, wenn das h2-Paket installiert ist.
+    global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT.is_closed or _ASYNC_CLIENT_LOOP is not loop:
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
+        # Client eines beendeten Loops nicht schliessen (aclose braeuchte den alten Loop),
+        # nur verwerfen.
+        _ASYNC_CLIENT = httpx.AsyncClient(headers=_HEADERS, timeout=15, http2=http2)
+        _ASYNC_CLIENT_LOOP = loop
+    return _ASYNC_CLIENT
+
+
+async def send_whatsapp_async(text: str) -> bool:
+    # Async-Variante: mehrere Nachrichten laufen per asyncio.gather parallel.
+    if not _ready():
+        return False
+    if httpx is None:
+        return await asyncio.to_thread(send_whatsapp, text)
+    r = await _get_async_client().post(_URL, json=_payload(text))
     r.raise_for_status()
     return True
+
+
+async def aclose_async_client() -> None:
+    # Async-Client schliessen (am Ende des Event-Loops aufrufen).
+    global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    if _ASYNC_CLIENT is not None:
+        await _ASYNC_CLIENT.aclose()
+        _ASYNC_CLIENT = None
+        _ASYNC_CLIENT_LOOP = None
@@ -7,7 +7,9 @@ im Raum Bülach/Kloten/Zürich (ÖV ≤ 60 Min.). UTF-8 bereinigt.
 import sys
 import webbrowser
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from string import Template
 import schedule
 import logging
 import os
@@ -21,37 +23,13 @@ from bewerbungsagent.config import config
 from bewerbungsagent.job_query_builder import build_search_urls
 
 
-class DirectJobFinder:
-    def __init__(self):
-        # Dynamisch generierte Portal-Suchlinks aus Konfiguration
-        self.direct_job_urls = build_search_urls(config)
-
-        # Profil für personalisierte Anschreiben
-        self.profile = {
-            "name": getattr(config, "PROFILE_NAME", "") or os.getenv("PROFILE_NAME", ""),
-            "email": getattr(config, "PROFILE_EMAIL", "") or os.getenv("PROFILE_EMAIL", ""),
-            "linkedin": getattr(config, "PROFILE_LINKEDIN", "") or os.getenv("PROFILE_LINKEDIN", ""),
-            "skills": [
-                "IT-Support (1st/2nd Level)",
-                "Windows 10/11, M365, AD",
-                "Ticketing (z. B. ServiceNow/Jira)",
-                "Hardware/Imaging, Remote Support",
-                "Netzwerk-Grundlagen (TCP/IP, VLAN)",
-                "SAP",
-                "Python/SQL (Grundlagen)",
-            ],
-        }
-
-    # ------------------ Datei-Helfer ------------------
-    def save_application_templates(self):
-        """Schreibt optimierte Anschreiben-Vorlagen (IT + Logistik) nach UTF-8."""
-        Path(config.TEMPLATES_FILE).parent.mkdir(parents=True, exist_ok=True)
-        name = (self.profile.get("name") or "Ihr Name").strip()
-        templates = f"""
-{name.upper()} – BEWERBUNGSVORLAGEN
+# Anschreiben-Vorlagen (IT + Logistik); einmal geparst, pro Aufruf nur Profilwerte einsetzen.
+_APPLICATION_TEMPLATES = Template(
+    """
+${name_upper} – BEWERBUNGSVORLAGEN
 ==================================================
-LinkedIn: {self.profile['linkedin']}
-E-Mail: {self.profile['email']}
+LinkedIn: ${linkedin}
+E-Mail: ${email}
 
 ============================================================
 ANSCHREIBEN: IT SUPPORT / SERVICE DESK / WORKPLACE
@@ -69,7 +47,7 @@ Stärken:
 Gern unterstütze ich Ihr Team vor Ort im Raum Bülach/Zürich. Beginn: ab sofort.
 
 Mit freundlichen Grüßen
-{name}
+${name}
 
 ============================================================
 ANSCHREIBEN: ONSITE / FIELD SERVICE / ROLLOUT
@@ -79,7 +57,7 @@ Sehr geehrte Damen und Herren,
 ich bewerbe mich für eine Position im Onsite-/Field-Service. Ich arbeite sorgfältig, kundenorientiert und zuverlässig, auch im Schichtbetrieb. Aufgaben wie Gerätevorbereitung/Imaging, Arbeitsplatzaufbau, Peripherie, Migrationen und Vor-Ort-Support setze ich strukturiert um. Öffentliche Verkehrsmittel nutze ich flexibel im Raum Bülach/Zürich (Fahrzeit < 60 Min.).
 
 Mit freundlichen Grüßen
-{name}
+${name}
 
 ============================================================
 ANSCHREIBEN: JUNIOR SYSTEMADMINISTRATOR / IT OPERATOR
@@ -89,7 +67,7 @@ Sehr geehrte Damen und Herren,
 als technisch versierter Berufseinsteiger mit hands-on Erfahrung in AD/M365, Grundkenntnissen in Skripting (Python) und soliden Netzwerk-Basics unterstütze ich gerne Ihr Team im Betrieb. Durch meine Logistikerfahrung mit SAP handle ich zuverlässig und prozesssicher – auch unter Zeitdruck.
 
 Mit freundlichen Grüßen
-{name}
+${name}
 
 ============================================================
 ANSCHREIBEN: SAP-/LOGISTIK-IT-SUPPORT
@@ -99,7 +77,7 @@ Sehr geehrte Damen und Herren,
 aufgrund meiner Ausbildung in der Informatik und meiner mehrjährigen Tätigkeit in der Logistik (Wareneingang/-ausgang, Kommissionierung, SAP-Buchungen) kann ich sowohl technische Anliegen als auch Prozessfragen kompetent bearbeiten. Ich verbinde IT-Support mit Verständnis für Lagerabläufe und sorge für reibungslose IT-gestützte Prozesse.
 
 Mit freundlichen Grüßen
-{name}
+${name}
 
 ============================================================
 ANSCHREIBEN: LAGER / LOGISTIK (Fachkraft Lagerlogistik)
@@ -109,13 +87,85 @@ Sehr geehrte Damen und Herren,
 ich bewerbe mich als Fachkraft für Lagerlogistik. Ich bringe Erfahrung in Wareneingang/-ausgang, Kommissionierung, Milkrun, Gefahrgut, Inventur und SAP-Buchungen mit. Ich arbeite präzise, zuverlässig und teamorientiert – Schichtarbeit ist in Ordnung. Einsatzort bevorzugt Bülach/Zürich, Anfahrt mit ÖV.
 
 Mit freundlichen Grüßen
-{name}
-""".strip() + "\n"
+${name}
+""".strip()
+    + "\n"
+)
+
+
+def _write_atomic(path, data):
+    # Bytes in Temp-Datei schreiben und per os.replace tauschen (kein halbes File bei Abbruch).
+    tmp = f"{path}.tmp"
+    Path(tmp).write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _open_tab(url):
+    # Einzelnen Tab oeffnen; Browser-Fehler sollen den Lauf nicht abbrechen.
+    try:
+        webbrowser.open_new_tab(url)
+    except Exception:
+        pass
+
+
+def _search_url_signature(cfg):
+    # Alle Config-Felder, aus denen build_search_urls die Links baut.
+    return (
+        tuple(getattr(cfg, "SEARCH_LOCATIONS", None) or ()),
+        getattr(cfg, "LOCATION_RADIUS_KM", None),
+        tuple(getattr(cfg, "SEARCH_KEYWORDS", None) or ()),
+        tuple(getattr(cfg, "TITLE_VARIANTS_DE", None) or ()),
+        tuple(getattr(cfg, "TITLE_VARIANTS_EN", None) or ()),
+        tuple(getattr(cfg, "NEGATIVE_KEYWORDS", None) or ()),
+    )
+
+
+class DirectJobFinder:
+    def __init__(self):
+        # Dynamisch generierte Portal-Suchlinks aus Konfiguration
+        self._urls_signature = None
+        self.direct_job_urls = {}
+        self._refresh_search_urls()
+
+        # Profil für personalisierte Anschreiben
+        self.profile = {
+            "name": getattr(config, "PROFILE_NAME", "") or os.getenv("PROFILE_NAME", ""),
+            "email": getattr(config, "PROFILE_EMAIL", "") or os.getenv("PROFILE_EMAIL", ""),
+            "linkedin": getattr(config, "PROFILE_LINKEDIN", "") or os.getenv("PROFILE_LINKEDIN", ""),
+            "skills": [
+                "IT-Support (1st/2nd Level)",
+                "Windows 10/11, M365, AD",
+                "Ticketing (z. B. ServiceNow/Jira)",
+                "Hardware/Imaging, Remote Support",
+                "Netzwerk-Grundlagen (TCP/IP, VLAN)",
+                "SAP",
+                "Python/SQL (Grundlagen)",
+            ],
+        }
+
+    def _refresh_search_urls(self):
+        """Baut die Portal-Links nur neu, wenn sich die Such-Config geaendert hat."""
+        signature = _search_url_signature(config)
+        if signature != self._urls_signature:
+            self.direct_job_urls = build_search_urls(config)
+            self._urls_signature = signature
+        return self.direct_job_urls
+
+    # ------------------ Datei-Helfer ------------------
+    def save_application_templates(self):
+        """Schreibt optimierte Anschreiben-Vorlagen (IT + Logistik) nach UTF-8."""
+        Path(config.TEMPLATES_FILE).parent.mkdir(parents=True, exist_ok=True)
+        name = (self.profile.get("name") or "Ihr Name").strip()
+        templates = _APPLICATION_TEMPLATES.substitute(
+            name=name,
+            name_upper=name.upper(),
+            linkedin=self.profile["linkedin"],
+            email=self.profile["email"],
+        )
 
         # Entferne harte Namenseinträge zugunsten des Profils
 
-        with open(config.TEMPLATES_FILE, "w", encoding="utf-8") as f:
-            f.write(templates)
+        _write_atomic(config.TEMPLATES_FILE, templates.encode("utf-8"))
         print("Bewerbungsvorlagen aktualisiert (UTF-8)")
 
     def create_job_tracking_sheet(self):
@@ -125,21 +175,23 @@ Mit freundlichen Grüßen
             return
         header = "Datum,Unternehmen,Position,Portal,Link,Status,Notizen"
         example = f"{datetime.now().strftime('%Y-%m-%d')},Beispiel AG,IT Support,JobScout24,https://example.com,Vorbereitet,Anschreiben anpassen"
-        with open(config.TRACKING_FILE, "w", encoding="utf-8") as f:
-            f.write(header + "\n")
-            f.write(example + "\n")
+        _write_atomic(config.TRACKING_FILE, f"{header}\n{example}\n".encode("utf-8"))
         print("Tracking-Sheet erstellt: bewerbungen_tracking.csv")
 
     # ------------------ Suche/Läufe ------------------
     def open_job_portals_automatically(self):
         """Öffnet relevante Job-Portale in neuen Browser-Tabs."""
         print("Öffne Job-Portale im Standardbrowser…")
-        for desc, url in self.direct_job_urls.items():
-            try:
-                webbrowser.open_new_tab(url)
-                time.sleep(0.4)
-            except Exception:
-                pass
+        urls = list(self.direct_job_urls.values())
+        if not urls:
+            return
+        # Erster Tab startet ggf. den Browser; danach alle uebrigen gleichzeitig
+        # (statt 0.4 s Pause pro Tab).
+        _open_tab(urls[0])
+        if len(urls) > 1:
+            time.sleep(0.4)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(_open_tab, urls[1:]))
 
     def run_automated_job_hunt(self):
         """Automatisierte Job-Suche ohne Benutzereingaben."""
@@ -154,8 +206,8 @@ Mit freundlichen Grüßen
             print("Erstelle Tracking-Sheet…")
             self.create_job_tracking_sheet()
 
-        # Links dynamisch aus Config neu aufbauen
-        self.direct_job_urls = build_search_urls(config)
+        # Links aus Config (nur bei geaenderter Such-Config neu aufbauen)
+        self._refresh_search_urls()
 
         # Überblick
         print("\nZIEL-ROLLEN (IT + Logistik):")
@@ -190,8 +242,8 @@ Mit freundlichen Grüßen
             print("Erstelle Tracking-Sheet…")
             self.create_job_tracking_sheet()
 
-        # Links aktualisieren
-        self.direct_job_urls = build_search_urls(config)
+        # Links aktualisieren (nur bei geaenderter Such-Config)
+        self._refresh_search_urls()
 
         print("\nZIEL-ROLLEN (IT + Logistik):")
         print("- IT Support (1st/2nd Level), Service Desk/Workplace")
@@ -0,0 +1,56 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from bewerbungsagent.config import Config
+
+
+class TestConfigFromEnv(unittest.TestCase):
+    def test_load_from_env_reads_one_snapshot(self) -> None:
+        env = {
+            "SENDER_EMAIL": "bot@gmail.com",
+            "SEARCH_LOCATIONS": "Kloten, ,Zug",
+            "LOG_TO_CONSOLE": "nein",
+            "WEEKLY_SUMMARY_ENABLED": "Ja",
+            "SMTP_POOL_SIZE": "0",
+            "EMAIL_MAX_JOBS": "viele",
+        }
+        cfg = Config()
+        with mock.patch.dict(os.environ, env, clear=True), mock.patch.object(
+            os, "getenv", side_effect=AssertionError("os.getenv")
+        ):
+            cfg.load_from_env()
+        self.assertEqual(cfg.SEARCH_LOCATIONS, ["Kloten", "Zug"])
+        self.assertEqual(cfg.RECIPIENT_EMAILS, ["bot@gmail.com"])
+        self.assertEqual((cfg.SMTP_SERVER, cfg.SMTP_PORT), ("smtp.gmail.com", 587))
+        self.assertFalse(cfg.LOG_TO_CONSOLE)
+        self.assertTrue(cfg.WEEKLY_SUMMARY_ENABLED)
+        self.assertEqual(cfg.SMTP_POOL_SIZE, 1)
+        self.assertEqual(cfg.EMAIL_MAX_JOBS, 200)
+
+    def test_dotenv_is_parsed_once(self) -> None:
+        from bewerbungsagent import config as config_mod
+
+        with mock.patch.object(config_mod, "load_dotenv") as load:
+            config_mod._ensure_dotenv()
+            config_mod._ensure_dotenv()
+        load.assert_not_called()
+        self.assertEqual(config_mod._ensure_dotenv.cache_info().currsize, 1)
+
+    def test_default_lists_are_independent_copies(self) -> None:
+        first, second = Config(), Config()
+        first.SEARCH_KEYWORDS.append("Extra")
+        self.assertNotIn("Extra", second.SEARCH_KEYWORDS)
+        self.assertIsInstance(second.TITLE_VARIANTS_DE, list)
+        self.assertEqual(second.SEARCH_LOCATIONS, ["Buelach", "Kloten", "Zuerich"])
+        self.assertIn("Helpdesk", second.SEARCH_KEYWORDS + second.TITLE_VARIANTS_EN)
+
+
+if __name__ == "__main__":
+    unittest.main()
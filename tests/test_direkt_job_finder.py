@@ -0,0 +1,81 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from bewerbungsagent.config import config
+from scripts import direkt_job_finder
+
+
+class TestDirectJobFinder(unittest.TestCase):
+    def test_search_urls_rebuilt_only_on_config_change(self) -> None:
+        with mock.patch.object(
+            direkt_job_finder, "build_search_urls", wraps=direkt_job_finder.build_search_urls
+        ) as build:
+            finder = direkt_job_finder.DirectJobFinder()
+            first = finder._refresh_search_urls()
+            finder._refresh_search_urls()
+            self.assertEqual(build.call_count, 1)
+            with mock.patch.object(config, "SEARCH_LOCATIONS", ["Kloten"]):
+                changed = finder._refresh_search_urls()
+            self.assertEqual(build.call_count, 2)
+        self.assertIn("location=Kloten", changed["jobs.ch • IT Support"])
+        self.assertNotEqual(first, changed)
+
+    def test_open_portals_waits_once_and_opens_every_tab(self) -> None:
+        finder = direkt_job_finder.DirectJobFinder()
+        finder.direct_job_urls = {f"Portal {i}": f"https://x.ch/{i}" for i in range(5)}
+        with mock.patch.object(
+            direkt_job_finder.webbrowser, "open_new_tab", side_effect=[True, OSError, True, True, True]
+        ) as open_tab, mock.patch.object(direkt_job_finder.time, "sleep") as sleep:
+            finder.open_job_portals_automatically()
+        self.assertEqual(open_tab.call_args_list[0], mock.call("https://x.ch/0"))
+        self.assertEqual(
+            sorted(c.args[0] for c in open_tab.call_args_list),
+            [f"https://x.ch/{i}" for i in range(5)],
+        )
+        sleep.assert_called_once_with(0.4)
+
+    def test_templates_fill_profile_values(self) -> None:
+        finder = direkt_job_finder.DirectJobFinder()
+        finder.profile.update(name=" Max Muster ", email="max@x.ch", linkedin="linkedin.com/in/$max")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "vorlagen.txt"
+            with mock.patch.object(config, "TEMPLATES_FILE", str(path)):
+                finder.save_application_templates()
+            text = path.read_text(encoding="utf-8")
+        self.assertTrue(text.startswith("MAX MUSTER – BEWERBUNGSVORLAGEN\n"))
+        self.assertIn("LinkedIn: linkedin.com/in/$max\nE-Mail: max@x.ch\n", text)
+        self.assertEqual(text.count("Mit freundlichen Grüßen\nMax Muster\n"), 5)
+        self.assertTrue(text.endswith("Max Muster\n"))
+
+    def test_tracking_sheet_written_atomically_once(self) -> None:
+        finder = direkt_job_finder.DirectJobFinder()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data" / "tracking.csv"
+            with mock.patch.object(config, "TRACKING_FILE", str(path)):
+                finder.create_job_tracking_sheet()
+                lines = path.read_text(encoding="utf-8").splitlines()
+                path.write_text("eigene Daten\n", encoding="utf-8")
+                finder.create_job_tracking_sheet()
+            self.assertEqual(lines[0], "Datum,Unternehmen,Position,Portal,Link,Status,Notizen")
+            self.assertEqual(len(lines), 2)
+            self.assertEqual(path.read_text(encoding="utf-8"), "eigene Daten\n")
+            self.assertEqual([p.name for p in path.parent.iterdir()], ["tracking.csv"])
+
+    def test_write_atomic_replaces_existing_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "vorlagen.txt"
+            path.write_text("alt", encoding="utf-8")
+            direkt_job_finder._write_atomic(str(path), "Grüße\n".encode("utf-8"))
+            self.assertEqual(path.read_bytes(), "Grüße\n".encode("utf-8"))
+            self.assertFalse(Path(f"{path}.tmp").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import gc
+import smtplib
+import sys
+import tempfile
+import unittest
+import weakref
+from email.message import EmailMessage
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from bewerbungsagent.config import config
+from bewerbungsagent import email_automation
+from bewerbungsagent.email_automation import EmailAutomation, _job_to_dict, _normalize_job
+from bewerbungsagent.job_adapters_ch import JobRow
+
+
+class TestEmailBodies(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mailer = EmailAutomation()
+
+    def test_job_alert_body_escapes_and_parses(self) -> None:
+        jobs = [
+            {
+                "job_title": "IT <Support>",
+                "company": "A&B AG",
+                "location": "Zuerich",
+                "link": "https://example.ch/job/1",
+                "score": 12,
+            },
+            {"raw_title": "Systemtechniker\nArbeitsort\nBuelach\nMuster GmbH"},
+        ]
+        body = self.mailer._create_job_alert_body(jobs, [])
+        self.assertIn("IT &lt;Support&gt;", body)
+        self.assertIn("A&amp;B AG", body)
+        self.assertIn("Score 12", body)
+        self.assertIn("<strong>Systemtechniker</strong> bei Muster GmbH", body)
+        self.assertIn("<em>Buelach</em>", body)
+        self.assertIn("Kein Link vorhanden", body)
+        self.assertIn("Keine offenen Erinnerungen.", body)
+
+    def test_job_to_dict_reads_dataclass_fields(self) -> None:
+        row = JobRow("IT Support", "Muster AG", "Zuerich", "https://x.ch/job/1", score=7)
+        data = _job_to_dict(row)
+        self.assertEqual(data["title"], "IT Support")
+        self.assertEqual(data["score"], 7)
+        self.assertEqual(set(data), {"title", "company", "location", "link", "raw_title", "date", "source", "cls", "score"})
+
+    def test_normalize_job_skips_parsing_for_complete_dicts(self) -> None:
+        job = {
+            "job_title": " Helpdesk ",
+            "company": "Muster AG",
+            "location": "Kloten",
+            "raw_title": "Helpdesk\nArbeitsort\nKloten",
+            "url": "https://x.ch/job/2",
+        }
+        with mock.patch.object(email_automation, "extract_from_multiline_title") as parse:
+            data = _normalize_job(job)
+        parse.assert_not_called()
+        self.assertEqual(data["job_title"], "Helpdesk")
+        self.assertEqual(data["link"], "https://x.ch/job/2")
+        self.assertEqual(data["score"], "")
+
+    def test_error_body_traceback_optional(self) -> None:
+        with_tb = self.mailer._create_error_body("Crash", "boom", "Traceback ...")
+        without_tb = self.mailer._create_error_body("Crash", "boom", None)
+        self.assertIn("Traceback ...", with_tb)
+        self.assertNotIn("Traceback:", without_tb)
+        self.assertIn("boom", without_tb)
+
+
+class TestSendEmail(unittest.TestCase):
+    def test_send_email_builds_html_message_with_attachment(self) -> None:
+        class _Pool:
+            def __init__(self):
+                self.sent = []
+
+            def send_message(self, msg, from_addr, to_addrs):
+                self.sent.append((msg, from_addr, to_addrs))
+
+        mailer = EmailAutomation()
+        mailer._pool = _Pool()
+        mailer.sender_email = "bot@example.ch"
+        mailer.recipient_emails = ["a@example.ch", "b@example.ch"]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "jobs.csv"
+            path.write_bytes(b"a;b\n")
+            with mock.patch.object(config, "EMAIL_NOTIFICATIONS_ENABLED", True, create=True):
+                ok = mailer._send_email("Jobs", "<p>Zürich</p>", priority="high", attachment=str(path))
+
+        self.assertTrue(ok)
+        msg, from_addr, to_addrs = mailer._pool.sent[0]
+        self.assertEqual(from_addr, "bot@example.ch")
+        self.assertEqual(to_addrs, ["a@example.ch", "b@example.ch"])
+        self.assertEqual(msg["To"], "a@example.ch, b@example.ch")
+        self.assertEqual(msg["X-Priority"], "1")
+        html_part = msg.get_body(preferencelist=("html",))
+        self.assertEqual(html_part.get_content().strip(), "<p>Zürich</p>")
+        attachments = list(msg.iter_attachments())
+        self.assertEqual(attachments[0].get_filename(), "jobs.csv")
+        self.assertEqual(attachments[0].get_content(), b"a;b\n")
+
+
+class TestSMTPPool(unittest.TestCase):
+    def _pool_with(self, errors):
+        class _Conn:
+            def __init__(self):
+                self.sent = 0
+
+            def send_message(self, msg, from_addr, to_addrs):
+                if errors:
+                    raise errors.pop(0)
+                self.sent += 1
+
+            def quit(self):
+                pass
+
+        conns = []
+
+        def connect():
+            conns.append(_Conn())
+            return conns[-1]
+
+        return email_automation.SMTPPool(connect), conns
+
+    def test_transient_4xx_is_retried(self) -> None:
+        pool, conns = self._pool_with([smtplib.SMTPResponseException(451, b"try later")])
+        with mock.patch.object(email_automation.time, "sleep") as sleep:
+            pool.send_message(EmailMessage(), "a@x.ch", ["b@x.ch"])
+        self.assertEqual(len(conns), 2)
+        self.assertEqual(conns[-1].sent, 1)
+        sleep.assert_called_once_with(1)
+
+    def test_mailer_pools_are_tracked_weakly_and_closed_at_exit(self) -> None:
+        mailer = EmailAutomation()
+        pool = mailer._pool
+        self.assertIn(pool, email_automation._OPEN_POOLS)
+        with mock.patch.object(pool, "close") as close:
+            email_automation._close_open_pools()
+        close.assert_called_once_with()
+        ref = weakref.ref(mailer)
+        del mailer, pool
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_permanent_554_is_not_retried(self) -> None:
+        pool, conns = self._pool_with([smtplib.SMTPResponseException(554, b"rejected")])
+        with mock.patch.object(email_automation.time, "sleep") as sleep:
+            with self.assertRaises(smtplib.SMTPResponseException):
+                pool.send_message(EmailMessage(), "a@x.ch", ["b@x.ch"])
+        self.assertEqual(len(conns), 1)
+        sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
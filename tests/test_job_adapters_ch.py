@@ -0,0 +1,231 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from bewerbungsagent.job_adapters_ch import (
+    JobsChAdapter,
+    _extract_dom_links,
+    _is_detail_link,
+    _normalize_link,
+    _parse_jsonld,
+    _to_jobrows,
+)
+
+
+class TestJobAdaptersCh(unittest.TestCase):
+    def test_detail_link_detection(self) -> None:
+        self.assertTrue(_is_detail_link("https://www.jobs.ch/de/stellenangebote/detail/abc/"))
+        self.assertTrue(
+            _is_detail_link(
+                "https://www.jobup.ch/de/jobs/2dc9a470-dcd0-4eae-ab8e-7be3863724b5"
+            )
+        )
+        self.assertTrue(_is_detail_link("https://example.ch/stellen/1234567"))
+        self.assertFalse(_is_detail_link("https://www.jobs.ch/de/stellenangebote/?term=it"))
+        self.assertFalse(_is_detail_link(""))
+        self.assertTrue(_is_detail_link("https://www.jobs.ch/de/JobAd/abc"))
+        self.assertTrue(
+            _is_detail_link("https://x.ch/2DC9A470-DCD0-4EAE-AB8E-7BE3863724B5")
+        )
+
+    def test_normalize_link_strips_query_and_fragment(self) -> None:
+        self.assertEqual(
+            _normalize_link("https://www.jobs.ch/de/job/1?utm_source=x#top"),
+            "https://www.jobs.ch/de/job/1",
+        )
+        self.assertEqual(_normalize_link(""), "")
+        self.assertEqual(
+            _normalize_link(" https://www.jobs.ch/de/job/2#a?b "),
+            "https://www.jobs.ch/de/job/2",
+        )
+        self.assertEqual(_normalize_link("https://www.jobs.ch/de/job/3/"), "https://www.jobs.ch/de/job/3/")
+
+    def test_parse_jsonld_graph(self) -> None:
+        html = """
+        <script type="application/ld+json">
+        {"@graph": [
+          {"@type": "Organization", "name": "Ignore"},
+          {"@type": "JobPosting", "title": "IT Supporter",
+           "url": "https://www.jobs.ch/de/stellenangebote/detail/123/",
+           "hiringOrganization": {"name": "Muster AG"},
+           "jobLocation": {"address": {"addressLocality": "Buelach"}}}
+        ]}
+        </script>
+        <script type="application/ld+json">{broken</script>
+        """
+        items = _parse_jsonld(html)
+        self.assertEqual(len(items), 1)
+        rows = _to_jobrows(items, "jobs.ch")
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0].title, "IT Supporter")
+        self.assertEqual(rows[0].company, "Muster AG")
+        self.assertEqual(rows[0].location, "Buelach")
+
+    def test_extract_dom_links_single_script_call(self) -> None:
+        class _Driver:
+            calls = 0
+
+            def execute_script(self, script, *args):
+                self.calls += 1
+                return [
+                    {"href": "https://www.jobs.ch/de/job/1/?utm=x", "text": "Neu\nIT Support\nMuster AG"},
+                    {"href": "https://www.jobs.ch/de/job/1/", "text": "IT Support"},
+                    {"href": "https://www.jobs.ch/de/job/2/", "text": "", "aria": "Helpdesk"},
+                    {"href": "https://www.jobs.ch/de/suche/", "text": "Suche"},
+                ]
+
+            def find_elements(self, *args):
+                raise AssertionError("find_elements should not be used")
+
+        driver = _Driver()
+        rows = _extract_dom_links(driver, "jobs.ch", "https://www.jobs.ch/")
+        self.assertEqual(driver.calls, 1)
+        self.assertEqual([r.title for r in rows], ["IT Support", "Helpdesk"])
+        self.assertEqual(rows[0].raw_title, "Neu\nIT Support\nMuster AG")
+
+    def test_extract_dom_links_fallback_uses_union_selector(self) -> None:
+        class _Anchor:
+            text = "IT Support"
+
+            def get_attribute(self, name):
+                return "https://www.jobs.ch/de/job/7/" if name == "href" else ""
+
+        class _Driver:
+            def __init__(self):
+                self.selectors = []
+
+            def execute_script(self, script, *args):
+                raise RuntimeError("no js")
+
+            def find_elements(self, by, selector):
+                self.selectors.append(selector)
+                return [_Anchor(), _Anchor()]
+
+        driver = _Driver()
+        rows = _extract_dom_links(driver, "jobs.ch", "https://www.jobs.ch/")
+        self.assertEqual(len(driver.selectors), 1)
+        self.assertIn('a[href*="/jobad/"], ', driver.selectors[0])
+        self.assertEqual([r.title for r in rows], ["IT Support"])
+
+    def test_collect_dedupes_across_pages_and_stops_at_limit(self) -> None:
+        class _Driver:
+            page_source = ""
+
+            def __init__(self):
+                self.pages = []
+                self.cookie_calls = 0
+
+            def get(self, url):
+                self.pages.append(url)
+
+            def execute_script(self, script, *args):
+                if not args:
+                    self.cookie_calls += 1
+                    return True
+                n = len(self.pages)
+                return [
+                    {"href": f"https://www.jobs.ch/de/job/{n}/", "text": f"Job {n}"},
+                    {"href": f"https://www.jobs.ch/de/job/{n + 1}/", "text": f"Job {n + 1}"},
+                ]
+
+        driver = _Driver()
+        rows = JobsChAdapter()._collect(driver, "https://www.jobs.ch/?term=it", 5, 3)
+        self.assertEqual([r.title for r in rows], ["Job 1", "Job 2", "Job 3"])
+        self.assertEqual(len(driver.pages), 2)
+        self.assertEqual(driver.cookie_calls, 1)
+
+    def test_collect_prefers_http_jsonld_and_prefetches_pages(self) -> None:
+        class _Resp:
+            status_code = 200
+
+            def __init__(self, page):
+                self.text = (
+                    '<script type="application/ld+json">{"@type": "JobPosting",'
+                    f' "title": "Support {page}",'
+                    f' "url": "https://www.jobs.ch/de/stellenangebote/detail/{page}/"}}</script>'
+                )
+
+        class _Session:
+            def __init__(self):
+                self.cookies = self
+                self.urls = []
+
+            def set(self, *args, **kwargs):
+                pass
+
+            def get(self, url, timeout=None):
+                self.urls.append(url)
+                return _Resp(url.rsplit("=", 1)[1])
+
+        class _Driver:
+            def __init__(self):
+                self.pages = []
+
+            def get(self, url):
+                self.pages.append(url)
+
+            def get_cookies(self):
+                return [{"name": "consent", "value": "1", "domain": ".jobs.ch"}]
+
+            def execute_script(self, script, *args):
+                return False
+
+            @property
+            def page_source(self):
+                raise AssertionError("page_source should not be used")
+
+        adapter = JobsChAdapter()
+        adapter._session = _Session()
+        driver = _Driver()
+        rows = adapter._collect(driver, "https://www.jobs.ch/?term=it", 3, None)
+        self.assertEqual([r.title for r in rows], ["Support 1", "Support 2", "Support 3"])
+        self.assertEqual(driver.pages, ["https://www.jobs.ch/?term=it&page=1"])
+        self.assertEqual(sorted(adapter._session.urls)[0], "https://www.jobs.ch/?term=it&page=1")
+        self.assertEqual(len(adapter._session.urls), 3)
+    def test_page_source_jsonld_used_when_http_html_has_no_postings(self) -> None:
+        class _Resp:
+            status_code = 200
+            text = "<html><body>Bitte Cookies akzeptieren</body></html>"
+
+        class _Session:
+            def get(self, url, timeout=None):
+                return _Resp()
+
+        class _Driver:
+            page_source = (
+                '<script type="application/ld+json">{"@type": "JobPosting",'
+                ' "title": "Rendered Support",'
+                ' "url": "https://www.jobs.ch/de/stellenangebote/detail/9/"}</script>'
+            )
+
+            def __init__(self):
+                self.pages = []
+
+            def get(self, url):
+                self.pages.append(url)
+
+            def find_element(self, *args):
+                return object()
+
+            def execute_script(self, script, *args):
+                if args:
+                    raise AssertionError("DOM links should not be used")
+                return False
+
+        adapter = JobsChAdapter()
+        adapter._session = _Session()
+        driver = _Driver()
+        rows = adapter._page_rows(driver, "https://www.jobs.ch/?term=it&page=1", ("s", "jobs.ch"))
+        self.assertEqual([r.title for r in rows], ["Rendered Support"])
+        rows = adapter._page_rows(
+            driver, "https://www.jobs.ch/?term=it&page=2", ("s", "jobs.ch"), _Resp.text
+        )
+        self.assertEqual([r.title for r in rows], ["Rendered Support"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,32 @@
+import json
+import os
+import sqlite3
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from bewerbungsagent import job_collector
 from bewerbungsagent.job_collector import (
+    _aggregator_link_ok,
+    _env_csv,
+    _env_source_set,
+    _validate_links_bulk,
     _batch_terms,
     _contains_blocked_terms,
     _extract_jobposting_location,
     _infer_location_from_normalized_text,
+    _normalize_text,
     _empty_cache_key,
     _extract_relevant_detail_text,
+    _has_required_keywords,
+    _score_title,
+    Job,
     _prune_empty_search_cache,
     _split_tasks,
 )
@@ -36,9 +50,383 @@ class TestJobCollectorUtils(unittest.TestCase):
         batched = _batch_terms(terms, 2, "OR")
         self.assertEqual(batched, ["alpha OR beta", "gamma OR delta"])
 
+    def test_normalize_text_umlauts_and_ascii_fast_path(self) -> None:
+        self.assertEqual(_normalize_text("Zürich  HB"), "zuerich hb")
+        self.assertEqual(_normalize_text("Straße / Genève"), "strasse geneve")
+        self.assertEqual(_normalize_text("IT-Support (m/w/d)"), "it support m w d")
+        self.assertEqual(_normalize_text(""), "")
+
+    def test_keyword_matching_with_and_without_automaton(self) -> None:
+        job = Job(raw_title="", title="IT Support Engineer", company="Muster AG", location="Zuerich", link="", source="x")
+        for backend in (job_collector.ahocorasick, None):
+            with mock.patch.object(job_collector, "ahocorasick", backend):
+                job_collector._term_automaton.cache_clear()
+                self.assertTrue(_contains_blocked_terms("senior it support engineer", {"senior"}))
+                self.assertTrue(_contains_blocked_terms("5 years of experience", {"5 years experience"}))
+                self.assertFalse(_contains_blocked_terms("it support", {"french", "senior"}))
+                self.assertTrue(_has_required_keywords(job, {"it", "windows"}))
+                self.assertTrue(_has_required_keywords(job, {"support"}))
+                self.assertFalse(_has_required_keywords(job, {"ug", "windows"}))
+        job_collector._term_automaton.cache_clear()
+
+    def test_multiword_terms_are_split_once(self) -> None:
+        blocked = frozenset({"senior", "5 years experience"})
+        self.assertEqual(job_collector._multiword_terms(blocked), (("5", "years", "experience"),))
+        self.assertIs(job_collector._multiword_terms(blocked), job_collector._multiword_terms(blocked))
+
+    def test_job_norm_blob_matches_joined_normalization(self) -> None:
+        job = Job("Neu\nIT-Supporter (m/w)", "IT-Supporter", "", "Zürich HB", "https://x.ch/a?b=1", "x")
+        fields = ("title", "raw_title", "company", "location", "link")
+        joined = " ".join(getattr(job, f) or "" for f in fields)
+        self.assertEqual(job_collector._job_norm_blob(job, fields), _normalize_text(joined))
+
+    def test_location_match_does_not_cross_field_boundaries(self) -> None:
+        job = Job("", "IT Support Zuerich", "", "Kloten", "", "x")
+        for backend in (job_collector.ahocorasick, None):
+            with mock.patch.object(job_collector, "ahocorasick", backend):
+                job_collector._term_automaton.cache_clear()
+                self.assertTrue(job_collector._is_local(job, ["Zürich"]))
+                self.assertTrue(job_collector._is_allowed_location(job, {"kloten", ""}))
+                self.assertFalse(job_collector._is_local(job, ["kloten it"]))
+                self.assertFalse(job_collector._is_allowed_location(job, {"", "-"}))
+        job_collector._term_automaton.cache_clear()
+        loc_text = job_collector._location_text(job)
+        self.assertEqual(loc_text, "kloten\x1fit support zuerich\x1f")
+        self.assertTrue(job_collector._is_local(job, ["bern"], "bern\x1f\x1f"))
+
+    def test_norm_key_strips_punctuation_and_query(self) -> None:
+        self.assertEqual(
+            job_collector._norm_key("IT-Support (m/w)", "Müller_AG", "https://X.ch/Job/1?utm=a#top"),
+            ("itsupportmw", "müller_ag", "https://x.ch/job/1"),
+        )
+
+    def test_normalize_row_handles_dicts_dataclasses_and_objects(self) -> None:
+        from bewerbungsagent.job_adapters_ch import JobRow
+
+        expected = {
+            "title": "IT Support",
+            "link": "https://x.ch/1",
+            "raw_title": "IT Support",
+            "company": "Muster AG",
+            "location": "",
+            "date": "",
+        }
+        row = JobRow("IT Support", "Muster AG", "", "https://x.ch/1", date=None)
+        self.assertEqual(job_collector._normalize_row(row), expected)
+        self.assertEqual(
+            job_collector._normalize_row(
+                {"title": "IT Support", "link": "https://x.ch/1", "company": "Muster AG"}
+            ),
+            expected,
+        )
+
+        class _Partial:
+            title = "IT Support"
+            link = "https://x.ch/1"
+            company = "Muster AG"
+
+        self.assertEqual(job_collector._normalize_row(_Partial()), expected)
+        self.assertEqual(job_collector._normalize_row(object())["title"], "")
+
+    def test_score_title_same_with_and_without_automaton(self) -> None:
+        terms = (frozenset({"it support", "support", "helpdesk"}), frozenset({"senior", "lead"}))
+        terms = (*terms, terms[0] | terms[1])
+        titles = ["IT Support Engineer", "Senior IT Support", "Helpdesk Support Support", "Koch"]
+        expected = [(20, "exact"), (0, "weak"), (20, "exact"), (0, "weak")]
+        with mock.patch.object(job_collector, "_score_terms", return_value=terms):
+            for backend in (job_collector.ahocorasick, None):
+                with mock.patch.object(job_collector, "ahocorasick", backend):
+                    job_collector._term_automaton.cache_clear()
+                    _score_title.cache_clear()
+                    self.assertEqual([_score_title(t) for t in titles], expected)
+        job_collector._term_automaton.cache_clear()
+        _score_title.cache_clear()
+
+    def test_extract_links_same_with_and_without_lexbor(self) -> None:
+        html = '<a href="/jobs/1">IT  <b>Support</b>\n Engineer</a><a>x</a><A HREF="mailto:hr@x.ch">HR &amp; Team</A>'
+        expected = [("/jobs/1", "IT Support Engineer"), ("mailto:hr@x.ch", "HR & Team")]
+        for backend in (job_collector._LexborHTMLParser, None):
+            with mock.patch.object(job_collector, "_LexborHTMLParser", backend):
+                self.assertEqual(job_collector._extract_links(html), expected)
+
+    def test_extract_emails_prefers_mailto_and_skips_portals(self) -> None:
+        html = (
+            "<p>Fragen an info@firma.ch.</p>"
+            '<a href="mailto:Bewerbung@Firma.ch?subject=IT">Bewerben</a> bewerbung@firma.ch, support@jobs.ch'
+        )
+        self.assertEqual(
+            job_collector._extract_emails_from_html(html),
+            ["Bewerbung@Firma.ch", "info@firma.ch"],
+        )
+
+    def test_commute_minutes_prefers_longest_key_across_fields(self) -> None:
+        commute_map = job_collector._parse_commute_map("Zuerich:30, Zuerich Oerlikon:20, Kloten=35")
+        job = Job(raw_title="", title="Support Zürich Oerlikon", company="", location="Zürich", link="", source="x")
+        self.assertEqual(job_collector._commute_minutes_for(job, commute_map), 20)
+        job.title = "Support"
+        self.assertEqual(job_collector._commute_minutes_for(job, commute_map), 30)
+        job.location = "Bern"
+        self.assertIsNone(job_collector._commute_minutes_for(job, commute_map))
+
+    def test_html_to_lines_breaks_blocks_and_drops_scripts(self) -> None:
+        html = (
+            "<div>Kontakt<br/>Frau <b>Anna</b> Muster</div>"
+            "<script>var x = '</p>';</script><p>HR &amp; Recruiting</p>"
+        )
+        self.assertEqual(
+            job_collector._html_to_lines(html),
+            ["Kontakt", "Frau Anna Muster", "HR & Recruiting"],
+        )
+
     def test_empty_cache_key_normalized(self) -> None:
         key = _empty_cache_key("JobWinner", "IT Support", "Zuerich HB", 25)
-        self.assertEqual(key, "jobwinner|it support|zuerich hb|25")
+        self.assertEqual(key, ("jobwinner", "it support", "zuerich hb", 25))
+        self.assertEqual(job_collector._empty_key_to_db(key), "jobwinner|it support|zuerich hb|25")
+        self.assertEqual(job_collector._empty_key_from_db("jobwinner|it support|zuerich hb|25"), key)
+        self.assertIsNone(job_collector._empty_key_from_db("kaputt|25"))
+
+    def test_aggregator_link_check_uses_shared_session(self) -> None:
+        class _Resp:
+            def __init__(self, status, body):
+                self.status_code = status
+                self.body = body
+                self.closed = False
+
+            def iter_content(self, chunk_size=4096):
+                yield self.body
+
+            def close(self):
+                self.closed = True
+
+        responses = {
+            "https://agg.example/ok": _Resp(200, b"<h1>IT Support</h1>"),
+            "https://agg.example/gone": _Resp(200, b"<h1>Job not found</h1>"),
+            "https://agg.example/404": _Resp(404, b""),
+        }
+        heads = {
+            "https://agg.example/404": mock.Mock(status_code=404, headers={}),
+            "https://agg.example/pdf": mock.Mock(
+                status_code=200, headers={"Content-Type": "application/pdf"}
+            ),
+        }
+        session = mock.Mock()
+        session.get.side_effect = lambda url, **kwargs: responses[url]
+        session.head.side_effect = lambda url, **kwargs: heads.get(
+            url, mock.Mock(status_code=200, headers={"Content-Type": "text/html"})
+        )
+        with mock.patch.object(job_collector, "_HTTP_SESSION", session), mock.patch.dict(
+            job_collector.AGGREGATOR_LINK_CACHE, clear=True
+        ):
+            self.assertTrue(_aggregator_link_ok("https://agg.example/ok"))
+            self.assertFalse(_aggregator_link_ok("https://agg.example/gone"))
+            self.assertFalse(_aggregator_link_ok("https://agg.example/404"))
+            self.assertTrue(_aggregator_link_ok("https://agg.example/pdf"))
+            self.assertTrue(_aggregator_link_ok("https://agg.example/ok"))
+        self.assertEqual(session.head.call_count, 4)
+        self.assertEqual(session.get.call_count, 2)
+        self.assertTrue(responses["https://agg.example/ok"].closed)
+
+    @unittest.skipIf(job_collector.httpx is None, "httpx nicht installiert")
+    def test_aggregator_link_ok_uses_httpx_client_when_enabled(self) -> None:
+        httpx = job_collector.httpx
+        bodies = {"/ok": (200, b"<h1>IT Support</h1>"), "/gone": (200, b"Seite nicht gefunden")}
+
+        def _handler(request):
+            status, body = bodies.get(request.url.path, (404, b""))
+            return httpx.Response(status, content=body)
+
+        client = httpx.Client(transport=httpx.MockTransport(_handler))
+        session = mock.Mock()
+        with mock.patch.object(job_collector, "_HTTPX_CLIENT", client), mock.patch.object(
+            job_collector, "_HTTP_SESSION", session
+        ), mock.patch.dict(job_collector.AGGREGATOR_LINK_CACHE, clear=True):
+            self.assertTrue(_aggregator_link_ok("https://agg.example/ok"))
+            self.assertFalse(_aggregator_link_ok("https://agg.example/gone"))
+            self.assertFalse(_aggregator_link_ok("https://agg.example/missing"))
+        session.get.assert_not_called()
+
+    @unittest.skipIf(job_collector.httpx is None, "httpx nicht installiert")
+    def test_request_adapter_search_accepts_httpx_client(self) -> None:
+        from bewerbungsagent.job_adapters_extra import JobScout24Adapter
+
+        httpx = job_collector.httpx
+        html = (
+            '<script type="application/ld+json">{"@type": "JobPosting",'
+            ' "title": "IT Support", "url": "https://www.jobscout24.ch/de/job/1/"}</script>'
+        )
+        client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, text=html))
+        )
+        rows = JobScout24Adapter().search(None, "it support", "Zuerich", session=client)
+        self.assertEqual([r.title for r in rows], ["IT Support"])
+        self.assertEqual(rows[0].link, "https://www.jobscout24.ch/de/job/1/")
+
+    @unittest.skipIf(job_collector.httpx is None, "httpx nicht installiert")
+    def test_client_closed_detects_closed_shared_client(self) -> None:
+        httpx = job_collector.httpx
+        client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, text=""))
+        )
+        self.assertFalse(job_collector._client_closed(client))
+        self.assertFalse(job_collector._client_closed(job_collector.requests.Session()))
+        client.close()
+        self.assertTrue(job_collector._client_closed(client))
+        with self.assertRaises(RuntimeError):
+            client.get("https://www.jobscout24.ch/")
+
+    def test_detail_scans_use_shared_session(self) -> None:
+        html = (
+            '<html><body><main><p>Kontakt: Anna Muster</p>'
+            '<a href="mailto:jobs@muster.ch">Mail</a><p>Arbeitsort Kloten</p></main></body></html>'
+        )
+        class _Resp:
+            encoding = "utf-8"
+
+            def __init__(self, body):
+                self.body = body
+                self.closed = False
+
+            def raise_for_status(self):
+                pass
+
+            def iter_content(self, chunk_size=8192):
+                for i in range(0, len(self.body), 16):
+                    yield self.body[i : i + 16]
+
+            def close(self):
+                self.closed = True
+
+        session = mock.Mock()
+        session.get.side_effect = lambda url, **kwargs: _Resp(html.encode("utf-8"))
+        with mock.patch.object(job_collector, "_HTTP_SESSION", session), mock.patch.object(
+            job_collector.requests, "get", side_effect=AssertionError("requests.get")
+        ), mock.patch.dict(job_collector.DETAILS_CONTACT_CACHE, clear=True), mock.patch.dict(
+            job_collector.DETAILS_TEXT_CACHE, clear=True
+        ), mock.patch.dict(job_collector.DETAILS_LOCATION_CACHE, clear=True):
+            email, _name = job_collector._detail_page_contact("https://x.ch/job/1")
+            text = job_collector._detail_page_text("https://x.ch/job/1", 5, 0)
+        self.assertEqual(email, "jobs@muster.ch")
+        self.assertIn("arbeitsort kloten", text)
+        self.assertEqual(session.get.call_count, 2)
+
+    def test_fetch_capped_text_stops_at_byte_cap(self) -> None:
+        chunks = [b"<p>Z\xc3\xbcrich ", b"x" * 20000, b"never read"]
+        resp = mock.Mock(encoding=None)
+        resp.iter_content.return_value = iter(chunks)
+        session = mock.Mock()
+        session.get.return_value = resp
+        with mock.patch.object(job_collector, "_HTTP_SESSION", session):
+            text = job_collector._fetch_capped_text("https://x.ch/job", "ua", 5, 100)
+        self.assertEqual(len(text.encode("utf-8")), 100)
+        self.assertTrue(text.startswith("<p>Zürich x"))
+        self.assertTrue(session.get.call_args.kwargs["stream"])
+        resp.close.assert_called_once()
+
+    def test_export_json_output_is_backend_independent(self) -> None:
+        jobs = [Job("IT Support\nMuster AG\nZürich", "IT Support", "", "", "https://x.ch/1", "jobs.ch", score=4)]
+        with tempfile.TemporaryDirectory() as tmp:
+            fast = Path(tmp) / "fast.json"
+            slow = Path(tmp) / "slow.json"
+            job_collector._parse_multiline_title.cache_clear()
+            job_collector.export_json(jobs, str(fast))
+            with mock.patch.object(job_collector, "orjson", None):
+                job_collector.export_json(jobs, str(slow))
+            self.assertEqual(job_collector._parse_multiline_title.cache_info().misses, 1)
+            self.assertEqual(fast.read_bytes(), slow.read_bytes())
+            data = json.loads(fast.read_text(encoding="utf-8"))
+        self.assertEqual(data[0]["company"], "Muster AG")
+        self.assertEqual(data[0]["score"], 4)
+
+    def test_wait_for_host_slot_spaces_requests_per_host(self) -> None:
+        sleeps = []
+        with mock.patch.object(job_collector, "DETAILS_HOST_INTERVAL_SEC", 2.0), mock.patch.dict(
+            job_collector._DETAIL_HOST_NEXT, clear=True
+        ), mock.patch.object(job_collector.time, "monotonic", return_value=100.0), mock.patch.object(
+            job_collector.time, "sleep", side_effect=sleeps.append
+        ):
+            job_collector._wait_for_host_slot("https://www.jobs.ch/1")
+            job_collector._wait_for_host_slot("https://firma.ch/a")
+            job_collector._wait_for_host_slot("https://www.jobs.ch/2")
+            job_collector._wait_for_host_slot("https://www.jobs.ch/3")
+        self.assertEqual(sleeps, [2.0, 4.0])
+        retry = job_collector._HTTP_SESSION.get_adapter("https://x.ch").max_retries
+        self.assertEqual(retry.status, 0)
+
+    def test_location_boost_uses_pre_normalized_terms(self) -> None:
+        terms = job_collector._normalize_terms(["Zürich", "Bülach", ""])
+        self.assertEqual(job_collector._location_boost("8180 Buelach ZH", terms), 1)
+        self.assertEqual(job_collector._location_boost("Zuerich-Oerlikon", terms), 1)
+        self.assertEqual(job_collector._location_boost("Bern", terms), 0)
+        self.assertEqual(job_collector._location_boost("", frozenset()), 0)
+
+    def test_trim_detail_caches_drops_oldest_entries(self) -> None:
+        blocklist = {f"https://x.ch/{i}": False for i in range(5)}
+        contacts = {"https://x.ch/0": ("", ""), "https://x.ch/4": ("a@x.ch", "")}
+        with mock.patch.dict(job_collector.DETAILS_BLOCKLIST_CACHE, blocklist, clear=True), \
+                mock.patch.dict(job_collector.DETAILS_CONTACT_CACHE, contacts, clear=True), \
+                mock.patch.object(job_collector, "DETAILS_CONTACT_FAILED", {"https://x.ch/0"}):
+            job_collector._trim_detail_caches(1)
+            self.assertEqual(list(job_collector.DETAILS_BLOCKLIST_CACHE), ["https://x.ch/4"])
+            self.assertEqual(list(job_collector.DETAILS_CONTACT_CACHE), ["https://x.ch/4"])
+            self.assertEqual(job_collector.DETAILS_CONTACT_FAILED, set())
+            job_collector._trim_detail_caches(0)
+            self.assertEqual(len(job_collector.DETAILS_BLOCKLIST_CACHE), 1)
+
+    def test_interleave_by_host_round_robins_hosts(self) -> None:
+        urls = [
+            "https://www.jobs.ch/1",
+            "https://www.jobs.ch/2",
+            "https://www.jobs.ch/3",
+            "https://firma.ch/a",
+            "https://JOBUP.ch/x",
+        ]
+        self.assertEqual(
+            job_collector._interleave_by_host(urls),
+            [
+                "https://www.jobs.ch/1",
+                "https://firma.ch/a",
+                "https://JOBUP.ch/x",
+                "https://www.jobs.ch/2",
+                "https://www.jobs.ch/3",
+            ],
+        )
+        self.assertEqual(job_collector._interleave_by_host(urls[:2]), urls[:2])
+
+    def test_prefetch_details_runs_in_parallel_and_ignores_errors(self) -> None:
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+        seen = []
+
+        def _fetch(url):
+            barrier.wait()
+            seen.append(url)
+            if url.endswith("3"):
+                raise RuntimeError("boom")
+
+        with mock.patch.object(job_collector, "REQUESTS_ADAPTER_WORKERS", 3):
+            job_collector._prefetch_details(["u1", "u2", "u3"], _fetch)
+        self.assertEqual(sorted(seen), ["u1", "u2", "u3"])
+
+    def test_validate_links_bulk_checks_cache_misses_once(self) -> None:
+        checked = []
+
+        def _fake_validate(url):
+            checked.append(url)
+            return url.endswith("/ok")
+
+        with mock.patch.object(job_collector, "_validate_single", _fake_validate), mock.patch.dict(
+            job_collector.AGGREGATOR_LINK_CACHE, {"https://agg.example/cached": False}, clear=True
+        ):
+            results = _validate_links_bulk(
+                ["https://agg.example/ok", "https://agg.example/bad", "https://agg.example/ok", "https://agg.example/cached", ""]
+            )
+            self.assertEqual(
+                results,
+                {"https://agg.example/ok": True, "https://agg.example/bad": False, "https://agg.example/cached": False},
+            )
+            self.assertFalse(job_collector.AGGREGATOR_LINK_CACHE["https://agg.example/bad"])
+        self.assertEqual(sorted(checked), ["https://agg.example/bad", "https://agg.example/ok"])
 
     def test_prune_empty_cache(self) -> None:
         now = 10000.0
@@ -50,6 +438,244 @@ class TestJobCollectorUtils(unittest.TestCase):
         self.assertIn("keep", pruned)
         self.assertNotIn("drop", pruned)
 
+    def test_cache_db_persists_deltas_and_prunes_by_ttl(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            legacy = Path(tmp) / "empty.json"
+            legacy.write_text(
+                '{"a|x|y|25": 1800.0, "old|x|y|25": 10.0, "bad": 1900.0}', encoding="utf-8"
+            )
+            db_path = Path(tmp) / "cache" / "collector.sqlite"
+            conn = job_collector._open_cache_db(db_path)
+            try:
+                job_collector._import_legacy_empty_search_cache(conn, legacy)
+                job_collector._save_empty_search_cache(conn, {("b", "x", "y", 25): 1500.0})
+                self.assertEqual(
+                    job_collector._load_empty_search_cache(conn, 3600.0, 5000.0),
+                    {("a", "x", "y", 25): 1800.0, ("b", "x", "y", 25): 1500.0},
+                )
+                self.assertEqual(
+                    conn.execute("PRAGMA journal_mode").fetchone()[0].lower(), "wal"
+                )
+                job_collector._save_aggregator_link_cache(
+                    conn, {"https://agg.example/ok": True, "https://agg.example/gone": False}, 100.0
+                )
+                job_collector._save_aggregator_link_cache(conn, {"https://agg.example/ok": False}, 5000.0)
+                self.assertEqual(
+                    job_collector._load_aggregator_link_cache(conn, 3600.0, 3000.0),
+                    {"https://agg.example/ok": True, "https://agg.example/gone": False},
+                )
+                self.assertEqual(job_collector._load_aggregator_link_cache(conn, 3600.0, 9000.0), {})
+            finally:
+                conn.close()
+
+    def test_cache_saves_run_in_one_explicit_transaction(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            conn = job_collector._open_cache_db(Path(tmp) / "collector.sqlite")
+            self.assertIsNotNone(conn)
+            statements = []
+            conn.set_trace_callback(statements.append)
+            try:
+                job_collector._save_empty_search_cache(
+                    conn, {("a", "q", "zuerich", 25): 1.0, ("b", "q", "zuerich", 25): 2.0}
+                )
+                job_collector._save_aggregator_link_cache(conn, {"https://x.ch/1": True}, 3.0)
+                job_collector._save_transit_cache(
+                    conn, {("A", "B", "20240101", "08:00"): 30}, 4.0
+                )
+                job_collector._save_details_blocklist_cache(
+                    conn, "digest", {"https://x.ch/1": True, "https://x.ch/3": False}, 5.0
+                )
+                job_collector._save_details_contact_cache(
+                    conn, {"https://x.ch/1": ("a@x.ch", "Anna")}, 5.0
+                )
+                kinds = [s.split()[0] for s in statements]
+                self.assertEqual(
+                    kinds,
+                    ["BEGIN", "INSERT", "INSERT", "COMMIT"] + ["BEGIN", "INSERT", "COMMIT"] * 2
+                    + ["BEGIN", "INSERT", "INSERT", "COMMIT"] + ["BEGIN", "INSERT", "COMMIT"],
+                )
+                statements.clear()
+                with self.assertRaises(sqlite3.IntegrityError):
+                    job_collector._executemany_atomic(
+                        conn,
+                        "INSERT INTO aggregator_links (url, ok, ts) VALUES (?, ?, ?)",
+                        [("https://x.ch/2", 1, 5.0), ("https://x.ch/2", 1, 5.0)],
+                    )
+                self.assertEqual(statements[-1], "ROLLBACK")
+                self.assertFalse(conn.in_transaction)
+                self.assertIsNone(
+                    conn.execute(
+                        "SELECT 1 FROM aggregator_links WHERE url = 'https://x.ch/2'"
+                    ).fetchone()
+                )
+            finally:
+                conn.close()
+
+    def test_transit_cache_roundtrip_skips_failed_lookups(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            conn = job_collector._open_cache_db(Path(tmp) / "collector.sqlite")
+            try:
+                key = ("Buelach", "Zuerich", "", "08:00")
+                job_collector._save_transit_cache(
+                    conn, {key: 25, ("Buelach", "Nirgendwo", "", "08:00"): None}, 1000.0
+                )
+                self.assertEqual(job_collector._load_transit_cache(conn, 3600.0, 2000.0), {key: 25})
+                self.assertEqual(job_collector._load_transit_cache(conn, 3600.0, 9000.0), {})
+            finally:
+                conn.close()
+
+    def test_details_cache_roundtrip_is_scoped_to_blocklist_terms(self) -> None:
+        digest = job_collector._terms_digest(frozenset({"senior", "french"}))
+        self.assertEqual(digest, job_collector._terms_digest({"french", "senior"}))
+        self.assertNotEqual(digest, job_collector._terms_digest({"french"}))
+        with tempfile.TemporaryDirectory() as tmp:
+            conn = job_collector._open_cache_db(Path(tmp) / "collector.sqlite")
+            try:
+                job_collector._save_details_blocklist_cache(
+                    conn, digest, {"https://x.ch/1": True, "https://x.ch/2": False}, 1000.0
+                )
+                self.assertEqual(
+                    job_collector._load_details_blocklist_cache(conn, digest, 3600.0, 2000.0),
+                    {"https://x.ch/1": True, "https://x.ch/2": False},
+                )
+                self.assertEqual(
+                    job_collector._load_details_blocklist_cache(conn, "other", 3600.0, 2000.0), {}
+                )
+                job_collector._save_details_contact_cache(
+                    conn, {"https://x.ch/1": ("jobs@x.ch", "Anna Muster")}, 1000.0
+                )
+                self.assertEqual(
+                    job_collector._load_details_contact_cache(conn, 3600.0, 2000.0),
+                    {"https://x.ch/1": ("jobs@x.ch", "Anna Muster")},
+                )
+                self.assertEqual(job_collector._load_details_contact_cache(conn, 3600.0, 9000.0), {})
+            finally:
+                conn.close()
+
+    def test_collect_indeed_reads_cards_in_one_script_call(self) -> None:
+        class _Driver:
+            page_source = ""
+
+            def __init__(self):
+                self.script_args = []
+
+            def get(self, url):
+                pass
+
+            def execute_script(self, script, *args):
+                self.script_args.append(args)
+                return [
+                    {"title": "IT Support", "text": "IT Support\nMuster AG", "company": " Muster AG ",
+                     "location": "Zuerich", "link": "https://ch.indeed.com/viewjob?jk=1"},
+                    {"title": None, "text": " Helpdesk ", "company": "", "location": "", "link": ""},
+                ]
+
+            def find_elements(self, *args):
+                raise AssertionError("find_elements should not be used")
+
+        driver = _Driver()
+        with mock.patch.object(job_collector, "WebDriverWait"):
+            jobs = job_collector._collect_indeed(driver, "https://ch.indeed.com/jobs?q=it", 10)
+        self.assertEqual(driver.script_args, [(10,)])
+        self.assertEqual([j.title for j in jobs], ["IT Support", "Helpdesk"])
+        self.assertEqual(jobs[0].company, "Muster AG")
+        self.assertEqual(jobs[0].source, "indeed")
+
+    def test_collect_indeed_skips_blocked_page_without_reading_cards(self) -> None:
+        class _Driver:
+            def __init__(self, found):
+                self.found = found
+
+            def get(self, url):
+                pass
+
+            def find_elements(self, by, selector):
+                return [object()] if selector == self.found else []
+
+            def execute_script(self, script, *args):
+                raise AssertionError("cards should not be read")
+
+        blocked = _Driver(job_collector.INDEED_BLOCK_SELECTOR)
+        ready = _Driver(job_collector.INDEED_READY_SELECTOR)
+        self.assertEqual(job_collector._indeed_wait_state(blocked), "blocked")
+        self.assertEqual(job_collector._indeed_wait_state(ready), "ready")
+        self.assertFalse(job_collector._indeed_wait_state(_Driver("")))
+        with mock.patch.object(job_collector, "_get_html"):
+            self.assertEqual(job_collector._collect_indeed(blocked, "https://ch.indeed.com/jobs"), [])
+
+    def test_indeed_wait_disables_implicit_wait_while_polling(self) -> None:
+        class _Timeouts:
+            def __init__(self, driver):
+                self.driver = driver
+
+            @property
+            def implicit_wait(self):
+                return self.driver.implicit
+
+        class _Driver:
+            # Leeres find_elements kostet (simuliert) die volle Implicit-Wait-Zeit.
+            def __init__(self, found):
+                self.found = found
+                self.implicit = 5
+                self.waited = 0.0
+                self.timeouts = _Timeouts(self)
+
+            def implicitly_wait(self, seconds):
+                self.implicit = seconds
+
+            def find_elements(self, by, selector):
+                if selector == self.found:
+                    return [object()]
+                self.waited += self.implicit
+                return []
+
+        ready = _Driver(job_collector.INDEED_READY_SELECTOR)
+        self.assertEqual(job_collector._wait_indeed_state(ready), "ready")
+        self.assertEqual(ready.waited, 0)
+        self.assertEqual(ready.implicit, 5)
+
+        blocked = _Driver(job_collector.INDEED_BLOCK_SELECTOR)
+        self.assertEqual(job_collector._wait_indeed_state(blocked), "blocked")
+        self.assertEqual(blocked.waited, 0)
+        self.assertEqual(blocked.implicit, 5)
+
+        empty = _Driver("")
+        with mock.patch.object(job_collector, "INDEED_WAIT_SECONDS", 0.3):
+            self.assertIsNone(job_collector._wait_indeed_state(empty))
+        self.assertEqual(empty.waited, 0)
+        self.assertEqual(empty.implicit, 5)
+
+    def test_extract_contact_name_checks_label_and_following_lines(self) -> None:
+        extract = job_collector._extract_contact_name
+        self.assertEqual(extract(["Intro", "KONTAKT: Anna Muster", "Peter Meier"]), "Anna Muster")
+        self.assertEqual(extract(["Ansprechpartnerin", "Tel 044 000 00 00", "Eva Frei"]), "Eva Frei")
+        self.assertEqual(
+            extract(["Kontakt: kontakt@x.ch", "info@x.ch", "x", "Contact", "Hans Meier"]), "Hans Meier"
+        )
+        self.assertEqual(extract(["Kontakt", "x", "y", "Anna Muster"]), "")
+        self.assertEqual(extract([]), "")
+
+    def test_mk_driver_reuses_resolved_chromedriver_path(self) -> None:
+        services = []
+
+        def _fake_chrome(service=None, options=None):
+            services.append(service)
+            if not service.path:
+                service.path = resolved
+            return mock.Mock()
+
+        with tempfile.NamedTemporaryFile() as tmp:
+            resolved = tmp.name
+            env = {k: v for k, v in os.environ.items() if k != "CHROMEDRIVER_PATH"}
+            with mock.patch.dict(os.environ, env, clear=True), mock.patch.object(
+                job_collector, "_CHROMEDRIVER_PATH", None
+            ), mock.patch.object(job_collector.webdriver, "Chrome", side_effect=_fake_chrome):
+                job_collector._mk_driver()
+                self.assertEqual(job_collector._CHROMEDRIVER_PATH, resolved)
+                self.assertEqual(os.environ.get("CHROMEDRIVER_PATH"), resolved)
+                job_collector._mk_driver()
+        self.assertEqual(services[1].path, resolved)
+
     def test_split_tasks_round_robin(self) -> None:
         tasks = [("a",), ("b",), ("c",), ("d",)]
         chunks = _split_tasks(tasks, 3)
@@ -184,5 +810,57 @@ class TestJobCollectorUtils(unittest.TestCase):
         )
 
 
+    def test_detail_payload_parses_jsonld_once(self) -> None:
+        html = (
+            '<script type="application/ld+json">{"@type": "JobPosting", "title": "IT Support",'
+            ' "description": "Windows Client", "jobLocation": {"address": {"addressLocality": "Kloten"}}}'
+            "</script><main>Layout</main>"
+        )
+        url = "https://firma.example/job/1"
+        real = job_collector._extract_jobposting_payload
+        with mock.patch.object(job_collector, "_fetch_capped_text", return_value=html), mock.patch.object(
+            job_collector, "_extract_jobposting_payload", side_effect=real
+        ) as payload, mock.patch.dict(job_collector.DETAILS_TEXT_CACHE, clear=True), mock.patch.dict(
+            job_collector.DETAILS_LOCATION_CACHE, clear=True
+        ):
+            normalized, location = job_collector._detail_page_payload(url, 1, 0)
+        self.assertEqual(payload.call_count, 1)
+        self.assertEqual(normalized, _normalize_text(_extract_relevant_detail_text(html)))
+        self.assertEqual(location, "Kloten")
+
+    def test_primary_html_text_same_with_and_without_lexbor(self) -> None:
+        html = (
+            "<html><head><style>.a{}</style></head><body><header>Italian</header>"
+            "<article><main>IT &amp; Support</main> Windows<br>Azure</article>"
+            "<script>var x = '<p>french</p>';</script><footer>French</footer></body></html>"
+        )
+        fast = _normalize_text(job_collector._extract_primary_html_text(html))
+        with mock.patch.object(job_collector, "_LexborHTMLParser", None):
+            slow = _normalize_text(job_collector._extract_primary_html_text(html))
+        self.assertEqual(fast, "it support windows azure")
+        self.assertEqual(fast, slow)
+
+    def test_env_csv_helpers(self) -> None:
+        env = {"X_LIST": " A , ,b ", "X_SRC": "", "X_OFF": "https://www.jobs.ch/, Indeed"}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(_env_csv("X_LIST"), ["A", "b"])
+            self.assertEqual(_env_csv("X_LIST", lower=True), ["a", "b"])
+            self.assertEqual(_env_csv("X_MISSING", "x,y"), ["x", "y"])
+            self.assertEqual(_env_csv("X_SRC", "x,y"), [])
+            self.assertEqual(_env_source_set("X_SRC", "jobup.ch"), {"jobup.ch"})
+            self.assertEqual(_env_source_set("X_OFF"), {"jobs.ch", "indeed"})
+
+    def test_blocklist_terms_are_frozen_and_remote_terms_cached(self) -> None:
+        terms = job_collector._normalize_terms({"Französisch", ""})
+        self.assertEqual(terms, frozenset({"franzoesisch"}))
+        self.assertIs(frozenset(terms), terms)
+        job = Job("", "IT Support (Home Office)", "A", "Zuerich", "", "jobs.ch")
+        with mock.patch.object(job_collector, "REMOTE_KEYWORDS", ["home office"]):
+            job_collector._remote_terms.cache_clear()
+            try:
+                self.assertTrue(job_collector._is_remote(job))
+            finally:
+                job_collector._remote_terms.cache_clear()
+
 if __name__ == "__main__":
     unittest.main()
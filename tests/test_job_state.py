@@ -1,12 +1,15 @@
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from bewerbungsagent.job_state import build_job_uid
+from bewerbungsagent import job_state
+from bewerbungsagent.job_state import build_job_uid, load_state, save_state
 
 
 class TestJobState(unittest.TestCase):
@@ -30,6 +33,47 @@ class TestJobState(unittest.TestCase):
         uid_b, _ = build_job_uid(job_b)
         self.assertNotEqual(uid_a, uid_b)
 
+    def test_normalize_text_strips_accents_and_punctuation(self) -> None:
+        self.assertEqual(job_state._normalize_text("  IT-Support (m/w) "), "it support m w")
+        self.assertEqual(job_state._normalize_text("Zürich\tGenève ①"), "zurich geneve 1")
+        self.assertEqual(job_state._normalize_text(""), "")
+        self.assertEqual(job_state._normalize_text("Müller–Straße Sàrl"), "muller stra e sarl")
+        self.assertIsNone(job_state._COMBINING_DROP[0x0308])
+        self.assertEqual(job_state._COMBINING_DROP[ord("ß")], ord("ß"))
+
+    def test_parse_ts_is_cached_and_tolerant(self) -> None:
+        job_state.parse_ts.cache_clear()
+        first = job_state.parse_ts("2024-05-01T08:00:00Z")
+        self.assertIs(job_state.parse_ts("2024-05-01T08:00:00Z"), first)
+        self.assertEqual(first.utcoffset().total_seconds(), 0)
+        self.assertIsNone(job_state.parse_ts("kein datum"))
+        self.assertIsNone(job_state.parse_ts(None))
+        self.assertEqual(job_state.parse_ts.cache_info().hits, 1)
+
+    def test_canonicalize_url_is_cached(self) -> None:
+        job_state.canonicalize_url.cache_clear()
+        for _ in range(3):
+            self.assertEqual(
+                job_state.canonicalize_url(" HTTPS://Jobs.CH/de/job/1/?utm=x#top "),
+                "https://jobs.ch/de/job/1",
+            )
+        self.assertEqual(job_state.canonicalize_url.cache_info().hits, 2)
+
+    def test_save_state_output_is_backend_independent(self) -> None:
+        state = {
+            "b2": {"title": "Systemtechniker Zürich", "commute_min": None, "score": 1.5},
+            "a1": {"title": "IT Support", "missing_runs": 0, "tags": []},
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            fast = Path(tmp) / "fast.json"
+            slow = Path(tmp) / "slow.json"
+            save_state(state, fast)
+            with mock.patch.object(job_state, "orjson", None):
+                save_state(state, slow)
+                self.assertEqual(load_state(fast, Path(tmp) / "none.json"), state)
+            self.assertEqual(fast.read_bytes(), slow.read_bytes())
+            self.assertEqual(load_state(slow, Path(tmp) / "none.json"), state)
+
 
 if __name__ == "__main__":
     unittest.main()
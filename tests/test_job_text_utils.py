@@ -6,7 +6,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from bewerbungsagent.job_text_utils import extract_from_multiline_title
+from bewerbungsagent.job_text_utils import _is_noise_line, extract_from_multiline_title
 
 
 class TestJobTextUtils(unittest.TestCase):
@@ -24,6 +24,19 @@ class TestJobTextUtils(unittest.TestCase):
         self.assertEqual(company, "Beispiel GmbH")
         self.assertEqual(location, "Winterthur")
 
+    def test_extract_strips_prefixes_on_every_line(self) -> None:
+        raw = '  01. [exact] "Helpdesk"\n\n02. [fuzzy]  Arbeitsort\n 03. [x] Kloten \nMuster AG\n4.\n[y] Rest'
+        title, company, location = extract_from_multiline_title(raw)
+        self.assertEqual(title, "Helpdesk")
+        self.assertEqual(company, "Muster AG")
+        self.assertEqual(location, "Kloten")
+
+    def test_noise_lines(self) -> None:
+        for line in ["", "Arbeitsort: Kloten", "REF: 4711", "ref 12", "Publiziert vor 3 Tagen", "Gestern"]:
+            self.assertTrue(_is_noise_line(line), line)
+        for line in ["IT Support", "Referent IT", "Muster AG", "Zuerich"]:
+            self.assertFalse(_is_noise_line(line), line)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,84 @@
+import csv
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from bewerbungsagent import job_tracker
+from bewerbungsagent.job_tracker import TRACKER_HEADERS, load_tracker, write_tracker
+
+
+class TestJobTracker(unittest.TestCase):
+    def test_csv_tracker_roundtrip_keeps_manual_columns(self) -> None:
+        state = {
+            "a1": {"status": "notified", "title": 'IT "Support"', "last_seen_at": "2024-01-02T00:00:00Z"},
+            "b2": {"status": "applied", "title": "Helpdesk, 1st Level", "last_seen_at": "2024-01-03T00:00:00Z"},
+        }
+        existing = {"a1": {"notes": "Anrufen\nMontag"}}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tracker.csv"
+            write_tracker(state, path, existing)
+            with path.open(newline="", encoding="utf-8") as f:
+                header = next(csv.reader(f))
+            rows = load_tracker(path)
+
+        self.assertEqual(header, TRACKER_HEADERS)
+        self.assertEqual(list(rows), ["b2", "a1"])
+        self.assertEqual(rows["a1"]["title"], 'IT "Support"')
+        self.assertEqual(rows["a1"]["notes"], "Anrufen\nMontag")
+        self.assertEqual(rows["b2"]["aktion"], "applied")
+
+    def test_build_tracker_rows_sorts_newest_first_and_keeps_ties_stable(self) -> None:
+        state = {
+            "old": {"status": "notified", "last_seen_at": "2024-01-01T00:00:00Z"},
+            "none1": {"status": "notified"},
+            "new": {"status": "notified", "last_seen_at": "2024-02-01T08:00:00+01:00"},
+            "none2": {"status": "notified", "last_seen_at": "kaputt"},
+            "closed": {"status": "closed", "last_seen_at": "2025-01-01T00:00:00Z"},
+        }
+        rows = job_tracker.build_tracker_rows(state)
+        self.assertEqual([r["job_uid"] for r in rows], ["new", "old", "none1", "none2"])
+
+    def test_build_tracker_rows_have_all_headers_in_order(self) -> None:
+        state = {"a1": {"status": "ignored", "canonical_url": "https://x.ch/1"}}
+        rows = job_tracker.build_tracker_rows(state, {"a1": {"notes": "zu weit"}})
+        self.assertEqual(list(rows[0]), TRACKER_HEADERS)
+        self.assertEqual(rows[0]["link"], "https://x.ch/1")
+        self.assertEqual(rows[0]["aktion"], "ignored")
+        self.assertEqual(rows[0]["erledigt"], job_tracker.CHECKBOX_DONE)
+        self.assertEqual(rows[0]["notes"], "zu weit")
+
+    def test_xlsx_tracker_roundtrip_with_openpyxl(self) -> None:
+        state = {"a1": {"status": "notified", "title": "IT Support", "score": 12}}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tracker.xlsx"
+            with mock.patch.object(job_tracker, "xlsxwriter", None), mock.patch.object(
+                job_tracker, "CalamineWorkbook", None
+            ):
+                write_tracker(state, path)
+                rows = load_tracker(path)
+        self.assertEqual(rows["a1"]["score"], "12")
+        self.assertEqual(rows["a1"]["erledigt"], job_tracker.CHECKBOX_EMPTY)
+
+    @unittest.skipIf(job_tracker.xlsxwriter is None, "xlsxwriter nicht installiert")
+    def test_xlsxwriter_output_reads_like_openpyxl_output(self) -> None:
+        state = {
+            f"u{i}": {"status": "applied" if i % 2 else "notified", "title": f"Job {i}", "score": i}
+            for i in range(5)
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            fast = Path(tmp) / "fast.xlsx"
+            slow = Path(tmp) / "slow.xlsx"
+            write_tracker(state, fast)
+            with mock.patch.object(job_tracker, "xlsxwriter", None):
+                write_tracker(state, slow)
+            self.assertEqual(load_tracker(fast), load_tracker(slow))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import logging
+import logging.handlers
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from bewerbungsagent import logger as logger_mod
+
+
+class TestLoggerSetup(unittest.TestCase):
+    def test_setup_is_idempotent_and_opens_log_file_once(self) -> None:
+        log = logging.getLogger(logger_mod._LOGGER_NAME)
+        before = list(log.handlers)
+        listener = logger_mod._listener
+        with mock.patch.object(logger_mod.os, "makedirs") as makedirs:
+            again = logger_mod.JobFinderLogger().get_logger()
+            logger_mod._setup_once()
+        makedirs.assert_not_called()
+        self.assertIs(again, logger_mod.job_logger)
+        self.assertEqual(log.handlers, before)
+        self.assertIs(logger_mod._listener, listener)
+
+    def test_records_are_written_by_queue_listener(self) -> None:
+        log = logging.getLogger(logger_mod._LOGGER_NAME)
+        self.assertEqual(
+            [type(h) for h in log.handlers], [logging.handlers.QueueHandler]
+        )
+        seen = []
+
+        class _Capture(logging.Handler):
+            def emit(self, record):
+                seen.append((record.funcName, record.getMessage()))
+
+        capture = _Capture()
+        listener = logger_mod._listener
+        listener.handlers = listener.handlers + (capture,)
+        try:
+            logger_mod.job_logger.warning("queued %s", 1)
+            listener.stop()
+            listener.start()
+        finally:
+            listener.handlers = tuple(h for h in listener.handlers if h is not capture)
+        self.assertIn(("test_records_are_written_by_queue_listener", "queued 1"), seen)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from bewerbungsagent import notifier_whatsapp
+
+
+class TestSendWhatsapp(unittest.TestCase):
+    def test_disabled_sends_nothing(self) -> None:
+        with mock.patch.object(notifier_whatsapp, "ENABLED", False), mock.patch.object(
+            notifier_whatsapp, "_SESSION"
+        ) as session:
+            self.assertFalse(notifier_whatsapp.send_whatsapp("Hallo"))
+        session.post.assert_not_called()
+
+    def test_incomplete_env_raises(self) -> None:
+        with mock.patch.object(notifier_whatsapp, "ENABLED", True), mock.patch.object(
+            notifier_whatsapp, "TO", ""
+        ):
+            with self.assertRaises(RuntimeError):
+                notifier_whatsapp.send_whatsapp("Hallo")
+
+    def test_posts_truncated_text_with_prebuilt_url_and_headers(self) -> None:
+        with mock.patch.multiple(
+            notifier_whatsapp, ENABLED=True, TOKEN="tok", PHONE_ID="123", TO="41790000000"
+        ), mock.patch.object(notifier_whatsapp, "_SESSION") as session:
+            self.assertTrue(notifier_whatsapp.send_whatsapp("x" * 5000))
+        post = session.post
+        args, kwargs = post.call_args
+        self.assertEqual(args[0], notifier_whatsapp._URL)
+        self.assertEqual(kwargs["timeout"], 15)
+        self.assertEqual(kwargs["json"]["to"], "41790000000")
+        self.assertEqual(len(kwargs["json"]["text"]["body"]), 4000)
+        post.return_value.raise_for_status.assert_called_once_with()
+
+    def test_session_carries_auth_header_and_retries_only_connects(self) -> None:
+        session = notifier_whatsapp._SESSION
+        self.assertEqual(
+            session.headers["Authorization"], notifier_whatsapp._HEADERS["Authorization"]
+        )
+        retry = session.get_adapter("https://graph.facebook.com").max_retries
+        self.assertEqual((retry.connect, retry.read, retry.status), (2, 0, 0))
+
+    def _mock_async_client(self, bodies):
+        # AsyncClient-Fabrik mit MockTransport (Header wie im Modul).
+        httpx = notifier_whatsapp.httpx
+        real_client = httpx.AsyncClient
+
+        def handler(request):
+            bodies.append(json.loads(request.content)["text"]["body"])
+            self.assertEqual(request.headers["Authorization"], "Bearer tok")
+            return httpx.Response(200, json={})
+
+        def factory(**kwargs):
+            kwargs.pop("http2", None)
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+        return mock.patch.object(httpx, "AsyncClient", side_effect=factory)
+
+    @unittest.skipIf(notifier_whatsapp.httpx is None, "httpx nicht installiert")
+    def test_async_sends_concurrently_over_one_client(self) -> None:
+        bodies = []
+
+        async def run():
+            try:
+                return await asyncio.gather(
+                    *(notifier_whatsapp.send_whatsapp_async(f"Job {i}") for i in range(3))
+                )
+            finally:
+                await notifier_whatsapp.aclose_async_client()
+
+        with mock.patch.multiple(
+            notifier_whatsapp,
+            ENABLED=True,
+            TOKEN="tok",
+            PHONE_ID="123",
+            TO="41790000000",
+            _HEADERS={"Authorization": "Bearer tok"},
+        ), self._mock_async_client(bodies) as factory:
+            results = asyncio.run(run())
+        self.assertEqual(results, [True, True, True])
+        self.assertEqual(factory.call_count, 1)
+        self.assertEqual(sorted(bodies), ["Job 0", "Job 1", "Job 2"])
+        self.assertIsNone(notifier_whatsapp._ASYNC_CLIENT)
+
+    @unittest.skipIf(notifier_whatsapp.httpx is None, "httpx nicht installiert")
+    def test_async_client_recreated_for_each_event_loop(self) -> None:
+        bodies = []
+        clients = []
+
+        async def send(text):
+            ok = await notifier_whatsapp.send_whatsapp_async(text)
+            clients.append(notifier_whatsapp._ASYNC_CLIENT)
+            return ok
+
+        with mock.patch.multiple(
+            notifier_whatsapp,
+            ENABLED=True,
+            TOKEN="tok",
+            PHONE_ID="123",
+            TO="41790000000",
+            _HEADERS={"Authorization": "Bearer tok"},
+            _ASYNC_CLIENT=None,
+            _ASYNC_CLIENT_LOOP=None,
+        ), self._mock_async_client(bodies):
+            self.assertTrue(asyncio.run(send("erste")))
+            self.assertTrue(asyncio.run(send("zweite")))
+        self.assertIsNot(clients[0], clients[1])
+        self.assertEqual(bodies, ["erste", "zweite"])
+
+if __name__ == "__main__":
+    unittest.main()